@@ -0,0 +1,97 @@
+"""
+AI LOD - 카메라/캐릭터와의 거리에 따라 몬스터 갱신 빈도를 낮춤
+- NEAR: 매 틱 갱신 (화면 안과 그 주변)
+- MID: MID_INTERVAL 틱마다 그동안 쌓인 delta_time으로 한 번 갱신
+- FAR: FAR_INTERVAL 틱마다 한 번, 애니메이션 프레임은 진행하지 않음
+  (상태 시간 제한/쿨다운은 timer_wheel이 처리하므로 갱신 빈도와 관계없이 제때 전이)
+- 한 번에 진행하는 시간은 MAX_STEP_DT까지 - 타일 충돌은 갱신 후 위치에서만 검사하므로 한 번에 크게 움직이면
+  얇은 충돌 타일을 건너뛸 수 있음 (기본 120Hz에서는 MID/FAR 간격이 모두 상한 안이라 잘리는 시간 없음)
+- 몬스터마다 생성 시 버킷 번호를 돌려가며 배정하고, (틱 + 버킷)이 간격으로 나누어떨어질 때만 갱신
+  -> 같은 등급 몬스터의 갱신이 여러 틱에 고르게 나뉘어 틱당 비용이 일정
+- 버킷이 없는 엔티티(캐릭터)는 항상 매 틱 갱신
+"""
+
+# LOD 등급
+NEAR = 0
+MID = 1
+FAR = 2
+
+# 등급 거리 (카메라 중심과 현재 캐릭터 중 가까운 쪽 기준, 픽셀)
+NEAR_RANGE = 600    # 화면 대각선 절반(약 500)보다 약간 넓게 - 화면 안 몬스터는 항상 NEAR
+MID_RANGE = 1400
+
+# 등급별 갱신 간격 (틱)
+MID_INTERVAL = 4
+FAR_INTERVAL = 8
+
+# 한 번에 진행하는 최대 시간 (초) - 가장 빠른 몬스터(250px/초)도 17.5px 이하로 움직여 가장 얇은 충돌 타일 띠(20px)를
+# 건너뛰지 못함. 120Hz(game_framework.sim_rate)에서 MID(4틱 = 0.033초)와 FAR(8틱 = 0.067초)는 모두 상한 안이라
+# 그대로 진행 - sim_rate를 낮추면(예: 60Hz의 FAR 0.133초) 넘는 만큼 잘려 그 등급 몬스터가 느려짐
+MAX_STEP_DT = 0.07
+
+tick = 0           # begin_step마다 증가
+next_bucket = 0    # 다음에 배정할 버킷 번호
+view_x, view_y = 0.0, 0.0       # 이번 틱의 카메라 중심
+player_x, player_y = 0.0, 0.0   # 이번 틱의 현재 캐릭터 위치
+
+def clear():
+    """틱/버킷 카운터 초기화 (scene 진입 시 호출)"""
+    global tick, next_bucket
+    tick = 0
+    next_bucket = 0
+
+def assign(entity):
+    """엔티티를 LOD 대상으로 등록 (버킷 번호를 차례로 배정)"""
+    global next_bucket
+    entity.ai_bucket = next_bucket
+    entity.ai_dt = 0.0
+    next_bucket += 1
+
+def begin_step(camera, player):
+    """틱 시작 시 호출 - 거리 기준점(카메라 중심, 현재 캐릭터) 갱신"""
+    global tick, view_x, view_y, player_x, player_y
+    tick += 1
+    view_x = camera.x + camera.canvas_width / 2
+    view_y = camera.y + camera.canvas_height / 2
+    player_x, player_y = player.x, player.y
+
+def classify(entity):
+    """엔티티의 LOD 등급"""
+    dx, dy = entity.x - view_x, entity.y - view_y
+    distance_sq = dx * dx + dy * dy
+    dx, dy = entity.x - player_x, entity.y - player_y
+    distance_sq = min(distance_sq, dx * dx + dy * dy)
+
+    if distance_sq < NEAR_RANGE * NEAR_RANGE:
+        return NEAR
+    if distance_sq < MID_RANGE * MID_RANGE:
+        return MID
+    return FAR
+
+def update(entity, delta_time):
+    """
+    LOD 등급에 맞춰 entity.update 호출
+
+    Returns:
+        bool: 이번 틱에 갱신했으면 True (False면 위치가 그대로이므로 충돌 처리 생략 가능)
+    """
+    if entity.ai_bucket is None:
+        entity.update(delta_time)
+        return True
+
+    tier = classify(entity)
+    entity.ai_dt += delta_time
+    if tier != NEAR:
+        interval = MID_INTERVAL if tier == MID else FAR_INTERVAL
+        if (tick + entity.ai_bucket) % interval:
+            return False
+
+    step_dt, entity.ai_dt = min(entity.ai_dt, MAX_STEP_DT), 0.0
+    if tier == FAR:
+        # 보이지 않는 거리 - 이동/상태 처리만 하고 애니메이션 프레임은 유지
+        frame = entity.frame
+        entity.update(step_dt)
+        entity.frame = frame
+    else:
+        entity.update(step_dt)
+    return True
@@ -0,0 +1,75 @@
+"""
+애니메이션 클립 - 스프라이트 시트의 프레임 구성을 데이터로 정의
+- 프레임 수, 초당 프레임, 재생 방식(LOOP/ONCE), 프레임 이벤트 구간을 클립 하나에 묶음
+- 프레임 소스 좌표는 생성 시 한 번 계산해 두고 draw에서는 표에서 꺼내기만 함
+- 클립은 엔티티 모듈에서 시트별로 한 번 만들고 같은 타입의 모든 인스턴스(상태 객체)가 공유
+- 프레임 이벤트: 이름 -> (시작 프레임, 끝 프레임), 예: 'hit' = 공격 판정 구간
+"""
+
+# 재생 방식
+LOOP = 'loop'  # 마지막 프레임 다음에 처음 프레임으로
+ONCE = 'once'  # 마지막 프레임에서 멈춤 (is_finished로 종료 확인)
+
+#----------------------------------------------------------------
+class AnimationClip:
+    """스프라이트 시트 한 줄(row)의 애니메이션"""
+    __slots__ = ('frame_count', 'fps', 'width', 'height', 'mode', 'events', 'sources')
+
+    def __init__(self, frame_count, fps, width, height, mode=LOOP, events=None, row=0):
+        """
+        frame_count: 프레임 수
+        fps: 초당 프레임
+        width, height: 프레임 한 장의 픽셀 크기
+        mode: LOOP 또는 ONCE
+        events: 프레임 이벤트 {이름: (시작 프레임, 끝 프레임)} - 양 끝 포함
+        row: 시트에서 사용할 줄 (아래에서부터)
+        """
+        self.frame_count = frame_count
+        self.fps = fps
+        self.width = width
+        self.height = height
+        self.mode = mode
+        self.events = dict(events) if events else {}
+        # 프레임별 소스 좌표 (left, bottom)
+        self.sources = tuple((index * width, row * height) for index in range(frame_count))
+
+    def advance(self, frame, delta_time):
+        """delta_time만큼 진행한 프레임 값 반환 (LOOP는 처음으로 돌아가고 ONCE는 frame_count에서 멈춤)"""
+        frame += self.fps * delta_time
+        if frame >= self.frame_count:
+            if self.mode == LOOP:
+                frame %= self.frame_count
+            else:
+                frame = self.frame_count
+        return frame
+
+    def frame_index(self, frame):
+        """그릴 프레임 번호 (ONCE가 끝난 뒤에는 마지막 프레임)"""
+        index = int(frame)
+        return index if index < self.frame_count else self.frame_count - 1
+
+    def is_finished(self, frame):
+        """ONCE 클립이 끝까지 재생되었는지"""
+        return self.mode == ONCE and frame >= self.frame_count
+
+    def in_event(self, name, frame):
+        """현재 프레임이 이벤트 구간 안인지 (없는 이벤트면 False)"""
+        window = self.events.get(name)
+        if window is None:
+            return False
+        return window[0] <= self.frame_index(frame) <= window[1]
+
+    def draw(self, image, entity, camera=None):
+        """entity 위치에 현재 프레임 그리기 (face_dir이 1이 아니면 좌우 반전)"""
+        if camera:
+            screen_x, screen_y = camera.apply(entity.x, entity.y)
+        else:
+            screen_x, screen_y = entity.x, entity.y
+
+        left, bottom = self.sources[self.frame_index(entity.frame)]
+        if entity.face_dir == 1:
+            image.clip_draw(left, bottom, self.width, self.height, screen_x, screen_y)
+        else:
+            image.clip_composite_draw(left, bottom, self.width, self.height, 0, 'h',
+                                      screen_x, screen_y, self.width, self.height)
+#----------------------------------------------------------------
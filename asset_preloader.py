@@ -0,0 +1,138 @@
+"""
+에셋 프리로더 - 타이틀 화면 동안 다음 scene의 이미지를 미리 로드
+- PNG 디코딩(IMG_Load -> SDL_Surface)은 작업 스레드에서 수행
+- 텍스처 생성(SDL_CreateTextureFromSurface)만 메인 스레드에서 프레임마다 시간 예산만큼 처리
+- 완성된 이미지는 resource_manager에 등록되어 이후 load_image()가 바로 반환
+- progress()로 진행률(0.0 ~ 1.0) 조회
+"""
+import threading
+import queue
+import time
+import pico2d
+import pico2d.pico2d as pico2d_core
+from sdl2 import SDL_CreateTextureFromSurface, SDL_FreeSurface
+from sdl2.sdlimage import IMG_Load
+import resource_manager
+
+# play_scene에서 사용하는 캐릭터/몬스터 스프라이트 시트
+ENTITY_SHEETS = [
+    'resource/Warrior_Idle.png',
+    'resource/Warrior_Run.png',
+    'resource/Warrior_Attack1.png',
+    'resource/Warrior_Attack2.png',
+    'resource/Child_Idle.png',
+    'resource/Child_Run.png',
+    'resource/Gnome_Idle.png',
+    'resource/Gnome_Run.png',
+    'resource/Gnome_Attack.png',
+    'resource/PaddleFish_Idle.png',
+    'resource/PaddleFish_Run.png',
+    'resource/PaddleFish_Attack.png',
+    'resource/Panda_Idle.png',
+    'resource/Panda_Run.png',
+    'resource/Panda_Attack.png',
+    'resource/Panda_Guard.png',
+]
+
+def play_scene_assets():
+    """play_scene 진입 시 로드되는 이미지 경로 목록 (타일 + 스프라이트 시트)"""
+    from tile import Tile
+
+    paths = []
+    for image_path in Tile.TILE_IMAGE_FILES.values():
+        if isinstance(image_path, list):
+            paths.extend(image_path)
+        else:
+            paths.append(image_path)
+    paths.extend(ENTITY_SHEETS)
+    return paths
+
+#----------------------------------------------------------------
+class AssetPreloader:
+    """작업 스레드 디코딩 + 메인 스레드 텍스처 생성 프리로더"""
+
+    def __init__(self, paths):
+        # 중복 제거 (순서 유지), 이미 로드된 이미지는 제외
+        self.paths = [path for path in dict.fromkeys(paths) if not resource_manager.is_preloaded(path)]
+        self.total = len(self.paths)
+        self.loaded_count = 0
+        self.failed = []
+
+        self.decoded = queue.Queue()  # (경로, SDL_Surface 포인터)
+        self.thread = None
+        self.cancelled = False
+
+    def start(self):
+        """작업 스레드에서 디코딩 시작 (headless 모드에서는 텍스처가 필요 없으므로 바로 완료 처리)"""
+        if resource_manager.headless or not self.paths:
+            self.loaded_count = self.total
+            return
+
+        self.thread = threading.Thread(target=self._decode_all, name='AssetPreloader', daemon=True)
+        self.thread.start()
+
+    def _decode_all(self):
+        """작업 스레드: PNG 파일을 SDL_Surface로 디코딩해 큐에 넣음"""
+        for path in self.paths:
+            if self.cancelled:
+                break
+            surface = IMG_Load(path.encode('UTF-8'))
+            self.decoded.put((path, surface))
+
+    def _upload(self, path, surface):
+        """메인 스레드: Surface로 텍스처를 만들고 resource_manager에 등록"""
+        if not surface:
+            print(f'프리로드 실패: {path}')
+            self.failed.append(path)
+        else:
+            texture = SDL_CreateTextureFromSurface(pico2d_core.renderer, surface)
+            SDL_FreeSurface(surface)
+            if texture:
+                resource_manager.register_preloaded(path, pico2d.Image(texture))
+            else:
+                self.failed.append(path)
+        self.loaded_count += 1
+
+    def pump(self, budget=0.004):
+        """
+        디코딩이 끝난 이미지를 시간 예산(초) 안에서 텍스처로 만듦
+        scene의 draw에서 프레임마다 한 번 호출 (update는 프레임당 여러 번 불릴 수 있음)
+        """
+        deadline = time.perf_counter() + budget
+        while self.loaded_count < self.total:
+            try:
+                path, surface = self.decoded.get_nowait()
+            except queue.Empty:
+                break
+            self._upload(path, surface)
+            if time.perf_counter() >= deadline:
+                break
+
+    def finish(self):
+        """남은 이미지를 모두 기다려서 처리 (scene 전환 직전 호출)"""
+        while not self.cancelled and self.loaded_count < self.total:
+            path, surface = self.decoded.get()
+            self._upload(path, surface)
+
+    def cancel(self):
+        """디코딩 중단 - 이미 디코딩된 Surface는 해제"""
+        self.cancelled = True
+        if self.thread:
+            self.thread.join()
+        while True:
+            try:
+                path, surface = self.decoded.get_nowait()
+            except queue.Empty:
+                break
+            if surface:
+                SDL_FreeSurface(surface)
+
+    def progress(self):
+        """진행률 (0.0 ~ 1.0)"""
+        if self.total == 0:
+            return 1.0
+        return self.loaded_count / self.total
+
+    def is_done(self):
+        return self.loaded_count >= self.total
+#----------------------------------------------------------------
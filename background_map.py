@@ -5,6 +5,7 @@
 - 실시간 충돌 블럭 에디팅 기능
 """
 from pico2d import *
+from resource_manager import load_image
 import json
 
 class CollisionBlock:
@@ -1,13 +1,15 @@
 from pico2d import *
+import game_framework
 #----------------------------------------------------------------
 class Camera:
     def __init__(self):
         self.x = 0
         self.y = 0
+        self.prev_x = 0  # 이전 시뮬레이션 스텝 위치 (렌더 보간용)
+        self.prev_y = 0
         self.target_x = 0
         self.target_y = 0
-        self.canvas_width = get_canvas_width()
-        self.canvas_height = get_canvas_height()
+        self.canvas_width, self.canvas_height = game_framework.get_canvas_size()
         self.lerp_speed = 5.0  # 초당 보간 속도
 
     def set_target(self, target_obj):
@@ -19,9 +21,25 @@ class Camera:
         # 또는 단순히: lerp_factor = speed * dt (작은 값일 때 근사)
         lerp_factor = 1.0 - pow(0.5, self.lerp_speed * delta_time)
 
+        self.prev_x, self.prev_y = self.x, self.y
+
         self.x += (self.target_x - self.x) * lerp_factor
         self.y += (self.target_y - self.y) * lerp_factor
 
     def apply(self, x, y):
         return x - self.x, y - self.y
 #----------------------------------------------------------------
+class CameraView:
+    """
+    그리기 전용 카메라 (Camera와 같은 x, y, canvas_width, canvas_height, apply)
+    보간 위치에 그릴 때 오브젝트나 카메라의 시뮬레이션 좌표를 바꾸지 않고 이 뷰의 위치만 옮김
+    """
+    __slots__ = ('x', 'y', 'canvas_width', 'canvas_height')
+
+    def __init__(self, camera):
+        self.x, self.y = camera.x, camera.y
+        self.canvas_width, self.canvas_height = camera.canvas_width, camera.canvas_height
+
+    def apply(self, x, y):
+        return x - self.x, y - self.y
+#----------------------------------------------------------------
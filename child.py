@@ -1,6 +1,8 @@
 from pico2d import *
 from event_check import *
 from state_machine import StateMachine
+from entity import Entity
+from animation import AnimationClip
 
 #----------------------------------------------------------------
 # 전역 설정 - 여기서 일괄 수정
@@ -20,126 +22,112 @@ MOVE_SPEED = 250  # 픽셀/초 (Warrior보다 약간 느림)
 MAX_HP = 100
 #----------------------------------------------------------------
 
+# 애니메이션 클립 (시트별로 한 번 만들어 모든 Child가 공유)
+IDLE_CLIP = AnimationClip(6, 8, PIXEL_WIDTH, PIXEL_HEIGHT)
+RUN_CLIP = AnimationClip(4, 8, PIXEL_WIDTH, PIXEL_HEIGHT)
+
 class CIdle:
-    def __init__(self, child):
-        self.child = child
-        self.animation_speed = 8  # 초당 프레임 수
+    def __init__(self):
+        self.clip = IDLE_CLIP
 
-    def enter(self, e):
-        self.child.frame = 0
-        self.child.dirx = 0
-        self.child.diry = 0
+    def enter(self, child, e):
+        child.frame = 0
+        child.dirx = 0
+        child.diry = 0
 
-    def exit(self, e):
+    def exit(self, child, e):
         pass
 
-    def do(self, delta_time):
-        self.child.frame = (self.child.frame + self.animation_speed * delta_time) % 6
+    def do(self, child, delta_time):
+        child.frame = self.clip.advance(child.frame, delta_time)
 
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.child.x, self.child.y)
-        else:
-            screen_x, screen_y = self.child.x, self.child.y
-
-        if self.child.face_dir == 1:
-            self.child.imageI.clip_draw(int(self.child.frame) * 192,0,192,192,screen_x,screen_y)
-        else:
-            self.child.imageI.clip_composite_draw(int(self.child.frame) * 192,0,192,192,0,'h',screen_x,screen_y,192,192)
+    def draw(self, child, camera=None):
+        self.clip.draw(child.imageI, child, camera)
 #----------------------------------------------------------------
 class CRun:
-    def __init__(self, child):
-        self.child = child
-        self.animation_speed = 8  # 초당 프레임 수
+    def __init__(self):
+        self.clip = RUN_CLIP
         self.move_speed = MOVE_SPEED  # 전역 설정에서 가져옴
 
-    def enter(self, e):
+    def enter(self, child, e):
         if left_down(e):
-            self.child.keys['left'] = True
+            child.keys['left'] = True
         elif left_up(e):
-            self.child.keys['left'] = False
+            child.keys['left'] = False
         elif right_down(e):
-            self.child.keys['right'] = True
+            child.keys['right'] = True
         elif right_up(e):
-            self.child.keys['right'] = False
+            child.keys['right'] = False
         elif up_down(e):
-            self.child.keys['up'] = True
+            child.keys['up'] = True
         elif up_up(e):
-            self.child.keys['up'] = False
+            child.keys['up'] = False
         elif down_down(e):
-            self.child.keys['down'] = True
+            child.keys['down'] = True
         elif down_up(e):
-            self.child.keys['down'] = False
+            child.keys['down'] = False
 
-    def exit(self, e):
+    def exit(self, child, e):
         pass
 
-    def do(self, delta_time):
-        self.child.frame = (self.child.frame + self.animation_speed * delta_time) % 4
+    def do(self, child, delta_time):
+        child.frame = self.clip.advance(child.frame, delta_time)
 
-        self.child.dirx = 0
-        self.child.diry = 0
+        child.dirx = 0
+        child.diry = 0
 
-        if self.child.keys['right']:
-            self.child.dirx += 1
-        if self.child.keys['left']:
-            self.child.dirx -= 1
-        if self.child.keys['up']:
-            self.child.diry += 1
-        if self.child.keys['down']:
-            self.child.diry -= 1
+        if child.keys['right']:
+            child.dirx += 1
+        if child.keys['left']:
+            child.dirx -= 1
+        if child.keys['up']:
+            child.diry += 1
+        if child.keys['down']:
+            child.diry -= 1
 
-        if self.child.dirx > 0:
-            self.child.face_dir = 1
-        elif self.child.dirx < 0:
-            self.child.face_dir = -1
+        if child.dirx > 0:
+            child.face_dir = 1
+        elif child.dirx < 0:
+            child.face_dir = -1
 
-        self.child.x += self.child.dirx * self.move_speed * delta_time
-        self.child.y += self.child.diry * self.move_speed * delta_time
+        child.x += child.dirx * self.move_speed * delta_time
+        child.y += child.diry * self.move_speed * delta_time
 
-        if not any(self.child.keys.values()):
-            self.child.state_machine.cur_state = self.child.IDLE
-            self.child.IDLE.enter(('STOP', 0))
+        if not any(child.keys.values()):
+            child.state_machine.set_state(child.IDLE, ('STOP', 0))
 
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.child.x, self.child.y)
-        else:
-            screen_x, screen_y = self.child.x, self.child.y
-
-        if self.child.face_dir == 1:
-            self.child.imageR.clip_draw(int(self.child.frame) * 192,0,192,192,screen_x,screen_y)
-        else:
-            self.child.imageR.clip_composite_draw(int(self.child.frame) * 192,0,192,192,0,'h',screen_x,screen_y,192,192)
+    def draw(self, child, camera=None):
+        self.clip.draw(child.imageR, child, camera)
 #----------------------------------------------------------------
-class Child:
+class Child(Entity):
+    # 공통 속성은 Entity, 여기에는 Child 전용 속성만 선언
+    __slots__ = ('keys', 'imageI', 'imageR')
+
+    # 스프라이트 시트 (모든 인스턴스가 resource_manager 캐시의 같은 텍스처를 공유)
+    IMAGE_FILES = {
+        'imageI': 'resource/Child_Idle.png',
+        'imageR': 'resource/Child_Run.png',
+    }
+
+    # 상태 객체 (상태 없는 싱글톤 - 모든 Child가 공유)
+    IDLE = CIdle()
+    RUN = CRun()
+
+    # 상태 전이 규칙 (타입당 하나, StateMachine이 한 번만 컴파일)
+    RULES = {
+        IDLE: {right_down: RUN, left_down: RUN, up_down: RUN, down_down: RUN},
+        RUN: {right_up: RUN, left_up: RUN, right_down: RUN, left_down: RUN,
+              up_up: RUN, down_up: RUN, up_down: RUN, down_down: RUN}
+    }
+
     def __init__(self):
-        self.x, self.y = 500, 300
-        self.frame = 0
-        self.dirx = 0
-        self.diry = 0
-        self.face_dir = 1
+        # 위치/방향/체력 (전역 설정에서 가져옴)
+        super().__init__(500, 300, MAX_HP)
         self.keys = {'left': False, 'right': False, 'up': False, 'down': False}
 
-        # 체력 (전역 설정에서 가져옴)
-        self.hp = MAX_HP
-        self.max_hp = MAX_HP
-
-        # 생존 상태
-        self.is_alive = True
-
-        self.imageI = load_image('resource/Child_Idle.png')
-        self.imageR = load_image('resource/Child_Run.png')
-
-        self.IDLE = CIdle(self)
-        self.RUN = CRun(self)
-        self.state_machine = StateMachine(
-            self.IDLE,
-            {
-                self.IDLE: {right_down: self.RUN, left_down: self.RUN, up_down: self.RUN, down_down: self.RUN},
-                self.RUN: {right_up: self.RUN, left_up: self.RUN, right_down: self.RUN, left_down: self.RUN,
-                           up_up: self.RUN, down_up: self.RUN, up_down: self.RUN, down_down: self.RUN}
-            })
+        self.load_images()  # IMAGE_FILES (캐시에서 공유)
+
+        self.state_machine = StateMachine(self.IDLE, self.RULES, owner=self)
     def update(self, delta_time):
         self.state_machine.update(delta_time)
         pass
@@ -0,0 +1,77 @@
+"""
+Draw 명령 기록기 - 일시정지된 scene의 화면을 다시 계산하지 않고 재생
+- scene의 draw를 한 번 실행하면서 pico2d 그리기 호출(Image 메소드, draw_rectangle)을 기록
+- 이후 프레임에서는 기록된 명령 목록만 그대로 다시 실행
+"""
+import sys
+import pico2d
+
+# 기록 대상 pico2d.Image 그리기 메소드
+IMAGE_DRAW_METHODS = (
+    'draw', 'draw_to_origin', 'rotate_draw', 'composite_draw',
+    'clip_draw', 'clip_composite_draw', 'clip_draw_to_origin',
+)
+
+#----------------------------------------------------------------
+class DrawRecording:
+    """기록된 그리기 명령 목록"""
+
+    def __init__(self):
+        self.commands = []  # (함수, 인자 튜플, 키워드 인자 딕셔너리)
+
+    def replay(self):
+        """기록된 명령을 순서대로 다시 실행"""
+        for func, args, kwargs in self.commands:
+            func(*args, **kwargs)
+
+    def __len__(self):
+        return len(self.commands)
+#----------------------------------------------------------------
+
+def _recording_wrapper(original, commands):
+    """원래 그리기 함수를 실행하면서 호출 내용을 commands에 추가하는 래퍼"""
+    def wrapper(*args, **kwargs):
+        commands.append((original, args, kwargs))
+        return original(*args, **kwargs)
+    return wrapper
+
+def record(draw_func, *args):
+    """
+    draw_func(*args)를 실행하면서 그리기 호출을 기록
+
+    실행 중에만 pico2d.Image의 그리기 메소드와 각 모듈에 import된
+    draw_rectangle을 기록용 래퍼로 바꾸고, 끝나면 원래대로 되돌린다.
+
+    Returns:
+        DrawRecording: 기록된 명령 목록
+    """
+    recording = DrawRecording()
+    commands = recording.commands
+
+    # Image 메소드 교체
+    image_class = pico2d.Image
+    original_methods = {}
+    for name in IMAGE_DRAW_METHODS:
+        original = getattr(image_class, name)
+        original_methods[name] = original
+        setattr(image_class, name, _recording_wrapper(original, commands))
+
+    # 'from pico2d import *'로 가져온 draw_rectangle 교체
+    original_rectangle = pico2d.draw_rectangle
+    rectangle_wrapper = _recording_wrapper(original_rectangle, commands)
+    patched_modules = []
+    for module in list(sys.modules.values()):
+        namespace = getattr(module, '__dict__', None)
+        if namespace is not None and namespace.get('draw_rectangle') is original_rectangle:
+            namespace['draw_rectangle'] = rectangle_wrapper
+            patched_modules.append(namespace)
+
+    try:
+        draw_func(*args)
+    finally:
+        for name, original in original_methods.items():
+            setattr(image_class, name, original)
+        for namespace in patched_modules:
+            namespace['draw_rectangle'] = original_rectangle
+
+    return recording
@@ -0,0 +1,81 @@
+"""
+엔티티 공통 기반 - 캐릭터(Warrior, Child)와 몬스터(Gnome, Paddlefish, Panda)가 공유하는 속성 배치
+- 공통 속성(위치, 이전 위치, 방향, 프레임, 체력, 생존 여부, 상태 머신, 전투 플래그)을 __slots__로 고정
+- 하위 클래스는 자기만 쓰는 속성을 __slots__로 추가 선언 (인스턴스 __dict__ 없음)
+- 예전에 필요할 때 hasattr로 확인하며 붙이던 속성(hit_targets 등)도 생성 시 모두 초기화
+- 스프라이트 시트는 IMAGE_FILES(속성 이름 -> 경로)로 선언하고 resource_manager 캐시에서 공유
+- 스포너 풀에서 재사용하는 몬스터는 respawn으로 초기화 (상태 머신은 시작 상태로, 타입별 상태 데이터는 하위 클래스의 reset_state)
+- 몬스터는 ai_lod 버킷(ai_bucket)과 건너뛴 시간(ai_dt)으로 거리별 갱신 빈도를 조절
+"""
+from resource_manager import load_image, release_image
+
+#----------------------------------------------------------------
+class Entity:
+    """월드 오브젝트 기반 클래스"""
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y', 'dirx', 'diry', 'face_dir', 'frame',
+                 'hp', 'max_hp', 'is_alive', 'attack_power',
+                 'state_machine', 'state_data', 'hit_targets', 'ai_bucket', 'ai_dt')
+
+    # 스프라이트 시트 (속성 이름 -> 이미지 경로), 하위 클래스에서 선언
+    IMAGE_FILES = {}
+
+    # 몬스터 여부 (몬스터끼리는 서로 공격하지 않음 - play_scene.check_attack_collisions)
+    IS_MONSTER = False
+
+    def __init__(self, x, y, max_hp, face_dir=1):
+        self.x, self.y = x, y
+        self.prev_x, self.prev_y = x, y  # 이전 시뮬레이션 스텝 위치 (렌더 보간용)
+        self.frame = 0
+        self.dirx = 0
+        self.diry = 0
+        self.face_dir = face_dir
+
+        # 체력 / 생존 상태
+        self.hp = max_hp
+        self.max_hp = max_hp
+        self.is_alive = True
+
+        # 전투
+        self.attack_power = 0
+        self.hit_targets = set()  # 이번 공격에서 이미 맞은 대상의 id (play_scene.check_attack_collisions)
+
+        # AI LOD (ai_lod.assign으로 등록된 몬스터만 버킷을 가짐, None이면 매 틱 갱신)
+        self.ai_bucket = None
+        self.ai_dt = 0.0  # 갱신을 건너뛴 틱들의 누적 시간
+
+        # 상태 머신 (하위 클래스가 state_data를 만든 뒤 생성)
+        self.state_machine = None
+        self.state_data = None
+
+    def load_images(self):
+        """IMAGE_FILES의 이미지를 캐시에서 가져와 속성에 설정 (같은 타입의 인스턴스는 텍스처 공유)"""
+        for name, path in self.IMAGE_FILES.items():
+            setattr(self, name, load_image(path))
+
+    def release_images(self):
+        """load_images로 얻은 이미지 참조 반환 (월드에서 제거될 때 호출)"""
+        for path in self.IMAGE_FILES.values():
+            release_image(path)
+
+    def respawn(self, x, y):
+        """오브젝트 풀에서 다시 꺼낼 때 새로 생성한 것처럼 초기화 (위치, 체력, 상태)"""
+        self.x, self.y = x, y
+        self.prev_x, self.prev_y = x, y
+        self.frame = 0
+        self.dirx = 0
+        self.diry = 0
+        self.face_dir = 1
+        self.hp = self.max_hp
+        self.is_alive = True
+        self.hit_targets.clear()
+        self.ai_dt = 0.0
+        self.reset_state()
+
+    def reset_state(self):
+        """상태 머신을 시작 상태로 (타입별 상태 데이터나 타이머가 있으면 하위 클래스에서 정리 후 호출)"""
+        self.state_machine.restart(('RESPAWN', 0))
+
+    def set_target_character(self, character):
+        """추적할 캐릭터 설정 (추적하지 않는 엔티티는 무시, 추적하는 몬스터에서 재정의)"""
+        pass
+#----------------------------------------------------------------
@@ -1,37 +1,63 @@
 from pico2d import *
 from sdl2 import *
 #----------------------------------------------------------------
+# 각 조건 함수에는 signature = (이벤트 종류, SDL 타입, 키) 속성을 붙인다.
+# StateMachine은 이 값으로 규칙 테이블을 딕셔너리로 컴파일해 한 번에 찾는다.
+# guard 속성이 있는 조건은 signature가 맞은 뒤 guard(owner, e)까지 통과해야 전이된다.
+def signature(kind, sdl_type=None, key=None):
+    """조건 함수에 디스패치 키를 붙이는 데코레이터"""
+    def decorate(check):
+        check.signature = (kind, sdl_type, key)
+        return check
+    return decorate
+
+@signature('INPUT', SDL_KEYDOWN, SDLK_RIGHT)
 def right_down(e):
     return e[0] == 'INPUT' and e[1].type ==  SDL_KEYDOWN and e[1].key == SDLK_RIGHT
 
+@signature('INPUT', SDL_KEYUP, SDLK_RIGHT)
 def right_up(e):
     return e[0] == 'INPUT' and e[1].type ==  SDL_KEYUP and e[1].key == SDLK_RIGHT
 
+@signature('INPUT', SDL_KEYDOWN, SDLK_LEFT)
 def left_down(e):
     return e[0] == 'INPUT' and e[1].type ==  SDL_KEYDOWN and e[1].key == SDLK_LEFT
 
+@signature('INPUT', SDL_KEYUP, SDLK_LEFT)
 def left_up(e):
     return e[0] == 'INPUT' and e[1].type ==  SDL_KEYUP and e[1].key == SDLK_LEFT
 
+@signature('INPUT', SDL_KEYDOWN, SDLK_UP)
 def up_down(e):
     return e[0] == 'INPUT' and e[1].type ==  SDL_KEYDOWN and e[1].key == SDLK_UP
 
+@signature('INPUT', SDL_KEYUP, SDLK_UP)
 def up_up(e):
     return e[0] == 'INPUT' and e[1].type ==  SDL_KEYUP and e[1].key == SDLK_UP
 
+@signature('INPUT', SDL_KEYDOWN, SDLK_DOWN)
 def down_down(e):
     return e[0] == 'INPUT' and e[1].type ==  SDL_KEYDOWN and e[1].key == SDLK_DOWN
 
+@signature('INPUT', SDL_KEYUP, SDLK_DOWN)
 def down_up(e):
     return e[0] == 'INPUT' and e[1].type ==  SDL_KEYUP and e[1].key == SDLK_DOWN
 
+@signature('ACTION_END')
 def action_end(e):
     return e[0] == 'ACTION_END'
 
+@signature('TIMEOUT')
+def timeout(e):
+    return e[0] == 'TIMEOUT'
+
+@signature('INPUT', SDL_KEYDOWN, SDLK_a)
 def a_down(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYDOWN and e[1].key == SDLK_a
 
-def a_down_combo(warrior):
-    def check(e):
-        return e[0] == 'INPUT' and e[1].type == SDL_KEYDOWN and e[1].key == SDLK_a and warrior.can_combo
-    return check
\ No newline at end of file
+@signature('INPUT', SDL_KEYDOWN, SDLK_a)
+def a_down_combo(e):
+    return e[0] == 'INPUT' and e[1].type == SDL_KEYDOWN and e[1].key == SDLK_a
+
+# 키 조건은 signature로, 콤보 가능 여부는 2차 조건(guard)으로 상태 머신 주인의 can_combo를 검사
+a_down_combo.guard = lambda owner, e: owner.can_combo
@@ -0,0 +1,81 @@
+"""
+이벤트 펌프 - 프레임 단위 입력 이벤트 정리
+- SDL 이벤트를 한 번만 해석해 작은 정규화 레코드(InputEvent)로 변환
+- 연속된 마우스 이동 이벤트는 마지막 것 하나로 합침
+- 현재 눌려 있는 키 집합을 관리 (is_key_held)
+"""
+from pico2d import SDL_KEYDOWN, SDL_KEYUP, SDL_MOUSEMOTION
+
+# 현재 눌려 있는 키 집합
+held_keys = set()
+
+# 통계 (합쳐진 이벤트 수)
+coalesced_count = 0
+
+#----------------------------------------------------------------
+class InputEvent:
+    """
+    정규화된 입력 이벤트
+    pico2d.Event와 같은 속성 이름(type, key, button, x, y)을 유지하므로
+    기존 handle_events/event_check 코드에 그대로 전달할 수 있다.
+    """
+    __slots__ = ('type', 'key', 'button', 'x', 'y')
+
+    def __init__(self, type, key=None, button=None, x=None, y=None):
+        self.type = type
+        self.key = key
+        self.button = button
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return f'InputEvent(type={self.type}, key={self.key}, button={self.button}, x={self.x}, y={self.y})'
+#----------------------------------------------------------------
+
+def normalize(event):
+    """pico2d.Event를 InputEvent로 변환"""
+    return InputEvent(event.type, event.key, event.button, event.x, event.y)
+
+def pump(raw_events):
+    """
+    한 프레임의 원시 이벤트 목록을 정리해 InputEvent 목록으로 반환
+
+    - 연속된 SDL_MOUSEMOTION은 마지막 위치 하나만 남김 (다른 이벤트 사이의 순서는 유지)
+    - 키 반복 입력은 pico2d.get_events에서 이미 걸러지므로 여기서는 따로 처리하지 않음
+    """
+    global coalesced_count
+
+    events = []
+    for raw in raw_events:
+        event_type = raw.type
+
+        if event_type == SDL_MOUSEMOTION:
+            if events and events[-1].type == SDL_MOUSEMOTION:
+                # 직전 이벤트도 마우스 이동이면 위치만 갱신
+                events[-1].x, events[-1].y = raw.x, raw.y
+                coalesced_count += 1
+                continue
+        elif event_type == SDL_KEYDOWN:
+            held_keys.add(raw.key)
+        elif event_type == SDL_KEYUP:
+            held_keys.discard(raw.key)
+
+        events.append(normalize(raw))
+
+    return events
+
+def is_key_held(key):
+    """키가 현재 눌려 있는지 반환"""
+    return key in held_keys
+
+def reset():
+    """눌린 키 상태 초기화"""
+    held_keys.clear()
+
+def track(events):
+    """이미 정규화된 이벤트(재생 등)로 눌린 키 상태만 갱신"""
+    for event in events:
+        if event.type == SDL_KEYDOWN:
+            held_keys.add(event.key)
+        elif event.type == SDL_KEYUP:
+            held_keys.discard(event.key)
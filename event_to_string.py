@@ -1,8 +1,13 @@
 #----------------------------------------------------------------
-def event_to_string(state_event):
-    """이벤트의 모든 상세 정보를 문자열로 반환 (모든 키 자동 처리)"""
+# 이름 테이블 (처음 호출될 때 한 번만 생성)
+event_names = None
+key_names = None
+
+def build_name_tables():
+    """SDL 이벤트 타입/키 코드 -> 이름 테이블 생성"""
     from pico2d import SDL_KEYDOWN, SDL_KEYUP, SDL_MOUSEMOTION, SDL_MOUSEBUTTONDOWN, SDL_MOUSEBUTTONUP
     import pico2d
+    global event_names, key_names
 
     event_names = {
         SDL_KEYDOWN: 'KEYDOWN',
@@ -12,11 +17,6 @@ def event_to_string(state_event):
         SDL_MOUSEBUTTONUP: 'MOUSEBUTTONUP'
     }
 
-    state_event_type = state_event[0]  # state_event is ('INPUT', event)
-    event = state_event[1]  # state_event is ('INPUT', event)
-    if state_event_type != 'INPUT':
-        return f"{state_event}"
-
     # pico2d 모듈에서 모든 SDLK_ 상수 자동 수집
     key_names = {}
     for name in dir(pico2d):
@@ -25,6 +25,18 @@ def event_to_string(state_event):
             key_name = name.replace('SDLK_', '')
             key_names[key_code] = key_name
 
+def event_to_string(state_event):
+    """이벤트의 모든 상세 정보를 문자열로 반환 (모든 키 자동 처리)"""
+    from pico2d import SDL_MOUSEMOTION, SDL_MOUSEBUTTONDOWN, SDL_MOUSEBUTTONUP
+
+    state_event_type = state_event[0]  # state_event is ('INPUT', event)
+    event = state_event[1]  # state_event is ('INPUT', event)
+    if state_event_type != 'INPUT':
+        return f"{state_event}"
+
+    if key_names is None:
+        build_name_tables()
+
     event_type = event_names.get(event.type, f'Unknown({event.type})')
     key_name = key_names.get(event.key, f'key({event.key})')
 
@@ -0,0 +1,160 @@
+"""
+플로 필드 길찾기 - 타일맵 위에서 캐릭터까지 가는 방향을 타일마다 미리 계산해 추적 몬스터가 공유
+- 캐릭터(목표)마다 필드 하나: 목표 타일에서 시작하는 Dijkstra (상하좌우 비용 10, 대각선 비용 14)
+- 목표 캐릭터가 다른 타일로 옮겼을 때만 다시 계산 (추적 몬스터 수와 관계없이 타일 변경당 한 번)
+- 필드는 타일마다 다음에 갈 타일 번호를 저장 -> 몬스터는 자기 타일의 값을 한 번 읽고 그 타일 중심으로 이동
+- 충돌 타일(일부만 막힌 가장자리 타일 포함)은 지나가지 않고, 대각선은 양옆 타일이 모두 열려 있을 때만 이동
+- 충돌 타일 안에 들어가 있는 몬스터는 목표에 가장 가까운 열린 이웃 타일로 빠져나옴
+"""
+import heapq
+import math
+from tile import Tile
+
+# 이웃 타일 (dx, dy, 비용)
+STRAIGHT_COST = 10
+DIAGONAL_COST = 14
+NEIGHBORS = ((1, 0, STRAIGHT_COST), (-1, 0, STRAIGHT_COST), (0, 1, STRAIGHT_COST), (0, -1, STRAIGHT_COST),
+             (1, 1, DIAGONAL_COST), (1, -1, DIAGONAL_COST), (-1, 1, DIAGONAL_COST), (-1, -1, DIAGONAL_COST))
+
+NO_TILE = -1  # 다음 타일 없음 (목표 타일이거나 갈 수 없는 타일)
+
+#----------------------------------------------------------------
+class FlowField:
+    """목표 타일 하나에 대한 플로 필드"""
+    __slots__ = ('goal', 'next_tile')
+
+    def __init__(self):
+        self.goal = NO_TILE     # 필드를 계산한 목표 타일 번호
+        self.next_tile = []     # 타일 번호 -> 목표로 가기 위해 다음에 갈 타일 번호 (NO_TILE이면 직선 추적)
+#----------------------------------------------------------------
+
+width = 0
+height = 0
+blocked = []     # 타일 번호(y * width + x) -> 지나갈 수 없는 타일인지
+links = []       # 타일 번호 -> 이동할 수 있는 이웃 ((이웃 타일 번호, 비용), ...)
+fields = {}      # 목표 캐릭터 -> FlowField
+build_count = 0  # 필드를 다시 계산한 횟수 (디버그용)
+
+def init(tilemap):
+    """타일맵의 충돌 타일 표시 및 타일 간 연결 계산 (scene 진입 시 타일맵 로드 후 호출)"""
+    global width, height, blocked, links, fields, build_count
+    width, height = tilemap.width, tilemap.height
+    blocked = [False] * (width * height)
+    for y in range(height):
+        for x in range(width):
+            tile = tilemap.get_tile(x, y)
+            if tile and tile.is_collidable():
+                blocked[y * width + x] = True
+
+    # 열린 타일 사이의 연결 (필드를 계산할 때마다 이웃 검사를 반복하지 않도록 미리 만들어 둠)
+    links = []
+    for index in range(width * height):
+        x, y = index % width, index // width
+        neighbors = []
+        for dx, dy, step_cost in NEIGHBORS:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            neighbor = ny * width + nx
+            if blocked[neighbor]:
+                continue
+            # 대각선은 모서리를 깎지 않도록 양옆 타일이 모두 열려 있어야 함
+            if dx and dy and (blocked[y * width + nx] or blocked[ny * width + x]):
+                continue
+            neighbors.append((neighbor, step_cost))
+        links.append(tuple(neighbors))
+
+    fields = {}
+    build_count = 0
+
+def clear():
+    """필드 제거 (scene 종료 시 호출)"""
+    global width, height, blocked, links, fields
+    width = height = 0
+    blocked = []
+    links = []
+    fields = {}
+
+def tile_index(x, y):
+    """월드 좌표가 속한 타일 번호 (맵 밖이면 NO_TILE)"""
+    grid_x = int(x // Tile.TILE_SIZE)
+    grid_y = int(y // Tile.TILE_SIZE)
+    if 0 <= grid_x < width and 0 <= grid_y < height:
+        return grid_y * width + grid_x
+    return NO_TILE
+
+def build(field, goal):
+    """goal 타일에서 시작하는 Dijkstra로 모든 타일의 다음 타일 계산"""
+    global build_count
+    build_count += 1
+    size = width * height
+    cost = [math.inf] * size
+    next_tile = [NO_TILE] * size
+    cost[goal] = 0
+    queue = [(0, goal)]
+
+    while queue:
+        current_cost, index = heapq.heappop(queue)
+        if current_cost > cost[index]:
+            continue
+        for neighbor, step_cost in links[index]:
+            new_cost = current_cost + step_cost
+            if new_cost < cost[neighbor]:
+                cost[neighbor] = new_cost
+                next_tile[neighbor] = index  # 이웃에서 목표로 가려면 현재 타일로
+                heapq.heappush(queue, (new_cost, neighbor))
+
+    # 충돌 타일 안에 있으면 목표에 가장 가까운 열린 이웃으로 빠져나옴
+    for index in range(size):
+        if not blocked[index] or index == goal:
+            continue
+        x, y = index % width, index // width
+        best_cost = math.inf
+        for dx, dy, step_cost in NEIGHBORS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                neighbor = ny * width + nx
+                if cost[neighbor] < best_cost:
+                    best_cost = cost[neighbor]
+                    next_tile[index] = neighbor
+
+    field.goal = goal
+    field.next_tile = next_tile
+
+def get_field(target):
+    """target 캐릭터의 플로 필드 (캐릭터가 다른 타일로 옮겼으면 다시 계산, 맵 밖이면 None)"""
+    goal = tile_index(target.x, target.y)
+    if goal == NO_TILE:
+        return None
+    field = fields.get(target)
+    if field is None:
+        field = fields[target] = FlowField()
+    if field.goal != goal:
+        build(field, goal)
+    return field
+
+def steer(entity, target):
+    """
+    entity가 target을 향해 이동할 방향 (단위 벡터)
+
+    Returns:
+        (dx, dy): 다음 타일 중심 방향
+        None: 목표 타일 또는 바로 옆 타일이거나 길이 없음 (호출한 쪽에서 직선 추적)
+    """
+    field = get_field(target)
+    if field is None:
+        return None
+    index = tile_index(entity.x, entity.y)
+    if index == NO_TILE:
+        return None
+    next_index = field.next_tile[index]
+    if next_index == NO_TILE or next_index == field.goal:
+        return None
+
+    # 다음 타일 중심 방향
+    dx = (next_index % width + 0.5) * Tile.TILE_SIZE - entity.x
+    dy = (next_index // width + 0.5) * Tile.TILE_SIZE - entity.y
+    distance = math.sqrt(dx * dx + dy * dy)
+    if distance == 0:
+        return None
+    return dx / distance, dy / distance
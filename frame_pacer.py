@@ -0,0 +1,96 @@
+"""
+프레임 페이서 - 마감 시각(deadline) 기반 프레임 속도 제어
+- time.perf_counter() 기준으로 다음 프레임 마감 시각을 계산
+- 남은 시간만큼만 대기 (고정 delay로 프레임 예산을 버리지 않음)
+- 마감 직전에는 sleep 대신 busy-wait(spin)으로 정밀도 확보
+- 목표 FPS 변경 및 무제한(벤치마크용) 모드 지원
+- 놓친 마감(missed deadline) 횟수 보고
+"""
+import time
+
+#----------------------------------------------------------------
+class FramePacer:
+    """마감 시각 기반 프레임 페이서"""
+
+    # sleep 정밀도가 부족한 구간 (이 시간 이하로 남으면 spin으로 대기)
+    DEFAULT_SPIN_THRESHOLD = 0.002
+
+    def __init__(self, target_fps=60, spin_threshold=DEFAULT_SPIN_THRESHOLD):
+        """
+        target_fps: 목표 FPS (None 또는 0이면 무제한)
+        spin_threshold: 마감 전 이 시간(초)부터는 spin으로 대기
+        """
+        self.spin_threshold = spin_threshold
+        self.frame_budget = 0.0
+        self.deadline = None
+
+        # 통계
+        self.frame_count = 0
+        self.missed_deadlines = 0
+        self.last_overrun = 0.0   # 마지막으로 놓친 마감의 초과 시간 (초)
+        self.worst_overrun = 0.0  # 가장 크게 놓친 마감의 초과 시간 (초)
+
+        self.set_target_fps(target_fps)
+
+    def set_target_fps(self, target_fps):
+        """목표 FPS 변경 (None 또는 0이면 무제한)"""
+        self.target_fps = target_fps
+        self.frame_budget = 1.0 / target_fps if target_fps else 0.0
+        self.deadline = None  # 다음 wait()에서 마감 시각 재설정
+
+    def is_uncapped(self):
+        """무제한 모드 여부"""
+        return self.frame_budget <= 0.0
+
+    def reset(self):
+        """마감 시각 초기화 (로딩 등으로 긴 공백이 생긴 뒤 호출)"""
+        self.deadline = None
+
+    def wait(self):
+        """
+        현재 프레임의 마감 시각까지 대기
+
+        이미 마감을 넘겼다면 대기하지 않고 놓친 마감으로 기록한 뒤,
+        밀린 프레임을 한꺼번에 몰아 처리하지 않도록 마감 시각을 현재로 재설정한다.
+
+        Returns:
+            bool: 마감을 지켰으면 True, 놓쳤으면 False
+        """
+        self.frame_count += 1
+
+        if self.is_uncapped():
+            return True
+
+        now = time.perf_counter()
+        if self.deadline is None:
+            self.deadline = now
+
+        self.deadline += self.frame_budget
+        remaining = self.deadline - now
+
+        if remaining < 0:
+            # 마감을 놓침 - 기준을 현재 시각으로 재설정
+            self.missed_deadlines += 1
+            self.last_overrun = -remaining
+            self.worst_overrun = max(self.worst_overrun, -remaining)
+            self.deadline = now
+            return False
+
+        # 1단계: 마감 직전까지는 sleep (CPU 양보)
+        if remaining > self.spin_threshold:
+            time.sleep(remaining - self.spin_threshold)
+
+        # 2단계: 남은 시간은 spin으로 정밀 대기
+        while time.perf_counter() < self.deadline:
+            pass
+
+        return True
+
+    def get_report(self):
+        """통계 문자열 반환"""
+        target = f'{self.target_fps} FPS' if not self.is_uncapped() else '무제한'
+        missed_ratio = self.missed_deadlines / self.frame_count * 100 if self.frame_count else 0.0
+        return (f'프레임 페이서 [{target}] 프레임: {self.frame_count}, '
+                f'놓친 마감: {self.missed_deadlines} ({missed_ratio:.1f}%), '
+                f'최대 초과: {self.worst_overrun * 1000:.2f}ms')
+#----------------------------------------------------------------
@@ -0,0 +1,156 @@
+"""
+프레임 프로파일러 - 프레임 단계별 시간 측정
+- 각 단계(이벤트, 업데이트, scene별 draw, present, 대기)를 perf_counter로 측정
+- 최근 N 프레임을 미리 할당된 링 버퍼에 보관 (프레임마다 할당 없음)
+- 단계별 p50/p95/p99 요약 및 화면 오버레이(막대 그래프)
+- CSV/JSON으로 버퍼 내보내기
+"""
+from pico2d import draw_rectangle
+from array import array
+import time
+import json
+
+#----------------------------------------------------------------
+class FrameProfiler:
+    """링 버퍼 기반 프레임 단계 프로파일러"""
+
+    PERCENTILES = (50, 95, 99)
+    SUMMARY_INTERVAL = 30  # 오버레이 요약을 다시 계산하는 주기 (프레임)
+
+    # 오버레이 막대 색상 (p50, p95, p99)
+    BAR_COLORS = ((80, 200, 80), (230, 200, 60), (230, 70, 70))
+
+    def __init__(self, capacity=600, budget=1.0 / 60):
+        """
+        capacity: 보관할 프레임 수
+        budget: 오버레이에서 막대 전체 길이로 표시할 프레임 예산 (초)
+        """
+        self.capacity = capacity
+        self.budget = budget
+        self.columns = {}     # 단계 이름 -> array('d') (초 단위)
+        self.total = array('d', [0.0]) * capacity
+        self.index = 0        # 다음에 기록할 위치
+        self.count = 0        # 기록된 프레임 수 (최대 capacity)
+
+        self._frame_start = 0.0
+        self._mark = 0.0
+        self._summary = {}
+        self._frames_since_summary = 0
+
+    def _column(self, phase):
+        """단계 열 반환 (처음 사용될 때 한 번만 할당)"""
+        column = self.columns.get(phase)
+        if column is None:
+            column = array('d', [0.0]) * self.capacity
+            self.columns[phase] = column
+        return column
+
+    def begin_frame(self):
+        """프레임 측정 시작"""
+        now = time.perf_counter()
+        self._frame_start = now
+        self._mark = now
+        for column in self.columns.values():
+            column[self.index] = 0.0
+
+    def mark(self, phase):
+        """직전 mark 이후 경과 시간을 해당 단계에 누적"""
+        now = time.perf_counter()
+        self._column(phase)[self.index] += now - self._mark
+        self._mark = now
+
+    def skip(self):
+        """직전 mark 이후 시간을 어느 단계에도 넣지 않고 버림"""
+        self._mark = time.perf_counter()
+
+    def end_frame(self):
+        """프레임 측정 종료 - 링 버퍼 위치 전진"""
+        self.total[self.index] = time.perf_counter() - self._frame_start
+        self.index = (self.index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        self._frames_since_summary += 1
+
+    def _ordered(self, column):
+        """링 버퍼 내용을 오래된 프레임부터 순서대로 반환"""
+        if self.count < self.capacity:
+            return column[:self.count]
+        return column[self.index:] + column[:self.index]
+
+    @staticmethod
+    def _percentile(sorted_values, p):
+        if not sorted_values:
+            return 0.0
+        k = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+        return sorted_values[k]
+
+    def summary(self):
+        """단계별 백분위 요약 (밀리초) 반환: {단계: {'p50': .., 'p95': .., 'p99': ..}}"""
+        result = {}
+        for phase, column in list(self.columns.items()) + [('total', self.total)]:
+            values = sorted(self._ordered(column))
+            result[phase] = {f'p{p}': self._percentile(values, p) * 1000 for p in self.PERCENTILES}
+        return result
+
+    def format_summary(self):
+        """요약 문자열 반환"""
+        lines = [f'프레임 프로파일 (최근 {self.count} 프레임, ms)']
+        for phase, stats in self.summary().items():
+            values = ', '.join(f'{name}={value:.2f}' for name, value in stats.items())
+            lines.append(f'  {phase:<24} {values}')
+        return '\n'.join(lines)
+
+    def dump_csv(self, path):
+        """버퍼를 CSV로 저장 (한 행 = 한 프레임, ms 단위)"""
+        phases = list(self.columns.keys())
+        ordered = [self._ordered(self.columns[phase]) for phase in phases]
+        totals = self._ordered(self.total)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('frame,' + ','.join(phases) + ',total\n')
+            for i in range(self.count):
+                row = [f'{column[i] * 1000:.4f}' for column in ordered]
+                f.write(f'{i},' + ','.join(row) + f',{totals[i] * 1000:.4f}\n')
+        print(f'프레임 프로파일 CSV 저장: {path} ({self.count} 프레임)')
+
+    def dump_json(self, path):
+        """버퍼와 요약을 JSON으로 저장 (ms 단위)"""
+        data = {
+            'frames': self.count,
+            'summary': self.summary(),
+            'phases': {phase: [v * 1000 for v in self._ordered(column)]
+                       for phase, column in self.columns.items()},
+            'total': [v * 1000 for v in self._ordered(self.total)],
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        print(f'프레임 프로파일 JSON 저장: {path} ({self.count} 프레임)')
+
+    def dump(self, path):
+        """확장자에 따라 CSV 또는 JSON으로 저장"""
+        if path.endswith('.json'):
+            self.dump_json(path)
+        else:
+            self.dump_csv(path)
+
+    def draw_overlay(self, x=10, y=10, width=300, bar_height=4):
+        """
+        화면 좌하단에 단계별 p50/p95/p99 막대 그래프 표시
+        막대 전체 길이 = 프레임 예산 (pico2d 폰트 없이 사각형만 사용)
+        """
+        if self._frames_since_summary >= self.SUMMARY_INTERVAL or not self._summary:
+            self._summary = self.summary()
+            self._frames_since_summary = 0
+
+        row_height = bar_height * len(self.PERCENTILES) + 4
+        scale = width / (self.budget * 1000)
+        for row, stats in enumerate(self._summary.values()):
+            row_y = y + row * row_height
+            for i, p in enumerate(self.PERCENTILES):
+                length = min(width, stats[f'p{p}'] * scale)
+                r, g, b = self.BAR_COLORS[i]
+                bar_y = row_y + i * bar_height
+                draw_rectangle(x, bar_y, x + length, bar_y + bar_height - 1, r, g, b, 255, True)
+
+        # 예산 기준선
+        draw_rectangle(x + width, y, x + width + 1, y + row_height * len(self._summary), 255, 255, 255, 255, True)
+#----------------------------------------------------------------
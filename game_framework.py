@@ -3,25 +3,95 @@
 """
 from pico2d import *
 import time
+import random
+import sys
+import importlib
+from frame_pacer import FramePacer
+from frame_profiler import FrameProfiler
+from hitch_detector import HitchDetector
+import draw_recorder
+import event_pump
+import resource_manager
+from tile import Tile
+from input_recorder import InputRecorder, InputReplay, new_seed
 
 # 전역 변수
 running = True
 stack = []
 delta_time = 0.0
-frame_time = 1.0 / 60  # 60 FPS
+target_fps = 60  # 목표 렌더링 FPS (None이면 무제한 - 벤치마크용)
+pacer = FramePacer(target_fps)
+
+# 고정 시간 간격(fixed timestep) 시뮬레이션 설정
+fixed_timestep = True      # False면 기존처럼 프레임 delta를 그대로 update에 전달
+sim_rate = 120             # 시뮬레이션 주기 (Hz)
+sim_dt = 1.0 / sim_rate    # 한 스텝의 시간 (초)
+max_catch_up_steps = 8     # 한 프레임에서 따라잡을 수 있는 최대 스텝 수 (초과분은 버림)
+accumulator = 0.0          # 아직 시뮬레이션하지 않은 누적 시간
+render_alpha = 1.0         # 렌더 보간 계수 (0.0 ~ 1.0), draw(alpha)로 전달됨
+sim_time = 0.0             # 누적 시뮬레이션 시간 (초) - 게임 로직은 time.time() 대신 이 값을 사용
+sim_tick = 0               # 누적 시뮬레이션 스텝 수
+
+# 입력 기록/재생 (start_recording / start_replay로 설정)
+recorder = None
+replay = None
+
+# scene 렌더링 최적화
+# - scene 모듈에 opaque = True가 있으면 그 아래 scene은 그리지 않음 (화면 전체를 덮는 scene)
+# - cache_when_paused = True인 scene은 일시정지된 동안 기록된 draw 명령을 재생
+frozen_frames = {}  # scene -> draw_recorder.DrawRecording
+
+# 프레임 프로파일러 (enable_profiler로 활성화, None이면 측정하지 않음)
+profiler = None
+profiler_overlay = False   # 화면에 단계별 p50/p95/p99 막대 표시 (F11로 토글)
+profiler_dump_path = None  # 종료 시 버퍼를 저장할 경로 (.csv 또는 .json), F12로 즉시 저장
+
+# 프레임 히치 감지기 (enable_hitch_detector로 활성화, None이면 감지하지 않음)
+hitch_detector = None
+
+# 시작 타임라인 (time-to-first-frame 측정)
+startup_origin = None   # 기준 시각 (perf_counter), begin_startup_timeline으로 지정
+startup_marks = []      # (이름, 기준 시각부터 경과 초)
+startup_done = False    # 첫 프레임 표시 후 True (이후 mark_startup은 무시)
+
+# headless 모드 (창 없이 시뮬레이션만 실행)
+headless = False
+HEADLESS_CANVAS_SIZE = (800, 600)  # headless 모드에서 카메라 등이 사용할 가상 캔버스 크기
+
+def resolve_scene(scene):
+    """
+    scene 모듈 반환 - 모듈 이름(문자열)이면 처음 필요할 때 import
+
+    scene 모듈끼리 서로 import하지 않고 이름으로 전환하면
+    게임 시작 시 모든 scene(과 그 안의 캐릭터/맵 모듈)을 미리 읽지 않아도 된다.
+    """
+    if not isinstance(scene, str):
+        return scene
+
+    module = sys.modules.get(scene)
+    if module is None:
+        import_start = time.perf_counter()
+        module = importlib.import_module(scene)
+        if not startup_done:
+            mark_startup(f'import:{scene}')
+        else:
+            print(f'scene 모듈 로드: {scene} ({(time.perf_counter() - import_start) * 1000:.1f}ms)')
+    return module
 
 def change_scene(scene):
-    """현재 scene을 새로운 scene으로 교체"""
+    """현재 scene을 새로운 scene으로 교체 (scene 모듈 또는 모듈 이름)"""
     global stack
+    scene = resolve_scene(scene)
     if stack:
         stack[-1].exit()
-        stack.pop()
+        frozen_frames.pop(stack.pop(), None)
     stack.append(scene)
     scene.enter()
 
 def push_scene(scene):
-    """현재 scene 위에 새로운 scene을 추가 (오버레이)"""
+    """현재 scene 위에 새로운 scene을 추가 (오버레이, scene 모듈 또는 모듈 이름)"""
     global stack
+    scene = resolve_scene(scene)
     if stack:
         stack[-1].pause()
     stack.append(scene)
@@ -32,63 +102,400 @@ def pop_scene():
     global stack
     if stack:
         stack[-1].exit()
-        stack.pop()
+        frozen_frames.pop(stack.pop(), None)
     if stack:
+        frozen_frames.pop(stack[-1], None)
         stack[-1].resume()
 
+def begin_startup_timeline(origin=None):
+    """시작 타임라인 기준 시각 지정 (main.py 최상단에서 잰 perf_counter 값)"""
+    global startup_origin
+    startup_origin = time.perf_counter() if origin is None else origin
+
+def mark_startup(label):
+    """시작 타임라인에 지점 기록"""
+    global startup_origin
+    if startup_done:
+        return
+    now = time.perf_counter()
+    if startup_origin is None:
+        startup_origin = now
+    startup_marks.append((label, now - startup_origin))
+
+def finish_startup_timeline():
+    """첫 프레임 표시 지점을 기록하고 타임라인 출력"""
+    global startup_done
+    if startup_done:
+        return
+    mark_startup('first_frame')
+    startup_done = True
+    print(format_startup_timeline())
+
+def format_startup_timeline():
+    """시작 타임라인 문자열 반환 (지점별 누적 시간과 구간 시간, ms)"""
+    lines = ['시작 타임라인 (ms)']
+    previous = 0.0
+    for label, elapsed in startup_marks:
+        lines.append(f'  {label:<24} {elapsed * 1000:8.1f}  (+{(elapsed - previous) * 1000:.1f})')
+        previous = elapsed
+    return '\n'.join(lines)
+
 def quit():
     """게임 종료"""
     global running
     running = False
 
+def find_draw_start():
+    """그리기를 시작할 scene 인덱스 반환 (가장 위에 있는 불투명 scene)"""
+    for i in range(len(stack) - 1, -1, -1):
+        if getattr(stack[i], 'opaque', False):
+            return i
+    return 0
+
+def draw_scene(scene, is_paused):
+    """scene 하나 그리기 - 일시정지된 캐시 대상 scene은 기록된 명령을 재생"""
+    if is_paused and getattr(scene, 'cache_when_paused', False):
+        recording = frozen_frames.get(scene)
+        if recording is None:
+            frozen_frames[scene] = draw_recorder.record(scene.draw, render_alpha)
+        else:
+            recording.replay()
+    else:
+        scene.draw(render_alpha)
+
+def get_canvas_size():
+    """캔버스 크기 반환 (headless 모드에서는 가상 캔버스 크기)"""
+    if headless:
+        return HEADLESS_CANVAS_SIZE
+    return get_canvas_width(), get_canvas_height()
+
+def enable_profiler(capacity=600, overlay=False, dump_path=None):
+    """프레임 단계별 프로파일링 시작"""
+    global profiler, profiler_overlay, profiler_dump_path
+    profiler = FrameProfiler(capacity, budget=1.0 / target_fps if target_fps else 1.0 / 60)
+    profiler_overlay = overlay
+    profiler_dump_path = dump_path
+    return profiler
+
+def dump_profile(path=None):
+    """프로파일 버퍼를 파일로 저장 (경로 생략 시 profiler_dump_path 사용)"""
+    path = path or profiler_dump_path or 'frame_profile.csv'
+    if profiler:
+        profiler.dump(path)
+        print(profiler.format_summary())
+
+def enable_hitch_detector(threshold=1.0 / 30, report_path='hitch_report.txt', sample_interval=0.001):
+    """임계값(초)을 넘는 프레임의 스택 샘플 요약을 report_path에 기록"""
+    global hitch_detector
+    hitch_detector = HitchDetector(threshold, report_path, sample_interval)
+    return hitch_detector
+
+def start_recording(path, seed=None):
+    """입력 기록 시작 - random 시드를 고정하고 프레임마다 delta와 이벤트를 기록"""
+    global recorder
+    if seed is None:
+        seed = new_seed()
+    random.seed(seed)
+    recorder = InputRecorder(path, seed)
+    print(f'입력 기록 시작: {path} (시드 {seed})')
+
+def start_replay(path):
+    """입력 재생 시작 - 기록된 시드로 random을 고정하고 get_events() 대신 기록을 공급"""
+    global replay
+    replay = InputReplay(path)
+    random.seed(replay.seed)
+    print(f'입력 재생 시작: {path} (시드 {replay.seed})')
+
+def stop_input_capture():
+    """입력 기록/재생 종료"""
+    global recorder, replay
+    if recorder:
+        recorder.close()
+        recorder = None
+    replay = None
+
+def set_target_fps(fps):
+    """목표 렌더링 FPS 변경 (None 또는 0이면 무제한)"""
+    global target_fps
+    target_fps = fps
+    pacer.set_target_fps(fps)
+
+def set_sim_rate(rate):
+    """시뮬레이션 주기(Hz) 변경"""
+    global sim_rate, sim_dt
+    sim_rate = rate
+    sim_dt = 1.0 / rate
+
+def update_top_scene(dt):
+    """가장 위 scene을 dt만큼 업데이트하고 시뮬레이션 시간 전진"""
+    global sim_time, sim_tick
+    if stack:
+        stack[-1].update(dt)
+    sim_time += dt
+    sim_tick += 1
+
+def step_simulation(frame_delta):
+    """
+    누적기(accumulator) 기반 고정 스텝 업데이트
+
+    프레임 delta를 누적해 sim_dt 단위로 잘라 update를 호출한다.
+    로딩 직후처럼 긴 프레임이 와도 최대 max_catch_up_steps 스텝만 실행하고
+    나머지 시간은 버리므로, 한 프레임의 시뮬레이션 비용이 제한된다.
+
+    Returns:
+        int: 이번 프레임에 실행한 스텝 수
+    """
+    global accumulator, render_alpha
+
+    if not fixed_timestep:
+        update_top_scene(frame_delta)
+        render_alpha = 1.0
+        return 1
+
+    accumulator += frame_delta
+    steps = 0
+    while accumulator >= sim_dt and steps < max_catch_up_steps:
+        update_top_scene(sim_dt)
+        accumulator -= sim_dt
+        steps += 1
+
+    # 따라잡기 한도를 넘긴 시간은 버림 (나선형 지연 방지)
+    if accumulator >= sim_dt:
+        accumulator %= sim_dt
+
+    render_alpha = accumulator / sim_dt
+    return steps
+
 def run(start_scene):
-    """게임 메인 루프 실행"""
-    global running, stack, delta_time
+    """게임 메인 루프 실행 (start_scene: scene 모듈 또는 모듈 이름)"""
+    global running, stack, delta_time, accumulator, sim_time, sim_tick, profiler_overlay
 
     open_canvas()
+    mark_startup('canvas_open')
 
     # 시작 scene 설정
+    start_scene = resolve_scene(start_scene)
+    sim_time = 0.0
+    sim_tick = 0
     stack = [start_scene]
     start_scene.enter()
+    mark_startup('scene_enter')
 
-    previous_time = time.time()
+    previous_time = time.perf_counter()
+    accumulator = 0.0
+    pacer.reset()
+    if hitch_detector:
+        hitch_detector.start()
 
     while running:
         # Delta time 계산
-        current_time = time.time()
+        current_time = time.perf_counter()
         delta_time = current_time - previous_time
         previous_time = current_time
 
-        # 이벤트 처리
-        events = get_events()
+        if profiler:
+            profiler.begin_frame()
+        if hitch_detector:
+            hitch_detector.begin_frame()
+
+        # 이벤트 처리 (프레임 단위로 합치고 정규화한 뒤 전달)
+        if replay:
+            # 재생 중: 기록된 delta와 이벤트 사용 (창 닫기만 실제 이벤트로 처리)
+            frame = replay.next_frame()
+            if frame is None:
+                print(f'입력 재생 완료: {replay.frame_count} 프레임')
+                break
+            delta_time, events = frame
+            event_pump.track(events)
+            for raw in get_events():
+                if raw.type == SDL_QUIT:
+                    running = False
+        else:
+            events = event_pump.pump(get_events())
+            if recorder:
+                recorder.record_frame(delta_time, events)
+
         for event in events:
             if event.type == SDL_QUIT:
                 running = False
             elif event.type == SDL_KEYDOWN and event.key == SDLK_ESCAPE:
                 # ESC 키 처리는 각 scene에서 결정
                 pass
+            elif profiler and event.type == SDL_KEYDOWN and event.key == SDLK_F11:
+                profiler_overlay = not profiler_overlay
+            elif profiler and event.type == SDL_KEYDOWN and event.key == SDLK_F12:
+                dump_profile()
 
             # 현재 scene에 이벤트 전달
             if stack:
                 stack[-1].handle_events(event)
 
-        # 업데이트
-        if stack:
-            stack[-1].update(delta_time)
+        if profiler:
+            profiler.mark('events')
+
+        # 업데이트 (고정 스텝)
+        step_simulation(delta_time)
+
+        if profiler:
+            profiler.mark('update')
 
         # 렌더링
         clear_canvas()
 
-        # 모든 scene을 렌더링 (아래부터 위로)
-        for scene in stack:
-            scene.draw()
+        if profiler:
+            profiler.mark('clear')
+
+        # 보이는 scene만 렌더링 (가장 위의 불투명 scene부터 위로)
+        top = len(stack) - 1
+        for i in range(find_draw_start(), len(stack)):
+            scene = stack[i]
+            draw_scene(scene, i < top)
+            if profiler:
+                profiler.mark(f'draw:{scene.__name__}')
+
+        if profiler and profiler_overlay:
+            profiler.draw_overlay()
+            profiler.mark('overlay')
 
         update_canvas()
-        delay(frame_time)
+
+        if not startup_done:
+            finish_startup_timeline()
+
+        if profiler:
+            profiler.mark('present')
+
+        # 프레임 작업 시간 검사 (대기 시간은 제외)
+        if hitch_detector:
+            hitch_detector.end_frame()
+
+        # 남은 프레임 예산만큼만 대기
+        pacer.wait()
+
+        if profiler:
+            profiler.mark('wait')
+            profiler.end_frame()
 
     # 종료 처리
     while stack:
         stack[-1].exit()
         stack.pop()
+    frozen_frames.clear()
+    stop_input_capture()
+    if hitch_detector:
+        hitch_detector.stop()
 
     close_canvas()
+
+    print(pacer.get_report())
+    if profiler and profiler_dump_path:
+        dump_profile(profiler_dump_path)
+
+def run_headless(start_scene, ticks=None, seconds=None, replay_path=None, seed=None):
+    """
+    창 없이 scene 스택을 최대 속도로 실행 (soak 테스트/빌드 서버용)
+
+    open_canvas()를 호출하지 않고, 이미지 로딩은 HeadlessImage로 대체되며
+    draw는 건너뛴다. update는 sim_dt 고정 스텝으로 호출된다.
+    replay_path가 있으면 기록된 입력과 delta를 기록이 끝날 때까지 재생한다.
+    종료 후에는 HeadlessImage를 캐시와 타일 이미지에서 모두 버려, 같은 프로세스의 run()이 새로 로드한다.
+
+    Args:
+        start_scene: 시작 scene 모듈 또는 모듈 이름
+        ticks: 실행할 시뮬레이션 스텝 수
+        seconds: 실행할 시뮬레이션 시간 (초) - ticks가 없을 때 사용
+        replay_path: 재생할 입력 기록 파일 (지정 시 ticks/seconds 무시)
+        seed: random 시드 (재생 시에는 기록된 시드 사용)
+
+    Returns:
+        dict: 틱 처리량 통계
+    """
+    global running, stack, delta_time, headless, accumulator, sim_time, sim_tick
+
+    replay_source = None
+    if replay_path:
+        replay_source = InputReplay(replay_path)
+        seed = replay_source.seed
+    elif ticks is None:
+        if seconds is None:
+            raise ValueError('ticks 또는 seconds 중 하나는 지정해야 합니다.')
+        ticks = int(seconds / sim_dt)
+
+    if seed is not None:
+        random.seed(seed)
+
+    headless = True
+    resource_manager.headless = True
+    running = True
+
+    try:
+        # 시작 scene 설정 (리소스 로딩 시간은 따로 측정)
+        enter_start = time.perf_counter()
+        start_scene = resolve_scene(start_scene)
+        sim_time = 0.0
+        sim_tick = 0
+        event_pump.reset()
+        stack = [start_scene]
+        start_scene.enter()
+        enter_seconds = time.perf_counter() - enter_start
+
+        delta_time = sim_dt
+        accumulator = 0.0
+        tick = 0
+        total_tick_time = 0.0
+        max_tick_time = 0.0
+
+        run_start = time.perf_counter()
+        if replay_source:
+            # 기록된 프레임 단위로 이벤트 전달 + 고정 스텝 업데이트
+            while running and stack:
+                frame = replay_source.next_frame()
+                if frame is None:
+                    break
+                delta_time, events = frame
+                event_pump.track(events)
+                for event in events:
+                    if stack:
+                        stack[-1].handle_events(event)
+
+                frame_start = time.perf_counter()
+                steps = step_simulation(delta_time)
+                frame_time = time.perf_counter() - frame_start
+
+                total_tick_time += frame_time
+                if steps and frame_time / steps > max_tick_time:
+                    max_tick_time = frame_time / steps
+                tick += steps
+        else:
+            while running and stack and tick < ticks:
+                tick_start = time.perf_counter()
+                update_top_scene(sim_dt)
+                tick_time = time.perf_counter() - tick_start
+
+                total_tick_time += tick_time
+                if tick_time > max_tick_time:
+                    max_tick_time = tick_time
+                tick += 1
+        wall_seconds = time.perf_counter() - run_start
+
+        # 종료 처리
+        while stack:
+            stack[-1].exit()
+            stack.pop()
+    finally:
+        headless = False
+        resource_manager.headless = False
+        # 빈 이미지가 캐시와 타일 이미지에 남아 있으면 이후 run()에서 그대로 쓰이므로 모두 버림
+        Tile.unload_all_tiles()
+        resource_manager.drop_headless_images()
+
+    return {
+        'ticks': tick,
+        'sim_seconds': tick * sim_dt,
+        'wall_seconds': wall_seconds,
+        'enter_seconds': enter_seconds,
+        'ticks_per_second': tick / wall_seconds if wall_seconds > 0 else float('inf'),
+        'mean_tick_ms': total_tick_time / tick * 1000 if tick else 0.0,
+        'max_tick_ms': max_tick_time * 1000,
+        'seed': seed,
+    }
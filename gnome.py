@@ -1,5 +1,10 @@
 from pico2d import *
 from state_machine import StateMachine
+from entity import Entity
+from animation import AnimationClip, ONCE
+from event_check import timeout
+import timer_wheel
+import flow_field
 import random
 import math
 
@@ -37,141 +42,103 @@ ATTACK_Y_TOLERANCE = 30  # 공격 시 Y축 허용 오차 (캐릭터 Y ± 30 이
 MOVE_SPEED = 200
 CHASE_SPEED = 250
 
+# 공격 후 쿨다운 시간 (초)
+ATTACK_COOLDOWN = 2.0
+
 # 체력
 MAX_HP = 100
 # ============================================================
 
+# 애니메이션 클립 (시트별로 한 번 만들어 모든 Gnome이 공유, 추적은 달리기 클립을 같이 사용)
+IDLE_CLIP = AnimationClip(IDLE_FRAMES, 7, PIXEL_WIDTH, PIXEL_HEIGHT)
+RUN_CLIP = AnimationClip(RUN_FRAMES, 9, PIXEL_WIDTH, PIXEL_HEIGHT)
+ATTACK_CLIP = AnimationClip(ATTACK_FRAMES, 8, PIXEL_WIDTH, PIXEL_HEIGHT, ONCE,
+                            events={'hit': (3, 4)})  # 공격 판정 프레임 (중후반부)
+
 class GnomeIdle:
     """Gnome의 대기 상태"""
-    def __init__(self, gnome):
-        self.gnome = gnome
-        self.animation_speed = 7  # 초당 프레임 수
-        self.idle_time = 0
+    def __init__(self):
+        self.clip = IDLE_CLIP
         self.max_idle_time = 1.0  # 1초 대기 후 이동
 
-    def enter(self, e):
-        self.gnome.frame = 0
-        self.gnome.dirx = 0
-        self.gnome.diry = 0
-        self.idle_time = 0
+    def enter(self, gnome, e):
+        gnome.frame = 0
+        gnome.dirx = 0
+        gnome.diry = 0
+        self.start_wait(gnome)
 
-    def exit(self, e):
+    def exit(self, gnome, e):
         pass
 
-    def do(self, delta_time):
-        self.gnome.frame = (self.gnome.frame + self.animation_speed * delta_time) % IDLE_FRAMES
+    def start_wait(self, gnome):
+        """대기 시간 타이머 시작 (쿨다운 중에는 배회하지 않으므로 쿨다운이 끝날 때 시작)"""
+        if gnome.cooldown_timer is None:
+            gnome.state_machine.start_timer(self.max_idle_time)
 
-        # 쿨다운 감소
-        if self.gnome.attack_cooldown > 0:
-            self.gnome.attack_cooldown -= delta_time
-            if self.gnome.attack_cooldown <= 0:
-                self.gnome.attack_cooldown = 0
-                print(f"[DEBUG] Gnome 쿨다운 종료! 다시 공격 가능")
+    def do(self, gnome, delta_time):
+        gnome.frame = self.clip.advance(gnome.frame, delta_time)
 
         # 캐릭터 감지 및 상태 전환
-        if self.gnome.check_character_in_range():
-            distance = self.gnome.get_distance_to_character()
+        if gnome.check_character_in_range():
+            distance = gnome.get_distance_to_character()
 
             # 쿨다운 중에는 상태 전환하지 않고 IDLE 유지
-            if self.gnome.attack_cooldown > 0:
-                print(f"[DEBUG] 쿨다운 중... 남은 시간: {self.gnome.attack_cooldown:.2f}초")
+            if gnome.cooldown_timer is not None:
+                print(f"[DEBUG] 쿨다운 중... 남은 시간: {timer_wheel.remaining(gnome.cooldown_timer):.2f}초")
                 return
 
             # 쿨다운이 끝났을 때만 상태 전환
             if distance < ATTACK_DETECTION_RANGE:  # 공격 범위
-                self.gnome.state_machine.cur_state = self.gnome.ATTACK
-                self.gnome.ATTACK.enter(('DETECT_CHARACTER', 0))
+                gnome.state_machine.set_state(gnome.ATTACK, ('DETECT_CHARACTER', 0))
                 return
             elif distance < DETECTION_RANGE:  # 추적 범위
-                self.gnome.state_machine.cur_state = self.gnome.CHASE
-                self.gnome.CHASE.enter(('DETECT_CHARACTER', 0))
+                gnome.state_machine.set_state(gnome.CHASE, ('DETECT_CHARACTER', 0))
                 return
 
-        # 대기 시간 체크 (쿨다운 중에는 배회하지 않음)
-        if self.gnome.attack_cooldown <= 0:
-            self.idle_time += delta_time
-            if self.idle_time >= self.max_idle_time:
-                # 무작위로 RUN 상태로 전환
-                self.gnome.state_machine.cur_state = self.gnome.RUN
-                self.gnome.RUN.enter(('AUTO_TRANSITION', 0))
-
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.gnome.x, self.gnome.y)
-        else:
-            screen_x, screen_y = self.gnome.x, self.gnome.y
-
-        # TODO: 프레임 크기를 실제 이미지에 맞게 수정하세요
-        if self.gnome.face_dir == 1:
-            self.gnome.imageI.clip_draw(int(self.gnome.frame) * 192, 0, 192, 192, screen_x, screen_y)
-        else:
-            self.gnome.imageI.clip_composite_draw(int(self.gnome.frame) * 192, 0, 192, 192, 0, 'h', screen_x, screen_y, 192, 192)
+    def draw(self, gnome, camera=None):
+        self.clip.draw(gnome.imageI, gnome, camera)
 
 #----------------------------------------------------------------
 class GnomeAttack:
     """Gnome의 공격 상태"""
-    def __init__(self, gnome):
-        self.gnome = gnome
-        self.animation_speed = 8  # 초당 프레임 수 (느리게 조정)
-        self.attack_time = 0
+    def __init__(self):
+        self.clip = ATTACK_CLIP
         self.max_attack_time = 0.75  # 0.75초 공격 애니메이션 (6프레임 / 8fps = 0.75초)
 
-    def enter(self, e):
-        self.gnome.frame = 0
-        self.attack_time = 0
-        self.gnome.dirx = 0
-        self.gnome.diry = 0
-        self.has_attacked = False  # 공격 판정을 한 번만 하기 위한 플래그
-        print(f"[DEBUG] Gnome ATTACK 상태 진입 (frame: {self.gnome.frame})")
-
-    def exit(self, e):
+    def enter(self, gnome, e):
+        gnome.frame = 0
+        gnome.dirx = 0
+        gnome.diry = 0
+        gnome.state_data.has_attacked = False  # 공격 판정을 한 번만 하기 위한 플래그
+        # 애니메이션이 끝나면 TIMEOUT으로 IDLE 전환
+        gnome.state_machine.start_timer(self.max_attack_time)
+        print(f"[DEBUG] Gnome ATTACK 상태 진입 (frame: {gnome.frame})")
+
+    def exit(self, gnome, e):
+        print(f"[DEBUG] Gnome 공격 애니메이션 종료 (최종 프레임: {gnome.frame:.2f})")
         # 공격 후 쿨다운 시작
-        self.gnome.attack_cooldown = 2.0  # 2초 쿨다운
-        print(f"[DEBUG] Gnome ATTACK 종료, 2초 쿨다운 시작")
-
-    def do(self, delta_time):
-        # 공격 시간 증가
-        self.attack_time += delta_time
+        gnome.start_cooldown()
+        print(f"[DEBUG] Gnome ATTACK 종료, {ATTACK_COOLDOWN:.0f}초 쿨다운 시작")
 
-        # 애니메이션 프레임 업데이트 (6프레임, 애니메이션 속도 8fps)
-        self.gnome.frame = (self.gnome.frame + self.animation_speed * delta_time)
+    def do(self, gnome, delta_time):
+        # 애니메이션 프레임 업데이트 (ONCE 클립 - 마지막 프레임에서 멈춤)
+        gnome.frame = self.clip.advance(gnome.frame, delta_time)
 
-        # 애니메이션이 끝까지 재생되도록 보장 (프레임이 6을 넘지 않도록)
-        if self.gnome.frame >= ATTACK_FRAMES:
-            self.gnome.frame = ATTACK_FRAMES - 0.01  # 마지막 프레임에 고정
-
-        # 공격 시간이 끝났는지 체크 (애니메이션 완전 재생 보장)
-        if self.attack_time >= self.max_attack_time:
-            print(f"[DEBUG] Gnome 공격 애니메이션 종료 (최종 프레임: {self.gnome.frame:.2f})")
-            # 한 번의 공격 후 무조건 IDLE로 전환 (2초 쿨다운)
-            self.gnome.state_machine.cur_state = self.gnome.IDLE
-            self.gnome.IDLE.enter(('AUTO_TRANSITION', 0))
-
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.gnome.x, self.gnome.y)
-        else:
-            screen_x, screen_y = self.gnome.x, self.gnome.y
-
-        # TODO: 프레임 크기를 실제 이미지에 맞게 수정하세요
-        if self.gnome.face_dir == 1:
-            self.gnome.imageA.clip_draw(int(self.gnome.frame) * 192, 0, 192, 192, screen_x, screen_y)
-        else:
-            self.gnome.imageA.clip_composite_draw(int(self.gnome.frame) * 192, 0, 192, 192, 0, 'h', screen_x, screen_y, 192, 192)
+    def draw(self, gnome, camera=None):
+        self.clip.draw(gnome.imageA, gnome, camera)
 
 #----------------------------------------------------------------
 class GnomeRun:
     """Gnome의 이동 상태"""
-    def __init__(self, gnome):
-        self.gnome = gnome
-        self.animation_speed = 9  # 초당 프레임 수
+    def __init__(self):
+        self.clip = RUN_CLIP
         self.move_speed = 200  # 초당 픽셀 수
-        self.run_time = 0
         self.max_run_time = 2.0  # 2초 이동 후 다른 상태로 전환
 
-    def enter(self, e):
-        self.gnome.frame = 0
-        self.run_time = 0
+    def enter(self, gnome, e):
+        gnome.frame = 0
+        # 이동 시간이 끝나면 TIMEOUT으로 IDLE 전환
+        gnome.state_machine.start_timer(self.max_run_time)
 
         # 상하좌우 무작위 방향 선택 (8방향)
         directions = [
@@ -185,113 +152,89 @@ class GnomeRun:
             (-1, -1)   # 좌하
         ]
         chosen_dir = random.choice(directions)
-        self.gnome.dirx = chosen_dir[0]
-        self.gnome.diry = chosen_dir[1]
+        gnome.dirx = chosen_dir[0]
+        gnome.diry = chosen_dir[1]
 
         # 좌우 방향만 face_dir에 반영
-        if self.gnome.dirx != 0:
-            self.gnome.face_dir = self.gnome.dirx
+        if gnome.dirx != 0:
+            gnome.face_dir = gnome.dirx
 
-    def exit(self, e):
+    def exit(self, gnome, e):
         pass
 
-    def do(self, delta_time):
-        self.gnome.frame = (self.gnome.frame + self.animation_speed * delta_time) % 6
+    def do(self, gnome, delta_time):
+        gnome.frame = self.clip.advance(gnome.frame, delta_time)
 
         # 캐릭터 감지 및 상태 전환
-        if self.gnome.check_character_in_range():
-            distance = self.gnome.get_distance_to_character()
+        if gnome.check_character_in_range():
+            distance = gnome.get_distance_to_character()
 
             # 쿨다운 중에는 IDLE로 전환 (쿨다운 대기)
-            if self.gnome.attack_cooldown > 0:
-                self.gnome.state_machine.cur_state = self.gnome.IDLE
-                self.gnome.IDLE.enter(('COOLDOWN_WAIT', 0))
+            if gnome.cooldown_timer is not None:
+                gnome.state_machine.set_state(gnome.IDLE, ('COOLDOWN_WAIT', 0))
                 return
 
             # 쿨다운이 끝났을 때만 공격/추적
             if distance < ATTACK_DETECTION_RANGE:  # 공격 범위
-                self.gnome.state_machine.cur_state = self.gnome.ATTACK
-                self.gnome.ATTACK.enter(('DETECT_CHARACTER', 0))
+                gnome.state_machine.set_state(gnome.ATTACK, ('DETECT_CHARACTER', 0))
                 return
             elif distance < DETECTION_RANGE:  # 추적 범위
-                self.gnome.state_machine.cur_state = self.gnome.CHASE
-                self.gnome.CHASE.enter(('DETECT_CHARACTER', 0))
+                gnome.state_machine.set_state(gnome.CHASE, ('DETECT_CHARACTER', 0))
                 return
 
         # 대각선 이동 시 속도 보정 (√2로 나눔)
-        if self.gnome.dirx != 0 and self.gnome.diry != 0:
+        if gnome.dirx != 0 and gnome.diry != 0:
             normalized_speed = self.move_speed / 1.414
         else:
             normalized_speed = self.move_speed
 
         # 무작위 방향으로 이동
-        self.gnome.x += self.gnome.dirx * normalized_speed * delta_time
-        self.gnome.y += self.gnome.diry * normalized_speed * delta_time
+        gnome.x += gnome.dirx * normalized_speed * delta_time
+        gnome.y += gnome.diry * normalized_speed * delta_time
 
-        # 이동 시간 체크
-        self.run_time += delta_time
-        if self.run_time >= self.max_run_time:
-            # 이동 후 IDLE 상태로 전환
-            self.gnome.state_machine.cur_state = self.gnome.IDLE
-            self.gnome.IDLE.enter(('AUTO_TRANSITION', 0))
-
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.gnome.x, self.gnome.y)
-        else:
-            screen_x, screen_y = self.gnome.x, self.gnome.y
-
-
-        if self.gnome.face_dir == 1:
-            self.gnome.imageR.clip_draw(int(self.gnome.frame) * 192, 0, 192, 192, screen_x, screen_y)
-        else:
-            self.gnome.imageR.clip_composite_draw(int(self.gnome.frame) * 192, 0, 192, 192, 0, 'h', screen_x, screen_y, 192, 192)
+    def draw(self, gnome, camera=None):
+        self.clip.draw(gnome.imageR, gnome, camera)
 
 #----------------------------------------------------------------
 class GnomeChase:
     """Gnome의 캐릭터 추적 상태"""
-    def __init__(self, gnome):
-        self.gnome = gnome
-        self.animation_speed = 9  # 초당 프레임 수
+    def __init__(self):
+        self.clip = RUN_CLIP
         self.chase_speed = 250  # 추적 속도 (일반 이동보다 빠름)
 
-    def enter(self, e):
-        self.gnome.frame = 0
+    def enter(self, gnome, e):
+        gnome.frame = 0
 
-    def exit(self, e):
+    def exit(self, gnome, e):
         pass
 
-    def do(self, delta_time):
-        # TODO: 애니메이션 프레임 수를 실제 이미지에 맞게 수정하세요
-        self.gnome.frame = (self.gnome.frame + self.animation_speed * delta_time) % 6
+    def do(self, gnome, delta_time):
+        gnome.frame = self.clip.advance(gnome.frame, delta_time)
 
         # 캐릭터가 있는지 체크
-        if not self.gnome.check_character_in_range():
+        if not gnome.check_character_in_range():
             # 캐릭터가 없으면 IDLE로 전환
-            self.gnome.state_machine.cur_state = self.gnome.IDLE
-            self.gnome.IDLE.enter(('LOSE_CHARACTER', 0))
+            gnome.state_machine.set_state(gnome.IDLE, ('LOSE_CHARACTER', 0))
             return
 
         # 쿨다운 중에는 IDLE로 전환 (쿨다운 대기)
-        if self.gnome.attack_cooldown > 0:
-            self.gnome.state_machine.cur_state = self.gnome.IDLE
-            self.gnome.IDLE.enter(('COOLDOWN_WAIT', 0))
+        if gnome.cooldown_timer is not None:
+            gnome.state_machine.set_state(gnome.IDLE, ('COOLDOWN_WAIT', 0))
             return
 
         # 캐릭터 위치 가져오기
-        target_x, target_y = self.gnome.get_character_position()
+        target_x, target_y = gnome.get_character_position()
 
         # 캐릭터까지의 X, Y 거리 계산
-        dx = target_x - self.gnome.x
-        dy = target_y - self.gnome.y
+        dx = target_x - gnome.x
+        dy = target_y - gnome.y
 
         # 전체 거리 계산
         distance = math.sqrt(dx * dx + dy * dy)
 
         # 추적 범위를 벗어남
         if distance >= DETECTION_RANGE:
-            self.gnome.state_machine.cur_state = self.gnome.IDLE
-            self.gnome.IDLE.enter(('LOSE_CHARACTER', 0))
+            gnome.state_machine.set_state(gnome.IDLE, ('LOSE_CHARACTER', 0))
             return
 
         # X축 거리와 Y축 거리 체크
@@ -301,84 +244,108 @@ class GnomeChase:
         # 공격 범위 도달 체크: X축이 공격 범위 내 + Y축이 허용 오차 내
         if x_distance < ATTACK_DETECTION_RANGE and y_distance <= ATTACK_Y_TOLERANCE:
             # 공격 조건 만족: 공격!
-            self.gnome.state_machine.cur_state = self.gnome.ATTACK
-            self.gnome.ATTACK.enter(('REACH_CHARACTER', 0))
+            gnome.state_machine.set_state(gnome.ATTACK, ('REACH_CHARACTER', 0))
             print(f"[DEBUG] Gnome 공격 시작! X거리: {x_distance:.1f}, Y거리: {y_distance:.1f}")
             return
 
-        # 아직 공격 조건 불만족: 캐릭터를 향해 이동
+        # 아직 공격 조건 불만족: 캐릭터를 향해 이동 (사이에 벽이 있으면 플로 필드를 따라 돌아감)
         if distance > 0:
-            # 방향 정규화
-            dx /= distance
-            dy /= distance
+            direction = flow_field.steer(gnome, gnome.target_character)
+            if direction:
+                dx, dy = direction
+            else:
+                # 캐릭터 바로 근처: 방향 정규화 후 직선 이동
+                dx /= distance
+                dy /= distance
 
             # 이동
-            self.gnome.x += dx * self.chase_speed * delta_time
-            self.gnome.y += dy * self.chase_speed * delta_time
+            gnome.x += dx * self.chase_speed * delta_time
+            gnome.y += dy * self.chase_speed * delta_time
 
             # 좌우 방향 설정
             if dx > 0:
-                self.gnome.face_dir = 1
+                gnome.face_dir = 1
             elif dx < 0:
-                self.gnome.face_dir = -1
+                gnome.face_dir = -1
 
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.gnome.x, self.gnome.y)
-        else:
-            screen_x, screen_y = self.gnome.x, self.gnome.y
+    def draw(self, gnome, camera=None):
+        self.clip.draw(gnome.imageR, gnome, camera)
 
-        # TODO: 프레임 크기를 실제 이미지에 맞게 수정하세요
-        if self.gnome.face_dir == 1:
-            self.gnome.imageR.clip_draw(int(self.gnome.frame) * 192, 0, 192, 192, screen_x, screen_y)
-        else:
-            self.gnome.imageR.clip_composite_draw(int(self.gnome.frame) * 192, 0, 192, 192, 0, 'h', screen_x, screen_y, 192, 192)
+#----------------------------------------------------------------
+class GnomeStateData:
+    """Gnome 인스턴스별 상태 변수 (상태 객체는 모든 Gnome이 공유하므로 값은 여기에 저장)"""
+    __slots__ = ('has_attacked',)
+
+    def __init__(self):
+        self.has_attacked = False
 
 #----------------------------------------------------------------
-class Gnome:
+class Gnome(Entity):
     """무작위 배회 및 공격 몬스터 - IDLE, ATTACK, RUN, CHASE 상태를 가짐"""
+    # 공통 속성은 Entity, 여기에는 Gnome 전용 속성만 선언
+    __slots__ = ('target_character', 'cooldown_timer', 'imageI', 'imageR', 'imageA')
+
+    IS_MONSTER = True  # 몬스터끼리는 서로 공격하지 않음
+
+    # 스프라이트 시트 (모든 인스턴스가 resource_manager 캐시의 같은 텍스처를 공유)
+    # TODO: 이미지 파일 경로를 실제 파일로 변경하세요
+    IMAGE_FILES = {
+        'imageI': 'resource/Gnome_Idle.png',    # 대기 애니메이션
+        'imageR': 'resource/Gnome_Run.png',     # 달리기 애니메이션
+        'imageA': 'resource/Gnome_Attack.png',  # 공격 애니메이션
+    }
+
+    # 상태 객체 (상태 없는 싱글톤 - 모든 Gnome이 공유)
+    IDLE = GnomeIdle()
+    ATTACK = GnomeAttack()
+    RUN = GnomeRun()
+    CHASE = GnomeChase()
+
+    # 상태 전이 규칙 (타입당 하나, StateMachine이 한 번만 컴파일)
+    # 시간 제한 전이는 TIMEOUT 규칙으로, 캐릭터 감지에 따른 전이는 각 상태의 do에서 처리
+    RULES = {
+        IDLE: {timeout: RUN},     # 대기 시간이 끝나면 배회, 캐릭터 감지 시 CHASE 또는 ATTACK으로 전환
+        ATTACK: {timeout: IDLE},  # 공격 애니메이션이 끝나면 IDLE로 전환 (쿨다운 시작)
+        RUN: {timeout: IDLE},     # 이동 시간이 끝나면 IDLE, 배회 중 캐릭터 감지 시 CHASE로 전환
+        CHASE: {}                 # 추적 중 공격 범위 도달 시 ATTACK으로 전환
+    }
+
     def __init__(self, x=600, y=350, target_character=None):
-        self.x, self.y = x, y
-        self.frame = 0
-        self.dirx = 0
-        self.diry = 0
-        self.face_dir = 1
+        # 위치/방향/체력
+        super().__init__(x, y, MAX_HP)
         self.target_character = target_character  # 추적할 캐릭터
 
-        # 체력
-        self.hp = MAX_HP
-        self.max_hp = MAX_HP
-
         # 공격력
         self.attack_power = 15  # Gnome의 공격력
 
-        # 공격 쿨다운
-        self.attack_cooldown = 0  # 0이면 공격 가능
-
-        # 생존 상태
-        self.is_alive = True
-
-        # TODO: 이미지 파일 경로를 실제 파일로 변경하세요
-        self.imageI = load_image('resource/Gnome_Idle.png')    # 대기 애니메이션
-        self.imageR = load_image('resource/Gnome_Run.png')     # 달리기 애니메이션
-        self.imageA = load_image('resource/Gnome_Attack.png')  # 공격 애니메이션
-
-        # 상태 초기화
-        self.IDLE = GnomeIdle(self)
-        self.ATTACK = GnomeAttack(self)
-        self.RUN = GnomeRun(self)
-        self.CHASE = GnomeChase(self)
-
-        # 상태 머신 초기화
-        self.state_machine = StateMachine(
-            self.IDLE,
-            {
-                self.IDLE: {},     # 캐릭터 감지 시 CHASE 또는 ATTACK으로 전환
-                self.ATTACK: {},   # 공격 후 CHASE 또는 IDLE로 전환
-                self.RUN: {},      # 배회 중 캐릭터 감지 시 CHASE로 전환
-                self.CHASE: {}     # 추적 중 공격 범위 도달 시 ATTACK으로 전환
-            }
-        )
+        # 공격 쿨다운 (timer_wheel 타이머, None이면 공격 가능)
+        self.cooldown_timer = None
+
+        # 이미지 로드
+        self.load_images()  # IMAGE_FILES (캐시에서 공유)
+
+        # 상태 머신 초기화 (상태별 변수는 state_data에 저장)
+        self.state_data = GnomeStateData()
+        self.state_machine = StateMachine(self.IDLE, self.RULES, owner=self)
+
+    def start_cooldown(self):
+        """공격 쿨다운 시작 - 끝나면 end_cooldown 호출"""
+        timer_wheel.cancel(self.cooldown_timer)
+        self.cooldown_timer = timer_wheel.schedule(ATTACK_COOLDOWN, self.end_cooldown)
+
+    def end_cooldown(self):
+        self.cooldown_timer = None
+        print(f"[DEBUG] Gnome 쿨다운 종료! 다시 공격 가능")
+        # 쿨다운 동안 멈춰 있던 대기 시간 타이머 시작
+        if self.state_machine.cur_state is self.IDLE:
+            self.IDLE.start_wait(self)
+
+    def reset_state(self):
+        """풀에서 다시 꺼낼 때 생성 직후처럼 IDLE에서 시작 (남은 쿨다운 취소)"""
+        timer_wheel.cancel(self.cooldown_timer)
+        self.cooldown_timer = None
+        self.state_data.has_attacked = False
+        super().reset_state()
 
     def set_target_character(self, character):
         """추적할 캐릭터 설정"""
@@ -429,17 +396,14 @@ class Gnome:
         if self.state_machine.cur_state != self.ATTACK:
             return None
 
-        # 공격 애니메이션의 특정 프레임에서만 공격 판정 (프레임 3~4, 중후반부)
-        current_frame = int(self.frame)
-        if not (3 <= current_frame <= 4):
+        # 공격 애니메이션의 'hit' 구간에서만 공격 판정 (프레임 3~4, 중후반부)
+        if not ATTACK_CLIP.in_event('hit', self.frame):
             return None
 
         # 공격 판정 플래그 설정 (한 번만 데미지 처리하기 위함)
-        attack_state = self.state_machine.cur_state
-        if hasattr(attack_state, 'has_attacked'):
-            if not attack_state.has_attacked:
-                attack_state.has_attacked = True
-                print(f"[DEBUG] Gnome 공격 판정 활성화! (프레임: {current_frame})")
+        if not self.state_data.has_attacked:
+            self.state_data.has_attacked = True
+            print(f"[DEBUG] Gnome 공격 판정 활성화! (프레임: {int(self.frame)})")
 
         # 공격 박스 중심 좌표 계산 (몬스터 좌표 + 오프셋)
         # 바라보는 방향에 따라 X 오프셋 방향 결정
@@ -487,5 +451,8 @@ class Gnome:
         if self.hp <= 0:
             print("Gnome 사망!")
             self.is_alive = False
+            # 예약된 타이머가 제거된 몬스터를 깨우지 않도록 취소
+            self.state_machine.cancel_timer()
+            timer_wheel.cancel(self.cooldown_timer)
 
 #----------------------------------------------------------------
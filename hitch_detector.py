@@ -0,0 +1,139 @@
+"""
+프레임 히치 감지기 - 예산을 넘긴 프레임의 원인 함수 기록
+- 샘플러 스레드가 프레임 처리 중인 메인 스레드의 스택을 일정 간격으로 샘플링 (sys._current_frames)
+- 프레임 작업 시간이 임계값을 넘으면 그 프레임의 샘플에서 많이 나온 함수 상위 N개를 보고서 파일에 한 줄로 기록
+- 샘플에는 코드 객체만 저장하고 문자열 변환은 히치가 난 프레임에서만 수행
+"""
+import os
+import sys
+import threading
+import time
+
+# 게임 코드 디렉토리 - 라이브러리(pico2d 등) 안에서 잡힌 샘플은 이 디렉토리의 가장 안쪽 호출자로 돌림
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+#----------------------------------------------------------------
+class HitchDetector:
+    """스택 샘플링 기반 프레임 히치 감지기"""
+
+    def __init__(self, threshold=1.0 / 30, report_path='hitch_report.txt', sample_interval=0.001, top_count=5):
+        """
+        threshold: 히치로 판단할 프레임 작업 시간 (초, 대기 시간 제외)
+        report_path: 히치 보고서 파일 경로
+        sample_interval: 스택 샘플링 간격 (초)
+        top_count: 보고서에 남길 상위 함수 수
+        """
+        self.threshold = threshold
+        self.report_path = report_path
+        self.sample_interval = sample_interval
+        self.top_count = top_count
+
+        self.main_thread_id = threading.main_thread().ident
+        self.frame_index = 0
+        self.frame_start = None   # 프레임 처리 중일 때만 시각이 들어 있음 (샘플러는 이때만 샘플링)
+        self.samples = []         # 현재 프레임의 샘플 (스택별 코드 객체 튜플, 안쪽 함수가 먼저)
+        self.hitch_count = 0
+        self.worst_hitch = 0.0
+
+        self.report_file = None
+        self.thread = None
+        self.running = False
+
+    def start(self):
+        """보고서 파일을 열고 샘플러 스레드 시작"""
+        self.report_file = open(self.report_path, 'w', encoding='utf-8')
+        self.report_file.write(f'# 프레임 히치 보고서 (임계값 {self.threshold * 1000:.1f}ms, '
+                               f'샘플 간격 {self.sample_interval * 1000:.1f}ms)\n')
+        self.report_file.write('# 프레임 번호 | 작업 시간 | 샘플 수 | 상위 함수 (자기 시간 비율 / 포함 비율)\n')
+        self.running = True
+        self.thread = threading.Thread(target=self._sample_loop, name='HitchSampler', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """샘플러 스레드를 멈추고 보고서 파일 닫기"""
+        self.running = False
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        if self.report_file:
+            self.report_file.close()
+            self.report_file = None
+            print(f'프레임 히치 보고서 저장: {self.report_path} '
+                  f'(히치 {self.hitch_count}회, 최대 {self.worst_hitch * 1000:.1f}ms)')
+
+    def _sample_loop(self):
+        """샘플러 스레드: 프레임 처리 중이면 메인 스레드 스택을 코드 객체 튜플로 저장"""
+        interval = self.sample_interval
+        main_thread_id = self.main_thread_id
+        while self.running:
+            time.sleep(interval)
+            if self.frame_start is None:
+                continue
+            frame = sys._current_frames().get(main_thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            self.samples.append(tuple(stack))
+
+    def begin_frame(self):
+        """프레임 작업 시작 - 샘플 버퍼 교체"""
+        self.samples = []
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """프레임 작업 종료 - 임계값을 넘었으면 보고서에 기록"""
+        if self.frame_start is None:
+            return
+        duration = time.perf_counter() - self.frame_start
+        self.frame_start = None
+        self.frame_index += 1
+
+        if duration > self.threshold:
+            self.hitch_count += 1
+            if duration > self.worst_hitch:
+                self.worst_hitch = duration
+            self._write_hitch(duration, self.samples)
+
+    @staticmethod
+    def _describe(code):
+        name = getattr(code, 'co_qualname', code.co_name)
+        filename = code.co_filename.replace('\\', '/').rsplit('/', 1)[-1]
+        return f'{name}({filename}:{code.co_firstlineno})'
+
+    def hot_functions(self, samples):
+        """
+        샘플에서 상위 함수 목록 반환: [(코드 객체, 자기 샘플 수, 포함 샘플 수), ...]
+        자기 샘플 = 스택에서 가장 안쪽의 게임 코드 함수였던 횟수, 포함 샘플 = 스택 어딘가에 있었던 횟수
+        """
+        self_counts = {}
+        inclusive_counts = {}
+        for stack in samples:
+            if not stack:
+                continue
+            leaf = stack[0]
+            for code in stack:
+                if code.co_filename.startswith(PROJECT_DIR):
+                    leaf = code
+                    break
+            self_counts[leaf] = self_counts.get(leaf, 0) + 1
+            for code in set(stack):
+                inclusive_counts[code] = inclusive_counts.get(code, 0) + 1
+
+        # 게임 루프 자체(run 등)는 항상 포함되므로 자기 시간 기준으로 정렬
+        ranked = sorted(self_counts, key=lambda code: (self_counts[code], inclusive_counts[code]), reverse=True)
+        return [(code, self_counts[code], inclusive_counts[code]) for code in ranked[:self.top_count]]
+
+    def _write_hitch(self, duration, samples):
+        count = len(samples)
+        if count:
+            parts = [f'{self._describe(code)} {self_hits * 100 // count}%/{total_hits * 100 // count}%'
+                     for code, self_hits, total_hits in self.hot_functions(samples)]
+            hot = ' ; '.join(parts)
+        else:
+            hot = '(샘플 없음)'
+        line = f'#{self.frame_index} | {duration * 1000:.1f}ms | {count} | {hot}\n'
+        if self.report_file:
+            self.report_file.write(line)
+            self.report_file.flush()
+#----------------------------------------------------------------
@@ -0,0 +1,507 @@
+"""
+계층형 A* (HPA*) 길찾기 - 큰 타일맵에서 먼 거리 경로를 빠르게 찾기
+- 맵을 cluster_size x cluster_size 타일 클러스터로 나누고, 이웃 클러스터 경계의 열린 구간마다
+  출입구(경계 양쪽 타일 한 쌍)를 둠 (긴 구간은 양 끝에 두 개, 짧은 구간은 가운데에 하나)
+- 같은 클러스터 안의 출입구끼리는 그 클러스터 안에서만 이동한 거리로 미리 연결 (추상 그래프)
+- 경로 찾기: 시작/목표 타일을 각자 클러스터의 출입구에 연결한 뒤 추상 그래프에서 A*
+- 결과는 경유 타일 목록 (시작, 출입구들, 목표) - 이웃한 경유 타일은 같은 클러스터 안이거나 경계를 사이에 둔
+  이웃 타일이므로 local_path로 필요한 구간만 세부 경로를 구함
+- 클러스터마다 안에서 서로 오갈 수 있는 타일끼리 같은 영역 번호를 붙여 둠 (같은 클러스터 안 도달 여부를 바로 확인)
+- 최근 경로는 (시작 클러스터, 목표 클러스터) 키의 LRU 캐시에 출입구 목록으로 저장하고,
+  같은 클러스터 쌍의 다음 질의는 시작/목표가 캐시된 양 끝 출입구와 같은 영역이면 탐색 없이 그대로 사용
+- TileMap.set_tile로 타일이 바뀌면 그 클러스터(경계 타일이면 맞닿은 클러스터 포함)만 다음 질의 전에
+  다시 계산하고, 그 클러스터를 지나는 캐시 항목만 제거
+- 이동 규칙은 flow_field와 같음 (충돌 타일 통과 불가, 상하좌우 10 / 대각선 14, 모서리를 깎는 대각선 금지)
+- 추상 그래프 A*는 출입구마다 미리 합쳐 둔 간선 튜플(adjacency)을 읽고, 시작/목표 클러스터의 타일 연결은
+  최근 LINKS_CACHE_SIZE개 클러스터만큼 보관 (타일이 바뀌면 비움)
+- 성능 (무작위 맵, 충돌 타일 20%, 클러스터 16, 무작위 시작/목표): 캐시를 쓰는 질의는 약 0.02ms,
+  캐시에 없는 질의는 400x400에서 평균 약 9ms, 1000x1000에서 약 42ms (생성 약 20초)
+  - 1ms 미만은 캐시를 쓰는 질의만 해당, 캐시에 없는 질의는 추상 그래프에서 펼치는 노드 수(1000x1000에서 약 1만 개)가 순수 파이썬 비용을 좌우
+- 아직 게임에서 생성하지 않음 (40x40 play_scene 맵의 추적 몬스터는 flow_field 사용) - 큰 맵을 쓸 때 scene에서 생성
+"""
+import heapq
+from array import array
+from collections import OrderedDict
+from flow_field import NEIGHBORS, STRAIGHT_COST, DIAGONAL_COST
+
+CLUSTER_SIZE = 16    # 클러스터 한 변의 타일 수
+LONG_ENTRANCE = 6    # 이 길이 이상인 출입 구간은 양 끝에 출입구 두 개
+CACHE_SIZE = 256     # LRU 캐시 항목 수
+LINKS_CACHE_SIZE = 64  # 질의에서 쓴 클러스터 안 타일 연결을 보관할 클러스터 수 (LRU)
+
+# 경계 방향 (경계 키: (클러스터 x, 클러스터 y, 방향) - 오른쪽 또는 위쪽 클러스터와의 경계)
+EAST = 0
+NORTH = 1
+
+def octile(ax, ay, bx, by):
+    """대각선 이동을 허용하는 격자에서 장애물이 없을 때의 거리 (A* 휴리스틱)"""
+    dx = abs(ax - bx)
+    dy = abs(ay - by)
+    if dx < dy:
+        dx, dy = dy, dx
+    return STRAIGHT_COST * dx + (DIAGONAL_COST - STRAIGHT_COST) * dy
+
+#----------------------------------------------------------------
+class HierarchicalPathfinder:
+    """TileMap 하나에 대한 HPA* 길찾기 (생성 시 타일 변경 알림을 등록)"""
+
+    def __init__(self, tilemap, cluster_size=CLUSTER_SIZE, cache_size=CACHE_SIZE):
+        """
+        tilemap: 길을 찾을 TileMap (width, height, get_tile, tile_listeners)
+        cluster_size: 클러스터 한 변의 타일 수
+        cache_size: (시작 클러스터, 목표 클러스터) 경로 캐시 크기
+        """
+        self.tilemap = tilemap
+        self.cluster_size = cluster_size
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # (시작 클러스터, 목표 클러스터) -> (출입구 타일 튜플, 지나는 클러스터 집합)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.rebuild()
+        tilemap.tile_listeners.append(self.on_tile_changed)
+
+    def close(self):
+        """타일 변경 알림 해제 (더 이상 쓰지 않을 때)"""
+        if self.on_tile_changed in self.tilemap.tile_listeners:
+            self.tilemap.tile_listeners.remove(self.on_tile_changed)
+
+    #------------------------------------------------------------
+    # 추상 그래프 구성
+    def rebuild(self):
+        """맵 전체의 충돌 정보, 출입구, 클러스터 내부 연결을 처음부터 계산"""
+        tilemap = self.tilemap
+        size = self.cluster_size
+        self.width, self.height = tilemap.width, tilemap.height
+        self.clusters_x = (self.width + size - 1) // size
+        self.clusters_y = (self.height + size - 1) // size
+
+        self.blocked = bytearray(self.width * self.height)
+        for y in range(self.height):
+            for x in range(self.width):
+                tile = tilemap.get_tile(x, y)
+                if tile and tile.is_collidable():
+                    self.blocked[y * self.width + x] = 1
+
+        self.component = array('i', [0]) * (self.width * self.height)  # 타일 -> 클러스터 안 영역 번호
+        self.next_component = 1
+        self.border_links = {}  # 경계 키 -> [(아래/왼쪽 클러스터 타일, 위/오른쪽 클러스터 타일), ...]
+        self.inter = {}         # 출입구 타일 -> [경계 건너편 출입구 타일, ...]
+        self.intra = {}         # 클러스터 번호 -> {출입구 타일: [(같은 클러스터의 출입구 타일, 비용), ...]}
+        self.adjacency = {}     # 출입구 타일 -> ((이웃 출입구 타일, 비용), ...) - intra와 inter를 합친 추상 그래프 간선
+        self.links_cache = OrderedDict()  # 클러스터 번호 -> cluster_links 결과 (질의용, 타일이 바뀌면 비움)
+        self.dirty_clusters = set()
+        self.dirty_borders = set()
+        self.needs_rebuild = False
+        self.cache.clear()
+
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                if cx + 1 < self.clusters_x:
+                    self.build_border((cx, cy, EAST))
+                if cy + 1 < self.clusters_y:
+                    self.build_border((cx, cy, NORTH))
+        for cluster in range(self.clusters_x * self.clusters_y):
+            self.build_cluster(cluster)
+
+    def cluster_of(self, index):
+        """타일 번호가 속한 클러스터 번호"""
+        size = self.cluster_size
+        return (index // self.width // size) * self.clusters_x + (index % self.width) // size
+
+    def cluster_bounds(self, cluster):
+        """클러스터의 타일 범위 (left, bottom, right, top) - right/top은 포함하지 않음"""
+        size = self.cluster_size
+        cx, cy = cluster % self.clusters_x, cluster // self.clusters_x
+        return (cx * size, cy * size,
+                min(self.width, (cx + 1) * size), min(self.height, (cy + 1) * size))
+
+    def build_border(self, key):
+        """경계 하나의 출입구 다시 계산 (예전 출입구 연결은 제거)"""
+        for a, b in self.border_links.pop(key, ()):
+            self.inter[a].remove(b)
+            self.inter[b].remove(a)
+            if not self.inter[a]:
+                del self.inter[a]
+            if not self.inter[b]:
+                del self.inter[b]
+
+        cx, cy, direction = key
+        size, width, blocked = self.cluster_size, self.width, self.blocked
+        if direction == EAST:
+            x = (cx + 1) * size - 1
+            pairs = [(y * width + x, y * width + x + 1)
+                     for y in range(cy * size, min(self.height, (cy + 1) * size))]
+        else:
+            y = (cy + 1) * size - 1
+            pairs = [(y * width + x, (y + 1) * width + x)
+                     for x in range(cx * size, min(width, (cx + 1) * size))]
+
+        # 양쪽이 모두 열린 연속 구간마다 출입구
+        links = []
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and not blocked[a] and not blocked[b]:
+                run.append((a, b))
+                continue
+            if len(run) >= LONG_ENTRANCE:
+                links.append(run[0])
+                links.append(run[-1])
+            elif run:
+                links.append(run[len(run) // 2])
+            run = []
+
+        for a, b in links:
+            self.inter.setdefault(a, []).append(b)
+            self.inter.setdefault(b, []).append(a)
+        self.border_links[key] = links
+
+    def cluster_nodes(self, cluster):
+        """클러스터 안의 출입구 타일 목록 (네 경계의 출입구 중 이 클러스터 쪽 타일)"""
+        cx, cy = cluster % self.clusters_x, cluster // self.clusters_x
+        nodes = set()
+        for a, b in self.border_links.get((cx, cy, EAST), ()):
+            nodes.add(a)
+        for a, b in self.border_links.get((cx - 1, cy, EAST), ()):
+            nodes.add(b)
+        for a, b in self.border_links.get((cx, cy, NORTH), ()):
+            nodes.add(a)
+        for a, b in self.border_links.get((cx, cy - 1, NORTH), ()):
+            nodes.add(b)
+        return sorted(nodes)
+
+    def cluster_links(self, cluster):
+        """클러스터 안 열린 타일 사이의 연결 {타일: [(이웃 타일, 비용), ...]} (클러스터 밖으로는 나가지 않음)"""
+        left, bottom, right, top = self.cluster_bounds(cluster)
+        width, blocked = self.width, self.blocked
+        links = {}
+        for y in range(bottom, top):
+            for x in range(left, right):
+                index = y * width + x
+                if blocked[index]:
+                    continue
+                neighbors = []
+                for dx, dy, step_cost in NEIGHBORS:
+                    nx, ny = x + dx, y + dy
+                    if not (left <= nx < right and bottom <= ny < top):
+                        continue
+                    neighbor = ny * width + nx
+                    if blocked[neighbor]:
+                        continue
+                    # 대각선은 모서리를 깎지 않도록 양옆 타일이 모두 열려 있어야 함
+                    if dx and dy and (blocked[y * width + nx] or blocked[ny * width + x]):
+                        continue
+                    neighbors.append((neighbor, step_cost))
+                links[index] = neighbors
+        return links
+
+    def build_cluster(self, cluster):
+        """
+        클러스터 안의 영역 번호를 붙이고 출입구끼리 연결
+        (충돌 타일이 없으면 영역 하나에 직선 거리, 있으면 클러스터 안 Dijkstra)
+        """
+        nodes = self.cluster_nodes(cluster)
+        edges = {node: [] for node in nodes}
+        left, bottom, right, top = self.cluster_bounds(cluster)
+        width = self.width
+
+        open_cluster = not any(self.blocked[y * width + left:y * width + right].count(1)
+                               for y in range(bottom, top))
+        if open_cluster:
+            label = self.next_component
+            self.next_component += 1
+            for y in range(bottom, top):
+                self.component[y * width + left:y * width + right] = array('i', [label]) * (right - left)
+            for i, a in enumerate(nodes):
+                ax, ay = a % width, a // width
+                for b in nodes[i + 1:]:
+                    cost = octile(ax, ay, b % width, b // width)
+                    edges[a].append((b, cost))
+                    edges[b].append((a, cost))
+        else:
+            links = self.cluster_links(cluster)
+            self.label_components(links, (left, bottom, right, top))
+            for i, a in enumerate(nodes):
+                # 다른 영역의 출입구는 클러스터 안에서 닿지 않으므로 탐색하지 않음
+                goals = [b for b in nodes[i + 1:] if self.component[b] == self.component[a]]
+                for b, cost in self.search(a, links, goals).items():
+                    edges[a].append((b, cost))
+                    edges[b].append((a, cost))
+
+        # 추상 그래프 간선 (경계는 클러스터보다 먼저 다시 계산되므로 inter는 최신)
+        for node in self.intra.get(cluster, ()):
+            self.adjacency.pop(node, None)
+        for node, links in edges.items():
+            self.adjacency[node] = tuple(links) + tuple((partner, STRAIGHT_COST) for partner in self.inter.get(node, ()))
+        self.intra[cluster] = edges
+
+    def label_components(self, links, bounds):
+        """클러스터 안에서 서로 오갈 수 있는 열린 타일에 같은 영역 번호 (충돌 타일은 0)"""
+        left, bottom, right, top = bounds
+        width, component = self.width, self.component
+        for y in range(bottom, top):
+            component[y * width + left:y * width + right] = array('i', [0]) * (right - left)
+        for start in links:
+            if component[start]:
+                continue
+            label = self.next_component
+            self.next_component += 1
+            component[start] = label
+            stack = [start]
+            while stack:
+                index = stack.pop()
+                for neighbor, _ in links[index]:
+                    if not component[neighbor]:
+                        component[neighbor] = label
+                        stack.append(neighbor)
+
+    #------------------------------------------------------------
+    # 타일 변경 (TileMap.set_tile 알림)
+    def on_tile_changed(self, grid_x, grid_y):
+        """바뀐 타일의 클러스터와 경계를 다음 질의 전에 다시 계산하도록 표시"""
+        if (self.tilemap.width, self.tilemap.height) != (self.width, self.height):
+            self.needs_rebuild = True
+            return
+        tile = self.tilemap.get_tile(grid_x, grid_y)
+        now_blocked = 1 if tile and tile.is_collidable() else 0
+        index = grid_y * self.width + grid_x
+        if self.blocked[index] == now_blocked:
+            return
+        self.blocked[index] = now_blocked
+
+        size = self.cluster_size
+        cx, cy = grid_x // size, grid_y // size
+        self.dirty_clusters.add(cy * self.clusters_x + cx)
+        # 경계 타일이면 그 경계의 출입구도 바뀜
+        if grid_x % size == size - 1 and cx + 1 < self.clusters_x:
+            self.dirty_borders.add((cx, cy, EAST))
+        if grid_x % size == 0 and cx > 0:
+            self.dirty_borders.add((cx - 1, cy, EAST))
+        if grid_y % size == size - 1 and cy + 1 < self.clusters_y:
+            self.dirty_borders.add((cx, cy, NORTH))
+        if grid_y % size == 0 and cy > 0:
+            self.dirty_borders.add((cx, cy - 1, NORTH))
+
+    def update_dirty(self):
+        """표시된 경계와 클러스터만 다시 계산하고, 그 클러스터를 지나는 캐시 항목 제거"""
+        if self.needs_rebuild:
+            self.rebuild()
+            return
+        if not self.dirty_clusters and not self.dirty_borders:
+            return
+
+        clusters = set(self.dirty_clusters)
+        for key in self.dirty_borders:
+            self.build_border(key)
+            cx, cy, direction = key
+            clusters.add(cy * self.clusters_x + cx)
+            clusters.add(cy * self.clusters_x + cx + 1 if direction == EAST else (cy + 1) * self.clusters_x + cx)
+        for cluster in clusters:
+            self.build_cluster(cluster)
+        self.links_cache.clear()
+
+        stale = [key for key, (nodes, passed) in self.cache.items() if not passed.isdisjoint(clusters)]
+        for key in stale:
+            del self.cache[key]
+        self.dirty_clusters.clear()
+        self.dirty_borders.clear()
+
+    #------------------------------------------------------------
+    # 클러스터 안 탐색
+    def search(self, start, links, goals):
+        """클러스터 연결(links) 위의 Dijkstra - 도달한 goals까지의 비용 {타일: 비용} (모두 찾으면 중단)"""
+        found = {}
+        remaining = set(goals)
+        if start in remaining:
+            found[start] = 0
+            remaining.discard(start)
+        cost = {start: 0}
+        queue = [(0, start)]
+        while queue and remaining:
+            current_cost, index = heapq.heappop(queue)
+            if current_cost > cost[index]:
+                continue
+            if index in remaining:
+                found[index] = current_cost
+                remaining.discard(index)
+            for neighbor, step_cost in links[index]:
+                new_cost = current_cost + step_cost
+                if new_cost < cost.get(neighbor, new_cost + 1):
+                    cost[neighbor] = new_cost
+                    heapq.heappush(queue, (new_cost, neighbor))
+        return found
+
+    def local_search(self, start, goal, links):
+        """클러스터 연결(links) 위의 A* - 타일 번호 경로 (없으면 None)"""
+        width = self.width
+        gx, gy = goal % width, goal // width
+        cost = {start: 0}
+        came_from = {start: None}
+        queue = [(octile(start % width, start // width, gx, gy), 0, start)]
+        while queue:
+            _, current_cost, index = heapq.heappop(queue)
+            if index == goal:
+                path = []
+                while index is not None:
+                    path.append(index)
+                    index = came_from[index]
+                path.reverse()
+                return path
+            if current_cost > cost[index]:
+                continue
+            for neighbor, step_cost in links[index]:
+                new_cost = current_cost + step_cost
+                if new_cost < cost.get(neighbor, new_cost + 1):
+                    cost[neighbor] = new_cost
+                    came_from[neighbor] = index
+                    priority = new_cost + octile(neighbor % width, neighbor // width, gx, gy)
+                    heapq.heappush(queue, (priority, new_cost, neighbor))
+        return None
+
+    def query_links(self, cluster):
+        """질의에서 쓰는 클러스터 안 타일 연결 (최근 LINKS_CACHE_SIZE개 클러스터는 다시 만들지 않음)"""
+        links = self.links_cache.get(cluster)
+        if links is None:
+            links = self.links_cache[cluster] = self.cluster_links(cluster)
+            if len(self.links_cache) > LINKS_CACHE_SIZE:
+                self.links_cache.popitem(last=False)
+        else:
+            self.links_cache.move_to_end(cluster)
+        return links
+
+    def local_path(self, start, goal):
+        """
+        이웃한 경유 타일 사이의 세부 경로 (find_path 결과를 구간별로 펼칠 때 사용)
+
+        Args:
+            start, goal: 타일 좌표 (grid_x, grid_y)
+
+        Returns:
+            list: 타일 좌표 목록 (start, goal 포함), 길이 없으면 None
+        """
+        self.update_dirty()
+        a = start[1] * self.width + start[0]
+        b = goal[1] * self.width + goal[0]
+        cluster = self.cluster_of(a)
+        if cluster != self.cluster_of(b):
+            # 경계를 사이에 둔 출입구 한 쌍
+            return [start, goal] if b in self.inter.get(a, ()) else None
+        if self.component[a] != self.component[b]:
+            return None
+        path = self.local_search(a, b, self.query_links(cluster))
+        return self.to_coords(path) if path else None
+
+    #------------------------------------------------------------
+    # 경로 찾기
+    def find_path(self, start, goal):
+        """
+        start에서 goal까지의 경유 타일 목록
+
+        Args:
+            start, goal: 타일 좌표 (grid_x, grid_y)
+
+        Returns:
+            list: 타일 좌표 목록 (시작, 출입구들, 목표), 길이 없으면 None
+        """
+        self.update_dirty()
+        width = self.width
+        if not (0 <= start[0] < width and 0 <= start[1] < self.height
+                and 0 <= goal[0] < width and 0 <= goal[1] < self.height):
+            return None
+        s = start[1] * width + start[0]
+        g = goal[1] * width + goal[0]
+        if self.blocked[s] or self.blocked[g]:
+            return None
+
+        component = self.component
+        start_cluster, goal_cluster = self.cluster_of(s), self.cluster_of(g)
+        if start_cluster == goal_cluster and component[s] == component[g]:
+            # 같은 클러스터 안에서 바로 갈 수 있음 (세부 경로는 local_path)
+            return self.to_coords([s, g])
+
+        # 같은 클러스터 쌍의 최근 경로: 시작/목표가 캐시된 양 끝 출입구와 같은 영역이면 그대로 사용
+        key = (start_cluster, goal_cluster)
+        entry = self.cache.get(key) if start_cluster != goal_cluster else None
+        if entry is not None:
+            nodes = entry[0]
+            if component[s] == component[nodes[0]] and component[g] == component[nodes[-1]]:
+                self.cache.move_to_end(key)
+                self.cache_hits += 1
+                path = list(nodes)
+                if path[0] != s:
+                    path.insert(0, s)
+                if path[-1] != g:
+                    path.append(g)
+                return self.to_coords(path)
+        self.cache_misses += 1
+
+        path = self.abstract_search(s, g, start_cluster, goal_cluster)
+        if path is None:
+            return None
+        if start_cluster != goal_cluster:
+            # 양 끝 출입구는 시작/목표 클러스터 안에 있어야 다음 질의가 쓸 수 있음
+            # (시작/목표 타일이 출입구여서 바로 경계를 건넌 경로는 그 타일을 양 끝 출입구로 저장)
+            nodes = path[1:-1]
+            if not nodes or self.cluster_of(nodes[0]) != start_cluster:
+                nodes.insert(0, s)
+            if self.cluster_of(nodes[-1]) != goal_cluster:
+                nodes.append(g)
+            self.store(key, tuple(nodes))
+        return self.to_coords(path)
+
+    def abstract_search(self, s, g, start_cluster, goal_cluster):
+        """시작/목표를 출입구에 연결한 추상 그래프에서 A* - 타일 번호 경로 (없으면 None)"""
+        start_links = self.search(s, self.query_links(start_cluster), self.reachable_nodes(s, start_cluster))
+        goal_links = self.search(g, self.query_links(goal_cluster), self.reachable_nodes(g, goal_cluster))
+        if not start_links or not goal_links:
+            return None
+
+        width, adjacency = self.width, self.adjacency
+        gx, gy = g % width, g // width
+        cost = {s: 0}
+        came_from = {s: None}
+        queue = [(octile(s % width, s // width, gx, gy), 0, s)]
+        while queue:
+            _, current_cost, node = heapq.heappop(queue)
+            if node == g:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = came_from[node]
+                path.reverse()
+                return path
+            if current_cost > cost[node]:
+                continue
+
+            # 시작 타일이 출입구이기도 하면 출입구 연결도 함께 따라감
+            neighbors = adjacency.get(node, ())
+            if node == s:
+                neighbors += tuple(start_links.items())
+            if node in goal_links:
+                neighbors += ((g, goal_links[node]),)
+            for neighbor, step_cost in neighbors:
+                new_cost = current_cost + step_cost
+                if new_cost < cost.get(neighbor, new_cost + 1):
+                    cost[neighbor] = new_cost
+                    came_from[neighbor] = node
+                    priority = new_cost + octile(neighbor % width, neighbor // width, gx, gy)
+                    heapq.heappush(queue, (priority, new_cost, neighbor))
+        return None
+
+    def reachable_nodes(self, index, cluster):
+        """클러스터의 출입구 중 index와 같은 영역에 있는 것"""
+        label = self.component[index]
+        return [node for node in self.cluster_nodes(cluster) if self.component[node] == label]
+
+    def store(self, key, nodes):
+        """캐시에 출입구 경로 저장 (가장 오래 쓰지 않은 항목부터 제거)"""
+        passed = frozenset(self.cluster_of(node) for node in nodes)
+        self.cache[key] = (nodes, passed)
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def to_coords(self, path):
+        """타일 번호 경로를 타일 좌표 목록으로"""
+        width = self.width
+        return [(index % width, index // width) for index in path]
+#----------------------------------------------------------------
@@ -0,0 +1,102 @@
+"""
+입력 기록/재생 - 플레이 세션을 프레임 단위로 똑같이 재현
+- 프레임마다 delta time과 정규화된 입력 이벤트(event_pump.InputEvent)를 바이너리 파일로 기록
+- 재생 시 get_events() 대신 기록된 이벤트와 delta를 그대로 공급
+- random 모듈 시드를 파일 헤더에 저장해 몬스터 AI의 무작위 선택까지 재현
+
+파일 형식 (리틀 엔디안):
+    헤더: 매직(8바이트) + 버전(uint16) + 시드(uint64)
+    프레임: delta(double) + 이벤트 수(uint16)
+    이벤트: type(uint32) + key, button, x, y (int32, 값이 없으면 NONE_VALUE)
+"""
+import struct
+import random
+from event_pump import InputEvent
+
+MAGIC = b'2DGPREC\x00'
+VERSION = 1
+NONE_VALUE = -2 ** 31  # None을 나타내는 int32 값
+
+HEADER = struct.Struct('<8sHQ')
+FRAME = struct.Struct('<dH')
+EVENT = struct.Struct('<Iiiii')
+
+def _pack_optional(value):
+    return NONE_VALUE if value is None else int(value)
+
+def _unpack_optional(value):
+    return None if value == NONE_VALUE else value
+
+def new_seed():
+    """새 무작위 시드 생성"""
+    return random.SystemRandom().getrandbits(63)
+
+#----------------------------------------------------------------
+class InputRecorder:
+    """프레임 단위 입력 기록기"""
+
+    def __init__(self, path, seed):
+        self.path = path
+        self.seed = seed
+        self.frame_count = 0
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed))
+
+    def record_frame(self, delta_time, events):
+        """한 프레임의 delta와 이벤트 목록 기록"""
+        write = self.file.write
+        write(FRAME.pack(delta_time, len(events)))
+        for event in events:
+            write(EVENT.pack(event.type,
+                             _pack_optional(event.key), _pack_optional(event.button),
+                             _pack_optional(event.x), _pack_optional(event.y)))
+        self.frame_count += 1
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+            print(f'입력 기록 저장: {self.path} ({self.frame_count} 프레임, 시드 {self.seed})')
+#----------------------------------------------------------------
+class InputReplay:
+    """기록된 입력 재생기"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = f.read()
+
+        magic, version, seed = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f'입력 기록 파일이 아닙니다: {path}')
+        if version != VERSION:
+            raise ValueError(f'지원하지 않는 입력 기록 버전: {version}')
+
+        self.seed = seed
+        self.offset = HEADER.size
+        self.frame_count = 0
+
+    def is_finished(self):
+        return self.offset >= len(self.data)
+
+    def next_frame(self):
+        """
+        다음 프레임의 (delta, 이벤트 목록) 반환
+        기록이 끝났으면 None 반환
+        """
+        if self.is_finished():
+            return None
+
+        delta_time, event_count = FRAME.unpack_from(self.data, self.offset)
+        self.offset += FRAME.size
+
+        events = []
+        for _ in range(event_count):
+            event_type, key, button, x, y = EVENT.unpack_from(self.data, self.offset)
+            self.offset += EVENT.size
+            events.append(InputEvent(event_type, _unpack_optional(key), _unpack_optional(button),
+                                     _unpack_optional(x), _unpack_optional(y)))
+
+        self.frame_count += 1
+        return delta_time, events
+#----------------------------------------------------------------
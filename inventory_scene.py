@@ -4,6 +4,9 @@
 from pico2d import *
 import game_framework
 
+# Scene 렌더링 속성
+opaque = False  # 오버레이 scene (아래 scene도 함께 그림)
+
 def enter():
     """Scene 진입 시 호출"""
     pass
@@ -31,7 +34,7 @@ def update(delta_time):
     """업데이트"""
     pass
 
-def draw():
+def draw(alpha=1.0):
     """렌더링 - 인벤토리 창"""
     # 캔버스 크기 가져오기
     canvas_width = get_canvas_width()
@@ -1,8 +1,90 @@
 """
 게임 메인 진입점 - Scene 시스템 사용
+
+사용법:
+    python main.py                          # 일반 실행 (타이틀 scene부터)
+    python main.py --headless --ticks 10000 # 창 없이 play_scene을 10000틱 실행
+    python main.py --headless --seconds 60  # 창 없이 play_scene을 시뮬레이션 60초 실행
+    python main.py --profile profile.csv    # 프레임 단계별 프로파일링 (F11 오버레이, F12 즉시 저장)
+    python main.py --hitch-report hitch.txt # 33ms를 넘는 프레임의 스택 샘플 요약 기록 (--hitch-ms로 임계값 변경)
+    python main.py --trace trace.txt        # 상태 전이를 링 버퍼에 기록하고 종료 시 저장
+    python main.py --record session.rec     # 입력과 시드를 기록
+    python main.py --replay session.rec     # 기록된 세션을 그대로 재생 (--headless와 함께 사용 가능)
+    python main.py --horde 10000            # NumPy 일괄 시뮬레이션 몬스터 10000마리 추가 (--headless와 함께 사용 가능)
 """
+import time
+STARTUP_BEGIN = time.perf_counter()  # 시작 타임라인 기준 시각 (import 전에 기록)
+
+import argparse
 import game_framework
-import title_scene
 
-# 게임 시작 - 타이틀 scene부터 시작
-game_framework.run(title_scene)
+# scene 모듈은 필요할 때 이름으로 로드 (play_scene 등은 타이틀 화면이 뜬 뒤에 import)
+game_framework.begin_startup_timeline(STARTUP_BEGIN)
+game_framework.mark_startup('import')
+
+def seed_arg(text):
+    """--seed 값 검사 (입력 기록 파일 헤더에 uint64로 저장되므로 0 이상 2^64 미만의 정수)"""
+    seed = int(text)
+    if not 0 <= seed < 2 ** 64:
+        raise argparse.ArgumentTypeError(f'시드는 0 이상 2^64 미만의 정수여야 합니다: {text}')
+    return seed
+
+parser = argparse.ArgumentParser(description='2DGP Project')
+parser.add_argument('--headless', action='store_true', help='창 없이 play_scene 시뮬레이션만 실행')
+parser.add_argument('--ticks', type=int, default=None, help='headless 모드에서 실행할 틱 수')
+parser.add_argument('--seconds', type=float, default=None, help='headless 모드에서 실행할 시뮬레이션 시간 (초)')
+parser.add_argument('--profile', metavar='PATH', default=None, help='프레임 프로파일링 후 종료 시 PATH(.csv/.json)로 저장')
+parser.add_argument('--hitch-report', metavar='PATH', default=None, help='히치 프레임의 스택 샘플 요약을 PATH에 기록')
+parser.add_argument('--hitch-ms', type=float, default=1000 / 30, help='히치로 판단할 프레임 작업 시간 (ms)')
+parser.add_argument('--trace', metavar='PATH', default=None, help='상태 전이 기록을 종료 시 PATH에 저장')
+parser.add_argument('--record', metavar='PATH', default=None, help='입력과 random 시드를 PATH에 기록')
+parser.add_argument('--replay', metavar='PATH', default=None, help='PATH에 기록된 입력을 재생')
+parser.add_argument('--seed', type=seed_arg, default=None, help='random 시드 고정 (0 이상의 정수)')
+parser.add_argument('--horde', type=int, default=0, help='play_scene에 추가할 일괄 시뮬레이션 몬스터 수 (NumPy 필요)')
+args = parser.parse_args()
+if args.record and args.headless:
+    parser.error('--record는 창 모드에서만 사용할 수 있습니다 (headless 실행에는 기록할 입력이 없음)')
+if args.record and args.replay:
+    parser.error('--record와 --replay는 함께 사용할 수 없습니다')
+
+if args.horde:
+    # 무리를 요청한 경우에만 play_scene을 미리 import (기본 시작 경로는 지연 로딩 유지)
+    import play_scene
+    play_scene.horde_size = args.horde
+
+if args.trace:
+    import transition_trace
+    transition_trace.enable()
+
+if args.headless:
+    ticks = args.ticks
+    if ticks is None and args.seconds is None:
+        ticks = 10000
+    if args.replay:
+        # 기록은 타이틀 scene부터 시작하므로 재생도 타이틀부터
+        stats = game_framework.run_headless('title_scene', replay_path=args.replay)
+    else:
+        stats = game_framework.run_headless('play_scene', ticks=ticks, seconds=args.seconds, seed=args.seed)
+    print(f"headless 실행 완료: {stats['ticks']}틱 (시뮬레이션 {stats['sim_seconds']:.1f}초) / "
+          f"실제 {stats['wall_seconds']:.2f}초")
+    print(f"  처리량: {stats['ticks_per_second']:.0f}틱/초, "
+          f"평균 {stats['mean_tick_ms']:.3f}ms, 최대 {stats['max_tick_ms']:.3f}ms, "
+          f"scene 진입 {stats['enter_seconds'] * 1000:.1f}ms, 시드 {stats['seed']}")
+else:
+    if args.profile:
+        game_framework.enable_profiler(overlay=True, dump_path=args.profile)
+    if args.hitch_report:
+        game_framework.enable_hitch_detector(args.hitch_ms / 1000, args.hitch_report)
+    if args.replay:
+        game_framework.start_replay(args.replay)
+    elif args.record:
+        game_framework.start_recording(args.record, args.seed)
+    elif args.seed is not None:
+        import random
+        random.seed(args.seed)
+
+    # 게임 시작 - 타이틀 scene부터 시작
+    game_framework.run('title_scene')
+
+if args.trace:
+    transition_trace.dump(args.trace)
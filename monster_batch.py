@@ -0,0 +1,316 @@
+"""
+몬스터 일괄 시뮬레이션 - 대규모 Gnome 무리를 NumPy 배열로 한 번에 갱신 (선택 기능, NumPy 필요)
+- 위치, 이동 방향, 상태, 상태 타이머, 쿨다운, 체력을 몬스터별 객체가 아닌 필드별 배열로 보관
+- 배회/추적/공격/쿨다운 규칙은 Gnome 상태 객체와 같고, 틱마다 모든 몬스터에 몇 번의 벡터 연산으로 적용
+- 그리기는 화면 안에 있는 몬스터만 골라서 수행
+- 타일맵 충돌은 TileMap.check_collision_batch로 무리 전체를 한 번에 검사 (일반 몬스터와 같은 축별 슬라이딩)
+- NumPy가 없으면 AVAILABLE이 False이고 play_scene은 무리를 만들지 않음
+"""
+import random
+from resource_manager import load_image, release_image
+from gnome import (Gnome, IDLE_CLIP, RUN_CLIP, ATTACK_CLIP, PIXEL_WIDTH, PIXEL_HEIGHT,
+                   COLLISION_HALF_WIDTH, COLLISION_HALF_HEIGHT,
+                   ATTACK_BOX_OFFSET_X, ATTACK_BOX_OFFSET_Y, ATTACK_BOX_WIDTH, ATTACK_BOX_HEIGHT,
+                   DETECTION_RANGE, ATTACK_DETECTION_RANGE, ATTACK_Y_TOLERANCE,
+                   MOVE_SPEED, CHASE_SPEED, ATTACK_COOLDOWN, MAX_HP)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AVAILABLE = np is not None
+
+# 상태 번호
+IDLE, RUN, CHASE, ATTACK = 0, 1, 2, 3
+
+# 상태 지속 시간 (Gnome 상태 객체와 동일)
+IDLE_TIME = Gnome.IDLE.max_idle_time
+RUN_TIME = Gnome.RUN.max_run_time
+ATTACK_TIME = Gnome.ATTACK.max_attack_time
+
+# 상태별 애니메이션 클립 (Gnome 상태 객체와 같은 클립)
+STATE_CLIPS = (IDLE_CLIP, RUN_CLIP, RUN_CLIP, ATTACK_CLIP)
+STATE_FRAMES = tuple(clip.frame_count for clip in STATE_CLIPS)
+STATE_ANIMATION_SPEED = tuple(clip.fps for clip in STATE_CLIPS)
+
+# 공격 판정 프레임 (Gnome 공격 클립의 'hit' 구간)
+ATTACK_HIT_FRAME_START, ATTACK_HIT_FRAME_END = ATTACK_CLIP.events['hit']
+
+ATTACK_POWER = 15        # Gnome과 동일
+KNOCKBACK_DISTANCE = 20  # 피격 시 밀려나는 거리
+PLACE_ATTEMPTS = 10      # 충돌 타일 위에 생성된 몬스터의 위치를 다시 뽑는 최대 횟수
+
+# 배회 방향 (8방향, 대각선은 속도 보정)
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+# 몬스터 수가 바뀔 때(사망 제거) 함께 줄여야 하는 배열 필드
+ARRAY_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'vx', 'vy', 'face_dir', 'frame',
+                'state', 'state_time', 'cooldown', 'hp', 'has_hit')
+
+#----------------------------------------------------------------
+class MonsterBatch:
+    """배열 구조체(SoA) 기반 Gnome 무리"""
+
+    def __init__(self, count, bounds, seed=None, tilemap=None):
+        """
+        count: 몬스터 수
+        bounds: 생성 영역 (left, bottom, right, top)
+        seed: NumPy 난수 시드 (None이면 random 모듈에서 뽑음 - 입력 재생 시드를 따르도록)
+        tilemap: 주면 충돌 타일과 겹치는 생성 위치를 다시 뽑음 (충돌 타일 안에서는 슬라이딩으로 빠져나올 수 없음)
+        """
+        if seed is None:
+            seed = random.getrandbits(63)
+        self.rng = np.random.default_rng(seed)
+
+        left, bottom, right, top = bounds
+        self.count = count
+        self.x = self.rng.uniform(left, right, count)
+        self.y = self.rng.uniform(bottom, top, count)
+        if tilemap is not None:
+            width = np.full(count, COLLISION_HALF_WIDTH * 2)
+            height = np.full(count, COLLISION_HALF_HEIGHT * 2)
+            for _ in range(PLACE_ATTEMPTS):
+                inside = np.flatnonzero(tilemap.check_collision_batch(self.x, self.y, width, height))
+                if len(inside) == 0:
+                    break
+                self.x[inside] = self.rng.uniform(left, right, len(inside))
+                self.y[inside] = self.rng.uniform(bottom, top, len(inside))
+        self.prev_x = self.x.copy()  # 이전 시뮬레이션 스텝 위치 (렌더 보간용)
+        self.prev_y = self.y.copy()
+        self.vx = np.zeros(count)  # 배회 속도 (RUN 상태에서만 사용)
+        self.vy = np.zeros(count)
+        self.face_dir = np.ones(count, dtype=np.int8)
+        self.frame = np.zeros(count)
+        self.state = np.full(count, IDLE, dtype=np.int8)
+        self.state_time = np.full(count, IDLE_TIME)  # 현재 상태의 남은 시간
+        self.cooldown = np.zeros(count)              # 공격 쿨다운 남은 시간 (0이면 공격 가능)
+        self.hp = np.full(count, MAX_HP, dtype=np.int32)
+        self.has_hit = np.zeros(count, dtype=bool)  # 이번 공격에서 이미 데미지를 줬는지
+
+        # 플레이어 공격별로 이미 맞은 몬스터 (id(공격자) -> bool 배열), 공격이 끝나면 제거
+        self.hit_masks = {}
+
+        # 상태별 조회 테이블
+        self.frames_by_state = np.array(STATE_FRAMES, dtype=np.float64)
+        self.speed_by_state = np.array(STATE_ANIMATION_SPEED, dtype=np.float64)
+        velocity = np.array(DIRECTIONS, dtype=np.float64) * MOVE_SPEED
+        velocity[np.all(velocity != 0, axis=1)] /= 1.414
+        self.direction_velocity = velocity
+
+        # 모든 몬스터가 같은 이미지를 공유 (Gnome과 같은 캐시 항목)
+        images = {name: load_image(path) for name, path in Gnome.IMAGE_FILES.items()}
+        self.images_by_state = (images['imageI'], images['imageR'], images['imageR'], images['imageA'])
+
+    def update(self, delta_time, target):
+        """모든 몬스터를 한 스텝 진행 - target은 추적/공격 대상 캐릭터 (None이면 배회만)"""
+        if self.count == 0:
+            return
+
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+
+        state = self.state
+        idle = state == IDLE
+        run = state == RUN
+        chase = state == CHASE
+        attack = state == ATTACK
+
+        # 타이머 감소 (쿨다운 중인 IDLE은 배회 대기 시간을 세지 않음)
+        np.maximum(self.cooldown - delta_time, 0.0, out=self.cooldown)
+        ready = self.cooldown <= 0.0
+        self.state_time -= delta_time * (~idle | ready)
+        expired = self.state_time <= 0.0
+
+        # 캐릭터와의 거리
+        if target is not None:
+            dx = target.x - self.x
+            dy = target.y - self.y
+            distance = np.hypot(dx, dy)
+            sees = distance < DETECTION_RANGE
+            close = distance < ATTACK_DETECTION_RANGE
+            reach = (np.abs(dx) < ATTACK_DETECTION_RANGE) & (np.abs(dy) <= ATTACK_Y_TOLERANCE)
+            has_target = True
+        else:
+            dx = dy = distance = None
+            sees = close = reach = np.zeros(self.count, dtype=bool)
+            has_target = False
+
+        # 상태 전이 (모두 이번 스텝 시작 상태 기준으로 계산 - GnomeIdle/Run/Chase/Attack.do와 같은 규칙)
+        roaming = idle | run
+        to_attack = (roaming & ready & close) | (chase & ready & sees & reach)
+        to_chase = roaming & ready & sees & ~close
+        to_idle = (attack & expired) | (chase & ~(sees & ready))
+        if has_target:
+            to_idle |= run & ~ready
+        to_idle |= run & expired & ~to_attack & ~to_chase
+        to_run = idle & ready & expired & ~to_attack & ~to_chase
+        changed = to_attack | to_chase | to_idle | to_run
+
+        if changed.any():
+            self.frame[changed] = 0.0
+
+            # 공격이 끝나면 쿨다운 시작
+            self.cooldown[attack & to_idle] = ATTACK_COOLDOWN
+
+            state[to_idle] = IDLE
+            self.state_time[to_idle] = IDLE_TIME
+
+            state[to_chase] = CHASE
+
+            state[to_attack] = ATTACK
+            self.state_time[to_attack] = ATTACK_TIME
+            self.has_hit[to_attack] = False
+
+            if to_run.any():
+                state[to_run] = RUN
+                self.state_time[to_run] = RUN_TIME
+                picks = self.rng.integers(0, len(DIRECTIONS), int(to_run.sum()))
+                velocity = self.direction_velocity[picks]
+                self.vx[to_run] = velocity[:, 0]
+                self.vy[to_run] = velocity[:, 1]
+                face = np.sign(velocity[:, 0]).astype(np.int8)
+                self.face_dir[to_run] = np.where(face != 0, face, self.face_dir[to_run])
+
+        stay = ~changed
+
+        # 배회 이동 (전이한 스텝에는 움직이지 않음 - 기존 상태들이 전이 후 바로 return하는 것과 동일)
+        moving = stay & run
+        self.x += self.vx * (delta_time * moving)
+        self.y += self.vy * (delta_time * moving)
+
+        # 추적 이동
+        if has_target:
+            chasing = stay & chase & (distance > 0)
+            if chasing.any():
+                step = np.divide(CHASE_SPEED * delta_time, distance, out=np.zeros(self.count), where=chasing)
+                self.x += dx * step
+                self.y += dy * step
+                self.face_dir[chasing & (dx > 0)] = 1
+                self.face_dir[chasing & (dx < 0)] = -1
+
+        # 애니메이션 (공격은 마지막 프레임에 고정)
+        frames = self.frames_by_state[state]
+        self.frame += self.speed_by_state[state] * delta_time
+        looping = state != ATTACK
+        np.fmod(self.frame, frames, out=self.frame, where=looping)
+        np.minimum(self.frame, frames - 0.01, out=self.frame, where=~looping)
+
+        # 공격 판정 (판정 프레임 동안 공격 박스가 캐릭터와 겹치면 공격당 한 번 데미지)
+        if has_target:
+            self.apply_monster_attacks(target)
+
+    def resolve_tile_collisions(self, tilemap):
+        """
+        이번 스텝 이동으로 타일 충돌박스에 들어간 몬스터를 축별로 이전 위치에 되돌림 (play_scene.resolve_tile_collisions와 같은 규칙)
+        - 새 위치에서 충돌하면 x만 움직인 위치와 y만 움직인 위치를 검사해 막힌 축만 이전 위치(prev_x, prev_y)로 되돌림
+        """
+        if self.count == 0 or tilemap is None:
+            return
+
+        width = np.full(self.count, COLLISION_HALF_WIDTH * 2)
+        height = np.full(self.count, COLLISION_HALF_HEIGHT * 2)
+        hits = np.asarray(tilemap.check_collision_batch(self.x, self.y, width, height))
+        if not hits.any():
+            return
+
+        # 앞 절반은 x만 움직인 위치, 뒤 절반은 y만 움직인 위치
+        index = np.flatnonzero(hits)
+        count = len(index)
+        x, y = self.x[index], self.y[index]
+        prev_x, prev_y = self.prev_x[index], self.prev_y[index]
+        hits = np.asarray(tilemap.check_collision_batch(np.concatenate((x, prev_x)), np.concatenate((prev_y, y)),
+                                                        np.resize(width[index], count * 2),
+                                                        np.resize(height[index], count * 2)))
+        self.x[index] = np.where(hits[:count], prev_x, x)
+        self.y[index] = np.where(hits[count:], prev_y, y)
+
+    def apply_monster_attacks(self, target):
+        """판정 프레임인 공격 중 몬스터의 공격 박스와 target 충돌 처리"""
+        frame_index = self.frame.astype(np.int32)
+        striking = ((self.state == ATTACK) & ~self.has_hit &
+                    (frame_index >= ATTACK_HIT_FRAME_START) & (frame_index <= ATTACK_HIT_FRAME_END))
+        if not striking.any():
+            return
+
+        center_x = self.x + ATTACK_BOX_OFFSET_X * self.face_dir
+        center_y = self.y + ATTACK_BOX_OFFSET_Y
+        left, bottom, right, top = target.get_bb()
+        hits = striking & self.overlaps(center_x, center_y, ATTACK_BOX_WIDTH // 2, ATTACK_BOX_HEIGHT // 2,
+                                        left, bottom, right, top)
+        if not hits.any():
+            return
+
+        self.has_hit |= hits
+        for index in np.flatnonzero(hits):
+            target.take_damage(ATTACK_POWER, float(self.x[index]))
+
+    @staticmethod
+    def overlaps(center_x, center_y, half_width, half_height, left, bottom, right, top):
+        """중심/반크기 배열로 주어진 박스들과 한 박스의 충돌 여부 (play_scene.collide_bb와 같은 경계 처리)"""
+        return ((center_x - half_width <= right) & (center_x + half_width >= left) &
+                (center_y - half_height <= top) & (center_y + half_height >= bottom))
+
+    def apply_attack(self, attacker, attack_bb, attack_power):
+        """
+        플레이어 공격 처리 - attack_bb와 겹치는 몬스터에 데미지와 넉백 적용
+        같은 공격(attack_bb가 None이 될 때까지)에서는 몬스터마다 한 번만 맞음
+        """
+        key = id(attacker)
+        if not attack_bb or attack_power <= 0:
+            self.hit_masks.pop(key, None)
+            return 0
+
+        hit_mask = self.hit_masks.get(key)
+        if hit_mask is None:
+            hit_mask = self.hit_masks[key] = np.zeros(self.count, dtype=bool)
+
+        left, bottom, right, top = attack_bb
+        hits = self.overlaps(self.x, self.y, COLLISION_HALF_WIDTH, COLLISION_HALF_HEIGHT,
+                             left, bottom, right, top) & ~hit_mask
+        hit_count = int(hits.sum())
+        if hit_count:
+            hit_mask |= hits
+            self.hp[hits] -= attack_power
+            self.x[hits] += np.where(self.x[hits] > attacker.x, KNOCKBACK_DISTANCE, -KNOCKBACK_DISTANCE)
+        return hit_count
+
+    def remove_dead(self):
+        """체력이 0 이하인 몬스터를 배열에서 제거하고 제거한 수 반환"""
+        alive = self.hp > 0
+        removed = self.count - int(alive.sum())
+        if removed:
+            for name in ARRAY_FIELDS:
+                setattr(self, name, getattr(self, name)[alive])
+            for key in self.hit_masks:
+                self.hit_masks[key] = self.hit_masks[key][alive]
+            self.count -= removed
+        return removed
+
+    def release_images(self):
+        """이미지 참조 반환 (play_scene.exit에서 호출)"""
+        for path in Gnome.IMAGE_FILES.values():
+            release_image(path)
+
+    def draw(self, camera, alpha=1.0):
+        """화면 안의 몬스터만 보간 위치에 그리기"""
+        if self.count == 0:
+            return
+
+        draw_x = self.prev_x + (self.x - self.prev_x) * alpha - camera.x
+        draw_y = self.prev_y + (self.y - self.prev_y) * alpha - camera.y
+        margin_x, margin_y = PIXEL_WIDTH // 2, PIXEL_HEIGHT // 2
+        visible = np.flatnonzero((draw_x > -margin_x) & (draw_x < camera.canvas_width + margin_x) &
+                                 (draw_y > -margin_y) & (draw_y < camera.canvas_height + margin_y))
+
+        images = self.images_by_state
+        for index in visible:
+            image = images[self.state[index]]
+            left = int(self.frame[index]) * PIXEL_WIDTH
+            screen_x, screen_y = float(draw_x[index]), float(draw_y[index])
+            if self.face_dir[index] == 1:
+                image.clip_draw(left, 0, PIXEL_WIDTH, PIXEL_HEIGHT, screen_x, screen_y)
+            else:
+                image.clip_composite_draw(left, 0, PIXEL_WIDTH, PIXEL_HEIGHT, 0, 'h',
+                                          screen_x, screen_y, PIXEL_WIDTH, PIXEL_HEIGHT)
+#----------------------------------------------------------------
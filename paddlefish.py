@@ -1,5 +1,10 @@
 from pico2d import *
 from state_machine import StateMachine
+from entity import Entity
+from animation import AnimationClip, ONCE
+from event_check import timeout
+import timer_wheel
+import flow_field
 import random
 import math
 
@@ -60,341 +65,297 @@ MAX_HP = 80
 ATTACK_POWER = 12
 # ============================================================
 
+# 애니메이션 클립 (시트별로 한 번 만들어 모든 Paddlefish가 공유, 추적은 달리기 시트를 더 빠르게 재생)
+IDLE_CLIP = AnimationClip(IDLE_FRAMES, IDLE_ANIMATION_SPEED, PIXEL_WIDTH, PIXEL_HEIGHT)
+RUN_CLIP = AnimationClip(RUN_FRAMES, RUN_ANIMATION_SPEED, PIXEL_WIDTH, PIXEL_HEIGHT)
+CHASE_CLIP = AnimationClip(RUN_FRAMES, CHASE_ANIMATION_SPEED, PIXEL_WIDTH, PIXEL_HEIGHT)
+ATTACK_CLIP = AnimationClip(ATTACK_FRAMES, ATTACK_ANIMATION_SPEED, PIXEL_WIDTH, PIXEL_HEIGHT, ONCE,
+                            events={'hit': (ATTACK_HIT_FRAME_START, ATTACK_HIT_FRAME_END)})
+
 class PaddlefishIdle:
     """Paddlefish의 대기 상태"""
-    def __init__(self, paddlefish):
-        self.paddlefish = paddlefish
-        self.animation_speed = IDLE_ANIMATION_SPEED
-        self.idle_time = 0
+    def __init__(self):
+        self.clip = IDLE_CLIP
         self.max_idle_time = IDLE_DURATION
 
-    def enter(self, e):
-        self.paddlefish.frame = 0
-        self.paddlefish.dirx = 0
-        self.paddlefish.diry = 0
-        self.idle_time = 0
+    def enter(self, paddlefish, e):
+        paddlefish.frame = 0
+        paddlefish.dirx = 0
+        paddlefish.diry = 0
+        self.start_wait(paddlefish)
 
-    def exit(self, e):
+    def exit(self, paddlefish, e):
         pass
 
-    def do(self, delta_time):
-        self.paddlefish.frame = (self.paddlefish.frame + self.animation_speed * delta_time) % IDLE_FRAMES
+    def start_wait(self, paddlefish):
+        """대기 시간 타이머 시작 (추적 중이거나 쿨다운 중이면 배회하지 않으므로 그것이 끝날 때 시작)"""
+        if not paddlefish.is_chasing and paddlefish.cooldown_timer is None:
+            paddlefish.state_machine.start_timer(self.max_idle_time)
 
-        # 쿨다운 감소
-        if self.paddlefish.attack_cooldown > 0:
-            self.paddlefish.attack_cooldown -= delta_time
-            if self.paddlefish.attack_cooldown <= 0:
-                self.paddlefish.attack_cooldown = 0
-                print(f"[DEBUG] Paddlefish 쿨다운 종료! 다시 공격 가능")
+    def do(self, paddlefish, delta_time):
+        paddlefish.frame = self.clip.advance(paddlefish.frame, delta_time)
 
         # 추적 모드인지 체크
-        if self.paddlefish.is_chasing:
-            # 추적 시간 감소
-            self.paddlefish.chase_time -= delta_time
-            if self.paddlefish.chase_time <= 0:
-                # 추적 종료
-                self.paddlefish.is_chasing = False
-                print(f"[DEBUG] Paddlefish 추적 종료")
-
+        if paddlefish.is_chasing:
             # 캐릭터 감지 및 상태 전환
-            if self.paddlefish.check_character_in_range():
-                distance = self.paddlefish.get_distance_to_character()
+            if paddlefish.check_character_in_range():
+                distance = paddlefish.get_distance_to_character()
 
                 # 쿨다운 중에는 상태 전환하지 않고 IDLE 유지
-                if self.paddlefish.attack_cooldown > 0:
-                    print(f"[DEBUG] Paddlefish 쿨다운 중... 남은 시간: {self.paddlefish.attack_cooldown:.2f}초")
+                if paddlefish.cooldown_timer is not None:
+                    print(f"[DEBUG] Paddlefish 쿨다운 중... 남은 시간: {timer_wheel.remaining(paddlefish.cooldown_timer):.2f}초")
                     return
 
                 # 쿨다운이 끝났을 때만 상태 전환
                 if distance < ATTACK_DETECTION_RANGE:  # 공격 범위
-                    self.paddlefish.state_machine.cur_state = self.paddlefish.ATTACK
-                    self.paddlefish.ATTACK.enter(('DETECT_CHARACTER', 0))
+                    paddlefish.state_machine.set_state(paddlefish.ATTACK, ('DETECT_CHARACTER', 0))
                     return
                 elif distance < DETECTION_RANGE:  # 추적 범위
-                    self.paddlefish.state_machine.cur_state = self.paddlefish.CHASE
-                    self.paddlefish.CHASE.enter(('DETECT_CHARACTER', 0))
+                    paddlefish.state_machine.set_state(paddlefish.CHASE, ('DETECT_CHARACTER', 0))
                     return
 
-        # 대기 시간 체크 (추적 중이 아니고 쿨다운이 없을 때만)
-        if not self.paddlefish.is_chasing and self.paddlefish.attack_cooldown <= 0:
-            self.idle_time += delta_time
-            if self.idle_time >= self.max_idle_time:
-                # 무작위로 RUN 상태로 전환
-                self.paddlefish.state_machine.cur_state = self.paddlefish.RUN
-                self.paddlefish.RUN.enter(('AUTO_TRANSITION', 0))
-
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.paddlefish.x, self.paddlefish.y)
-        else:
-            screen_x, screen_y = self.paddlefish.x, self.paddlefish.y
-
-        if self.paddlefish.face_dir == 1:
-            self.paddlefish.imageI.clip_draw(int(self.paddlefish.frame) * PIXEL_WIDTH, 0, PIXEL_WIDTH, PIXEL_HEIGHT, screen_x, screen_y)
-        else:
-            self.paddlefish.imageI.clip_composite_draw(int(self.paddlefish.frame) * PIXEL_WIDTH, 0, PIXEL_WIDTH, PIXEL_HEIGHT, 0, 'h', screen_x, screen_y, PIXEL_WIDTH, PIXEL_HEIGHT)
+    def draw(self, paddlefish, camera=None):
+        self.clip.draw(paddlefish.imageI, paddlefish, camera)
 
 #----------------------------------------------------------------
 class PaddlefishAttack:
     """Paddlefish의 공격 상태"""
-    def __init__(self, paddlefish):
-        self.paddlefish = paddlefish
-        self.animation_speed = ATTACK_ANIMATION_SPEED
-        self.attack_time = 0
+    def __init__(self):
+        self.clip = ATTACK_CLIP
         self.max_attack_time = ATTACK_DURATION
 
-    def enter(self, e):
-        self.paddlefish.frame = 0
-        self.attack_time = 0
-        self.paddlefish.dirx = 0
-        self.paddlefish.diry = 0
-        self.has_attacked = False  # 공격 판정을 한 번만 하기 위한 플래그
-        print(f"[DEBUG] Paddlefish ATTACK 상태 진입 (frame: {self.paddlefish.frame})")
-
-    def exit(self, e):
+    def enter(self, paddlefish, e):
+        paddlefish.frame = 0
+        paddlefish.dirx = 0
+        paddlefish.diry = 0
+        paddlefish.state_data.has_attacked = False  # 공격 판정을 한 번만 하기 위한 플래그
+        # 애니메이션이 끝나면 TIMEOUT으로 IDLE 전환
+        paddlefish.state_machine.start_timer(self.max_attack_time)
+        print(f"[DEBUG] Paddlefish ATTACK 상태 진입 (frame: {paddlefish.frame})")
+
+    def exit(self, paddlefish, e):
+        print(f"[DEBUG] Paddlefish 공격 애니메이션 종료 (최종 프레임: {paddlefish.frame:.2f})")
         # 공격 후 쿨다운 시작
-        self.paddlefish.attack_cooldown = ATTACK_COOLDOWN
+        paddlefish.start_cooldown()
         print(f"[DEBUG] Paddlefish ATTACK 종료, {ATTACK_COOLDOWN}초 쿨다운 시작")
 
-    def do(self, delta_time):
-        # 공격 시간 증가
-        self.attack_time += delta_time
-
-        # 애니메이션 프레임 업데이트
-        self.paddlefish.frame = (self.paddlefish.frame + self.animation_speed * delta_time)
+    def do(self, paddlefish, delta_time):
+        # 애니메이션 프레임 업데이트 (ONCE 클립 - 마지막 프레임에서 멈춤)
+        paddlefish.frame = self.clip.advance(paddlefish.frame, delta_time)
 
-        # 애니메이션이 끝까지 재생되도록 보장
-        if self.paddlefish.frame >= ATTACK_FRAMES:
-            self.paddlefish.frame = ATTACK_FRAMES - 0.01
-
-        # 공격 시간이 끝났는지 체크 (애니메이션 완전 재생 보장)
-        if self.attack_time >= self.max_attack_time:
-            print(f"[DEBUG] Paddlefish 공격 애니메이션 종료 (최종 프레임: {self.paddlefish.frame:.2f})")
-            # 한 번의 공격 후 무조건 IDLE로 전환
-            self.paddlefish.state_machine.cur_state = self.paddlefish.IDLE
-            self.paddlefish.IDLE.enter(('AUTO_TRANSITION', 0))
-
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.paddlefish.x, self.paddlefish.y)
-        else:
-            screen_x, screen_y = self.paddlefish.x, self.paddlefish.y
-
-        if self.paddlefish.face_dir == 1:
-            self.paddlefish.imageA.clip_draw(int(self.paddlefish.frame) * PIXEL_WIDTH, 0, PIXEL_WIDTH, PIXEL_HEIGHT, screen_x, screen_y)
-        else:
-            self.paddlefish.imageA.clip_composite_draw(int(self.paddlefish.frame) * PIXEL_WIDTH, 0, PIXEL_WIDTH, PIXEL_HEIGHT, 0, 'h', screen_x, screen_y, PIXEL_WIDTH, PIXEL_HEIGHT)
+    def draw(self, paddlefish, camera=None):
+        self.clip.draw(paddlefish.imageA, paddlefish, camera)
 
 #----------------------------------------------------------------
 class PaddlefishRun:
     """Paddlefish의 배회 상태"""
-    def __init__(self, paddlefish):
-        self.paddlefish = paddlefish
-        self.animation_speed = RUN_ANIMATION_SPEED
+    def __init__(self):
+        self.clip = RUN_CLIP
         self.move_speed = PATROL_SPEED
-        self.run_time = 0
         self.max_run_time = RUN_DURATION
 
-    def enter(self, e):
-        self.paddlefish.frame = 0
-        self.run_time = 0
+    def enter(self, paddlefish, e):
+        paddlefish.frame = 0
+        # 이동 시간이 끝나면 TIMEOUT으로 IDLE 전환
+        paddlefish.state_machine.start_timer(self.max_run_time)
         # 랜덤한 좌우 방향 선택
         directions = [-1, 1]
-        self.paddlefish.dirx = random.choice(directions)
-        self.paddlefish.face_dir = self.paddlefish.dirx
+        paddlefish.dirx = random.choice(directions)
+        paddlefish.face_dir = paddlefish.dirx
 
-    def exit(self, e):
+    def exit(self, paddlefish, e):
         pass
 
-    def do(self, delta_time):
-        self.paddlefish.frame = (self.paddlefish.frame + self.animation_speed * delta_time) % RUN_FRAMES
+    def do(self, paddlefish, delta_time):
+        paddlefish.frame = self.clip.advance(paddlefish.frame, delta_time)
 
         # 추적 모드인지 체크
-        if self.paddlefish.is_chasing:
-            # 추적 시간 감소
-            self.paddlefish.chase_time -= delta_time
-            if self.paddlefish.chase_time <= 0:
-                # 추적 종료
-                self.paddlefish.is_chasing = False
-                print(f"[DEBUG] Paddlefish 추적 종료")
-
+        if paddlefish.is_chasing:
             # 캐릭터 감지 및 상태 전환
-            if self.paddlefish.check_character_in_range():
-                distance = self.paddlefish.get_distance_to_character()
+            if paddlefish.check_character_in_range():
+                distance = paddlefish.get_distance_to_character()
 
                 # 쿨다운 중에는 IDLE로 전환 (쿨다운 대기)
-                if self.paddlefish.attack_cooldown > 0:
-                    self.paddlefish.state_machine.cur_state = self.paddlefish.IDLE
-                    self.paddlefish.IDLE.enter(('COOLDOWN_WAIT', 0))
+                if paddlefish.cooldown_timer is not None:
+                    paddlefish.state_machine.set_state(paddlefish.IDLE, ('COOLDOWN_WAIT', 0))
                     return
 
                 # 쿨다운이 끝났을 때만 공격/추적
                 if distance < ATTACK_DETECTION_RANGE:  # 공격 범위
-                    self.paddlefish.state_machine.cur_state = self.paddlefish.ATTACK
-                    self.paddlefish.ATTACK.enter(('DETECT_CHARACTER', 0))
+                    paddlefish.state_machine.set_state(paddlefish.ATTACK, ('DETECT_CHARACTER', 0))
                     return
                 elif distance < DETECTION_RANGE:  # 추적 범위
-                    self.paddlefish.state_machine.cur_state = self.paddlefish.CHASE
-                    self.paddlefish.CHASE.enter(('DETECT_CHARACTER', 0))
+                    paddlefish.state_machine.set_state(paddlefish.CHASE, ('DETECT_CHARACTER', 0))
                     return
 
         # 좌우 이동
-        self.paddlefish.x += self.paddlefish.dirx * self.move_speed * delta_time
+        paddlefish.x += paddlefish.dirx * self.move_speed * delta_time
 
-        # 이동 시간 체크
-        self.run_time += delta_time
-        if self.run_time >= self.max_run_time:
-            # 이동 후 IDLE 상태로 전환
-            self.paddlefish.state_machine.cur_state = self.paddlefish.IDLE
-            self.paddlefish.IDLE.enter(('AUTO_TRANSITION', 0))
-
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.paddlefish.x, self.paddlefish.y)
-        else:
-            screen_x, screen_y = self.paddlefish.x, self.paddlefish.y
-
-        if self.paddlefish.face_dir == 1:
-            self.paddlefish.imageR.clip_draw(int(self.paddlefish.frame) * PIXEL_WIDTH, 0, PIXEL_WIDTH, PIXEL_HEIGHT, screen_x, screen_y)
-        else:
-            self.paddlefish.imageR.clip_composite_draw(int(self.paddlefish.frame) * PIXEL_WIDTH, 0, PIXEL_WIDTH, PIXEL_HEIGHT, 0, 'h', screen_x, screen_y, PIXEL_WIDTH, PIXEL_HEIGHT)
+    def draw(self, paddlefish, camera=None):
+        self.clip.draw(paddlefish.imageR, paddlefish, camera)
 
 #----------------------------------------------------------------
 class PaddlefishChase:
     """Paddlefish의 캐릭터 추적 상태"""
-    def __init__(self, paddlefish):
-        self.paddlefish = paddlefish
-        self.animation_speed = CHASE_ANIMATION_SPEED
+    def __init__(self):
+        self.clip = CHASE_CLIP
         self.chase_speed = CHASE_SPEED
 
-    def enter(self, e):
-        self.paddlefish.frame = 0
+    def enter(self, paddlefish, e):
+        paddlefish.frame = 0
         print(f"[DEBUG] Paddlefish CHASE 상태 진입")
 
-    def exit(self, e):
+    def exit(self, paddlefish, e):
         pass
 
-    def do(self, delta_time):
-        self.paddlefish.frame = (self.paddlefish.frame + self.animation_speed * delta_time) % RUN_FRAMES
-
-        # 추적 시간 감소
-        self.paddlefish.chase_time -= delta_time
-        if self.paddlefish.chase_time <= 0:
-            # 추적 종료
-            self.paddlefish.is_chasing = False
-            self.paddlefish.state_machine.cur_state = self.paddlefish.IDLE
-            self.paddlefish.IDLE.enter(('CHASE_TIMEOUT', 0))
-            print(f"[DEBUG] Paddlefish 추적 시간 초과, IDLE로 전환")
-            return
+    def do(self, paddlefish, delta_time):
+        paddlefish.frame = self.clip.advance(paddlefish.frame, delta_time)
 
+        # 추적 시간 초과는 Paddlefish.end_chase에서 처리
         # 캐릭터가 있는지 체크
-        if not self.paddlefish.check_character_in_range():
+        if not paddlefish.check_character_in_range():
             # 캐릭터가 없으면 IDLE로 전환
-            self.paddlefish.state_machine.cur_state = self.paddlefish.IDLE
-            self.paddlefish.IDLE.enter(('LOSE_CHARACTER', 0))
+            paddlefish.state_machine.set_state(paddlefish.IDLE, ('LOSE_CHARACTER', 0))
             return
 
         # 쿨다운 중에는 IDLE로 전환 (쿨다운 대기)
-        if self.paddlefish.attack_cooldown > 0:
-            self.paddlefish.state_machine.cur_state = self.paddlefish.IDLE
-            self.paddlefish.IDLE.enter(('COOLDOWN_WAIT', 0))
+        if paddlefish.cooldown_timer is not None:
+            paddlefish.state_machine.set_state(paddlefish.IDLE, ('COOLDOWN_WAIT', 0))
             return
 
         # 캐릭터까지의 거리 계산
-        distance = self.paddlefish.get_distance_to_character()
+        distance = paddlefish.get_distance_to_character()
 
         if distance < ATTACK_DETECTION_RANGE:  # 공격 범위 도달
             # 쿨다운이 끝났으므로 공격
-            self.paddlefish.state_machine.cur_state = self.paddlefish.ATTACK
-            self.paddlefish.ATTACK.enter(('REACH_CHARACTER', 0))
+            paddlefish.state_machine.set_state(paddlefish.ATTACK, ('REACH_CHARACTER', 0))
             return
 
         if distance >= DETECTION_RANGE:  # 추적 범위를 벗어남
-            self.paddlefish.state_machine.cur_state = self.paddlefish.IDLE
-            self.paddlefish.IDLE.enter(('LOSE_CHARACTER', 0))
+            paddlefish.state_machine.set_state(paddlefish.IDLE, ('LOSE_CHARACTER', 0))
             return
 
-        # 캐릭터를 향해 이동
-        target_x, target_y = self.paddlefish.get_character_position()
-        dx = target_x - self.paddlefish.x
-        dy = target_y - self.paddlefish.y
+        # 캐릭터를 향해 이동 (사이에 벽이 있으면 플로 필드를 따라 돌아감)
+        target_x, target_y = paddlefish.get_character_position()
+        dx = target_x - paddlefish.x
+        dy = target_y - paddlefish.y
 
-        # 방향 정규화
+        # 방향 정규화 (캐릭터 바로 근처면 직선 이동)
         distance = math.sqrt(dx * dx + dy * dy)
         if distance > 0:
-            dx /= distance
-            dy /= distance
+            direction = flow_field.steer(paddlefish, paddlefish.target_character)
+            if direction:
+                dx, dy = direction
+            else:
+                dx /= distance
+                dy /= distance
 
             # 이동
-            self.paddlefish.x += dx * self.chase_speed * delta_time
-            self.paddlefish.y += dy * self.chase_speed * delta_time
+            paddlefish.x += dx * self.chase_speed * delta_time
+            paddlefish.y += dy * self.chase_speed * delta_time
 
             # 좌우 방향 설정
             if dx > 0:
-                self.paddlefish.face_dir = 1
+                paddlefish.face_dir = 1
             elif dx < 0:
-                self.paddlefish.face_dir = -1
+                paddlefish.face_dir = -1
 
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.paddlefish.x, self.paddlefish.y)
-        else:
-            screen_x, screen_y = self.paddlefish.x, self.paddlefish.y
+    def draw(self, paddlefish, camera=None):
+        self.clip.draw(paddlefish.imageR, paddlefish, camera)
 
-        if self.paddlefish.face_dir == 1:
-            self.paddlefish.imageR.clip_draw(int(self.paddlefish.frame) * PIXEL_WIDTH, 0, PIXEL_WIDTH, PIXEL_HEIGHT, screen_x, screen_y)
-        else:
-            self.paddlefish.imageR.clip_composite_draw(int(self.paddlefish.frame) * PIXEL_WIDTH, 0, PIXEL_WIDTH, PIXEL_HEIGHT, 0, 'h', screen_x, screen_y, PIXEL_WIDTH, PIXEL_HEIGHT)
+#----------------------------------------------------------------
+class PaddlefishStateData:
+    """Paddlefish 인스턴스별 상태 변수 (상태 객체는 모든 Paddlefish가 공유하므로 값은 여기에 저장)"""
+    __slots__ = ('has_attacked',)
+
+    def __init__(self):
+        self.has_attacked = False
 
 #----------------------------------------------------------------
-class Paddlefish:
+class Paddlefish(Entity):
     """순찰 및 공격 몬스터 - IDLE, ATTACK, RUN, CHASE 상태를 가짐"""
+    # 공통 속성은 Entity, 여기에는 Paddlefish 전용 속성만 선언
+    __slots__ = ('target_character', 'is_chasing', 'chase_timer', 'cooldown_timer', 'imageI', 'imageR', 'imageA')
+
+    IS_MONSTER = True  # 몬스터끼리는 서로 공격하지 않음
+
+    # 스프라이트 시트 (모든 인스턴스가 resource_manager 캐시의 같은 텍스처를 공유)
+    IMAGE_FILES = {
+        'imageI': 'resource/PaddleFish_Idle.png',
+        'imageR': 'resource/PaddleFish_Run.png',
+        'imageA': 'resource/PaddleFish_Attack.png',
+    }
+
+    # 상태 객체 (상태 없는 싱글톤 - 모든 Paddlefish가 공유)
+    IDLE = PaddlefishIdle()
+    ATTACK = PaddlefishAttack()
+    RUN = PaddlefishRun()
+    CHASE = PaddlefishChase()
+
+    # 상태 전이 규칙 (타입당 하나, StateMachine이 한 번만 컴파일)
+    # 시간 제한 전이는 TIMEOUT 규칙으로, 추적 관련 전이는 각 상태의 do에서 처리
+    RULES = {
+        IDLE: {timeout: RUN},     # 대기 시간이 끝나면 배회, 추적 모드면 추적 상태로 전환
+        ATTACK: {timeout: IDLE},  # 공격 애니메이션이 끝나면 IDLE로 전환 (쿨다운 시작)
+        RUN: {timeout: IDLE},     # 이동 시간이 끝나면 IDLE, 배회 중 추적 모드 전환 가능
+        CHASE: {}                 # 추적 중 공격 또는 IDLE로 전환
+    }
+
     def __init__(self, x=400, y=300, target_character=None):
-        self.x, self.y = x, y
-        self.frame = 0
-        self.dirx = 0
-        self.diry = 0
-        self.face_dir = 1
+        # 위치/방향/체력
+        super().__init__(x, y, MAX_HP)
         self.target_character = target_character  # 추적할 캐릭터
 
-        # 체력
-        self.hp = MAX_HP
-        self.max_hp = MAX_HP
-
         # 공격력
         self.attack_power = ATTACK_POWER
 
-        # 생존 상태
-        self.is_alive = True
-
         # 추적 상태
         self.is_chasing = False  # 피격 후 추적 모드인지 여부
-        self.chase_time = 0  # 남은 추적 시간
+        self.chase_timer = None  # 추적 종료 타이머 (timer_wheel)
 
-        # 공격 쿨다운
-        self.attack_cooldown = 0  # 0이면 공격 가능
+        # 공격 쿨다운 (timer_wheel 타이머, None이면 공격 가능)
+        self.cooldown_timer = None
 
         # 이미지 로드
-        self.imageI = load_image('resource/PaddleFish_Idle.png')
-        self.imageR = load_image('resource/PaddleFish_Run.png')
-        self.imageA = load_image('resource/PaddleFish_Attack.png')
-
-        # 상태 초기화
-        self.IDLE = PaddlefishIdle(self)
-        self.ATTACK = PaddlefishAttack(self)
-        self.RUN = PaddlefishRun(self)
-        self.CHASE = PaddlefishChase(self)
-
-        # 상태 머신 초기화
-        self.state_machine = StateMachine(
-            self.IDLE,
-            {
-                self.IDLE: {},     # 배회 또는 추적 상태로 전환
-                self.ATTACK: {},   # 공격 후 IDLE로 전환
-                self.RUN: {},      # 배회 중 추적 모드 전환 가능
-                self.CHASE: {}     # 추적 중 공격 또는 IDLE로 전환
-            }
-        )
+        self.load_images()  # IMAGE_FILES (캐시에서 공유)
+
+        # 상태 머신 초기화 (상태별 변수는 state_data에 저장)
+        self.state_data = PaddlefishStateData()
+        self.state_machine = StateMachine(self.IDLE, self.RULES, owner=self)
+
+    def start_cooldown(self):
+        """공격 쿨다운 시작 - 끝나면 end_cooldown 호출"""
+        timer_wheel.cancel(self.cooldown_timer)
+        self.cooldown_timer = timer_wheel.schedule(ATTACK_COOLDOWN, self.end_cooldown)
+
+    def end_cooldown(self):
+        self.cooldown_timer = None
+        print(f"[DEBUG] Paddlefish 쿨다운 종료! 다시 공격 가능")
+        # 쿨다운 동안 멈춰 있던 대기 시간 타이머 시작
+        if self.state_machine.cur_state is self.IDLE:
+            self.IDLE.start_wait(self)
+
+    def end_chase(self):
+        """추적 시간 초과 - 추적 모드 해제"""
+        self.is_chasing = False
+        self.chase_timer = None
+        if self.state_machine.cur_state is self.CHASE:
+            self.state_machine.set_state(self.IDLE, ('CHASE_TIMEOUT', 0))
+            print(f"[DEBUG] Paddlefish 추적 시간 초과, IDLE로 전환")
+        else:
+            print(f"[DEBUG] Paddlefish 추적 종료")
+            if self.state_machine.cur_state is self.IDLE:
+                self.IDLE.start_wait(self)
+
+    def reset_state(self):
+        """풀에서 다시 꺼낼 때 생성 직후처럼 IDLE에서 시작 (남은 추적/쿨다운 취소)"""
+        timer_wheel.cancel(self.chase_timer)
+        timer_wheel.cancel(self.cooldown_timer)
+        self.is_chasing = False
+        self.chase_timer = None
+        self.cooldown_timer = None
+        self.state_data.has_attacked = False
+        super().reset_state()
 
     def set_target_character(self, character):
         """추적할 캐릭터 설정"""
@@ -443,17 +404,14 @@ class Paddlefish:
         if self.state_machine.cur_state != self.ATTACK:
             return None
 
-        # 공격 애니메이션의 특정 프레임에서만 공격 판정
-        current_frame = int(self.frame)
-        if not (ATTACK_HIT_FRAME_START <= current_frame <= ATTACK_HIT_FRAME_END):
+        # 공격 애니메이션의 'hit' 구간에서만 공격 판정
+        if not ATTACK_CLIP.in_event('hit', self.frame):
             return None
 
         # 공격 판정 플래그 설정 (한 번만 데미지 처리하기 위함)
-        attack_state = self.state_machine.cur_state
-        if hasattr(attack_state, 'has_attacked'):
-            if not attack_state.has_attacked:
-                attack_state.has_attacked = True
-                print(f"[DEBUG] Paddlefish 공격 판정 활성화! (프레임: {current_frame})")
+        if not self.state_data.has_attacked:
+            self.state_data.has_attacked = True
+            print(f"[DEBUG] Paddlefish 공격 판정 활성화! (프레임: {int(self.frame)})")
 
         # 공격 박스 중심 좌표 계산 (몬스터 좌표 + 오프셋)
         # 바라보는 방향에 따라 X 오프셋 방향 결정
@@ -491,12 +449,15 @@ class Paddlefish:
         # 피격 시 추적 모드 활성화
         if not self.is_chasing:
             self.is_chasing = True
-            self.chase_time = CHASE_DURATION
             print(f"[DEBUG] Paddlefish 피격! {CHASE_DURATION}초 동안 추적 모드 활성화")
+            # 추적 중에는 배회하지 않으므로 대기 시간 타이머 중지
+            if self.state_machine.cur_state is self.IDLE:
+                self.state_machine.cancel_timer()
         else:
             # 이미 추적 중이면 추적 시간 리셋
-            self.chase_time = CHASE_DURATION
             print(f"[DEBUG] Paddlefish 추적 시간 리셋: {CHASE_DURATION}초")
+        timer_wheel.cancel(self.chase_timer)
+        self.chase_timer = timer_wheel.schedule(CHASE_DURATION, self.end_chase)
 
         # 넉백 효과 (공격자 위치 기반)
         if attacker_x is not None:
@@ -511,5 +472,9 @@ class Paddlefish:
         if self.hp <= 0:
             print("Paddlefish 사망!")
             self.is_alive = False
+            # 예약된 타이머가 제거된 몬스터를 깨우지 않도록 취소
+            self.state_machine.cancel_timer()
+            timer_wheel.cancel(self.cooldown_timer)
+            timer_wheel.cancel(self.chase_timer)
 
 #----------------------------------------------------------------
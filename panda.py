@@ -1,6 +1,8 @@
 from pico2d import *
 from state_machine import StateMachine
-import random
+from entity import Entity
+from animation import AnimationClip
+from event_check import timeout
 import math
 
 #----------------------------------------------------------------
@@ -10,14 +12,14 @@ import math
 # ============================================================
 # 전역 설정 - 여기서 일괄 수정
 # ============================================================
-PIXEL_WIDTH = 192   # 스프라이트 가로 픽셀 크기
-PIXEL_HEIGHT = 192  # 스프라이트 세로 픽셀 크기
+PIXEL_WIDTH = 256   # 스프라이트 가로 픽셀 크기
+PIXEL_HEIGHT = 256  # 스프라이트 세로 픽셀 크기
 
 # 애니메이션 프레임 수
-IDLE_FRAMES = 6
-ATTACK_FRAMES = 6
-GUARD_FRAMES = 4
-RUN_FRAMES = 8
+IDLE_FRAMES = 10
+ATTACK_FRAMES = 13
+GUARD_FRAMES = 8
+RUN_FRAMES = 6
 
 # 충돌 박스 크기
 COLLISION_HALF_WIDTH = 35
@@ -35,223 +37,170 @@ CIRCLE_RADIUS = 100
 MAX_HP = 120
 # ============================================================
 
+# 애니메이션 클립 (시트별로 한 번 만들어 모든 Panda가 공유)
+IDLE_CLIP = AnimationClip(IDLE_FRAMES, 5, PIXEL_WIDTH, PIXEL_HEIGHT)
+ATTACK_CLIP = AnimationClip(ATTACK_FRAMES, 10, PIXEL_WIDTH, PIXEL_HEIGHT)
+GUARD_CLIP = AnimationClip(GUARD_FRAMES, 5, PIXEL_WIDTH, PIXEL_HEIGHT)
+RUN_CLIP = AnimationClip(RUN_FRAMES, 10, PIXEL_WIDTH, PIXEL_HEIGHT)
+
 class PandaIdle:
     """Panda의 대기 상태"""
-    def __init__(self, panda):
-        self.panda = panda
-        self.animation_speed = 5  # 초당 프레임 수
-        self.idle_time = 0
+    def __init__(self):
+        self.clip = IDLE_CLIP
         self.max_idle_time = 1.5  # 1.5초 대기 후 다른 상태로 전환
 
-    def enter(self, e):
-        self.panda.frame = 0
-        self.idle_time = 0
+    def enter(self, panda, e):
+        panda.frame = 0
+        panda.state_machine.start_timer(self.max_idle_time)
 
-    def exit(self, e):
+    def exit(self, panda, e):
         pass
 
-    def do(self, delta_time):
-        # TODO: 애니메이션 프레임 수를 실제 이미지에 맞게 수정하세요
-        self.panda.frame = (self.panda.frame + self.animation_speed * delta_time) % 10
-
-        # 대기 시간 체크
-        self.idle_time += delta_time
-        if self.idle_time >= self.max_idle_time:
-            # 무작위로 RUN, ATTACK, GUARD 상태로 전환
-            next_state = random.choice([self.panda.RUN, self.panda.ATTACK, self.panda.GUARD])
-            self.panda.state_machine.cur_state = next_state
-            next_state.enter(('AUTO_TRANSITION', 0))
-
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.panda.x, self.panda.y)
-        else:
-            screen_x, screen_y = self.panda.x, self.panda.y
+    def do(self, panda, delta_time):
+        panda.frame = self.clip.advance(panda.frame, delta_time)
 
-        # TODO: 프레임 크기를 실제 이미지에 맞게 수정하세요
-        if self.panda.face_dir == 1:
-            self.panda.imageI.clip_draw(int(self.panda.frame) * 256, 0, 256, 256, screen_x, screen_y)
-        else:
-            self.panda.imageI.clip_composite_draw(int(self.panda.frame) * 256, 0, 256, 256, 0, 'h', screen_x, screen_y, 256, 256)
+    def draw(self, panda, camera=None):
+        self.clip.draw(panda.imageI, panda, camera)
 
 #----------------------------------------------------------------
 class PandaAttack:
     """Panda의 공격 상태"""
-    def __init__(self, panda):
-        self.panda = panda
-        self.animation_speed = 10  # 초당 프레임 수
-        self.attack_time = 0
+    def __init__(self):
+        self.clip = ATTACK_CLIP
         self.max_attack_time = 1.5  # 1.5초 공격 후 다른 상태로 전환
 
-    def enter(self, e):
-        self.panda.frame = 0
-        self.attack_time = 0
+    def enter(self, panda, e):
+        panda.frame = 0
+        panda.state_machine.start_timer(self.max_attack_time)
 
-    def exit(self, e):
+    def exit(self, panda, e):
         pass
 
-    def do(self, delta_time):
-        # TODO: 애니메이션 프레임 수를 실제 이미지에 맞게 수정하세요
-        self.panda.frame = (self.panda.frame + self.animation_speed * delta_time) % 13
+    def do(self, panda, delta_time):
+        panda.frame = self.clip.advance(panda.frame, delta_time)
 
-        # 공격 시간 체크
-        self.attack_time += delta_time
-        if self.attack_time >= self.max_attack_time:
-            # 공격 후 IDLE, RUN, GUARD 상태로 전환
-            next_state = random.choice([self.panda.IDLE, self.panda.RUN, self.panda.GUARD])
-            self.panda.state_machine.cur_state = next_state
-            next_state.enter(('AUTO_TRANSITION', 0))
-
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.panda.x, self.panda.y)
-        else:
-            screen_x, screen_y = self.panda.x, self.panda.y
-
-        # TODO: 프레임 크기를 실제 이미지에 맞게 수정하세요
-        if self.panda.face_dir == 1:
-            self.panda.imageA.clip_draw(int(self.panda.frame) * 256, 0, 256, 256, screen_x, screen_y)
-        else:
-            self.panda.imageA.clip_composite_draw(int(self.panda.frame) * 256, 0, 256, 256, 0, 'h', screen_x, screen_y, 256, 256)
+    def draw(self, panda, camera=None):
+        self.clip.draw(panda.imageA, panda, camera)
 
 #----------------------------------------------------------------
 class PandaGuard:
     """Panda의 방어 상태"""
-    def __init__(self, panda):
-        self.panda = panda
-        self.animation_speed = 5  # 초당 프레임 수
-        self.guard_time = 0
+    def __init__(self):
+        self.clip = GUARD_CLIP
         self.max_guard_time = 2.0  # 2초 방어 후 다른 상태로 전환
 
-    def enter(self, e):
-        self.panda.frame = 0
-        self.guard_time = 0
+    def enter(self, panda, e):
+        panda.frame = 0
+        panda.state_machine.start_timer(self.max_guard_time)
 
-    def exit(self, e):
+    def exit(self, panda, e):
         pass
 
-    def do(self, delta_time):
-        # TODO: 애니메이션 프레임 수를 실제 이미지에 맞게 수정하세요
-        self.panda.frame = (self.panda.frame + self.animation_speed * delta_time) % 8
-
-        # 방어 시간 체크
-        self.guard_time += delta_time
-        if self.guard_time >= self.max_guard_time:
-            # 방어 후 IDLE, RUN, ATTACK 상태로 전환
-            next_state = random.choice([self.panda.IDLE, self.panda.RUN, self.panda.ATTACK])
-            self.panda.state_machine.cur_state = next_state
-            next_state.enter(('AUTO_TRANSITION', 0))
+    def do(self, panda, delta_time):
+        panda.frame = self.clip.advance(panda.frame, delta_time)
 
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.panda.x, self.panda.y)
-        else:
-            screen_x, screen_y = self.panda.x, self.panda.y
-
-        # TODO: 프레임 크기를 실제 이미지에 맞게 수정하세요
-        if self.panda.face_dir == 1:
-            self.panda.imageG.clip_draw(int(self.panda.frame) * 256, 0, 256, 256, screen_x, screen_y)
-        else:
-            self.panda.imageG.clip_composite_draw(int(self.panda.frame) * 256, 0, 256, 256, 0, 'h', screen_x, screen_y, 256, 256)
+    def draw(self, panda, camera=None):
+        self.clip.draw(panda.imageG, panda, camera)
 
 #----------------------------------------------------------------
 class PandaRun:
     """Panda의 이동 상태"""
-    def __init__(self, panda):
-        self.panda = panda
-        self.animation_speed = 10  # 초당 프레임 수
+    def __init__(self):
+        self.clip = RUN_CLIP
         self.rotation_speed = 2.0  # 회전 속도 (라디안/초)
         self.circle_radius = 100  # 원형 궤도 반지름
-        self.angle = 0  # 현재 각도
-        self.run_time = 0
         self.max_run_time = 5.0  # 5초 원형 이동 후 다른 상태로 전환
 
-    def enter(self, e):
-        self.panda.frame = 0
-        self.run_time = 0
-        self.angle = 0
+    def enter(self, panda, e):
+        panda.frame = 0
+        panda.state_machine.start_timer(self.max_run_time)
+        panda.state_data.angle = 0
         # 시작 위치를 중심점으로 저장
-        self.center_x = self.panda.x
-        self.center_y = self.panda.y
+        panda.state_data.center_x = panda.x
+        panda.state_data.center_y = panda.y
 
-    def exit(self, e):
+    def exit(self, panda, e):
         pass
 
-    def do(self, delta_time):
-        # TODO: 애니메이션 프레임 수를 실제 이미지에 맞게 수정하세요
-        self.panda.frame = (self.panda.frame + self.animation_speed * delta_time) % 6
+    def do(self, panda, delta_time):
+        panda.frame = self.clip.advance(panda.frame, delta_time)
 
         # 원형 궤도 이동
-        self.angle += self.rotation_speed * delta_time
-        self.panda.x = self.center_x + math.cos(self.angle) * self.circle_radius
-        self.panda.y = self.center_y + math.sin(self.angle) * self.circle_radius
+        panda.state_data.angle += self.rotation_speed * delta_time
+        panda.x = panda.state_data.center_x + math.cos(panda.state_data.angle) * self.circle_radius
+        panda.y = panda.state_data.center_y + math.sin(panda.state_data.angle) * self.circle_radius
 
         # 이동 방향에 따라 캐릭터 방향 전환
-        if math.cos(self.angle) > 0:
-            self.panda.face_dir = 1
+        if math.cos(panda.state_data.angle) > 0:
+            panda.face_dir = 1
         else:
-            self.panda.face_dir = -1
+            panda.face_dir = -1
 
-        # 이동 시간 체크
-        self.run_time += delta_time
-        if self.run_time >= self.max_run_time:
-            # 이동 후 IDLE, ATTACK, GUARD 상태로 전환
-            next_state = random.choice([self.panda.IDLE, self.panda.ATTACK, self.panda.GUARD])
-            self.panda.state_machine.cur_state = next_state
-            next_state.enter(('AUTO_TRANSITION', 0))
+    def draw(self, panda, camera=None):
+        self.clip.draw(panda.imageR, panda, camera)
 
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.panda.x, self.panda.y)
-        else:
-            screen_x, screen_y = self.panda.x, self.panda.y
+#----------------------------------------------------------------
+class PandaStateData:
+    """Panda 인스턴스별 상태 변수 (상태 객체는 모든 Panda가 공유하므로 값은 여기에 저장)"""
+    __slots__ = ('angle', 'center_x', 'center_y')
 
-        # TODO: 프레임 크기를 실제 이미지에 맞게 수정하세요
-        if self.panda.face_dir == 1:
-            self.panda.imageR.clip_draw(int(self.panda.frame) * 256, 0, 256, 256, screen_x, screen_y)
-        else:
-            self.panda.imageR.clip_composite_draw(int(self.panda.frame) * 256, 0, 256, 256, 0, 'h', screen_x, screen_y, 256, 256)
+    def __init__(self):
+        self.angle = 0          # 원형 궤도의 현재 각도
+        self.center_x = 0       # 원형 궤도 중심
+        self.center_y = 0
 
 #----------------------------------------------------------------
-class Panda:
+class Panda(Entity):
     """원형 궤도 순찰 및 공격/방어 몬스터 - IDLE, ATTACK, GUARD, RUN 상태를 가짐"""
-    def __init__(self, x=500, y=400):
-        self.x, self.y = x, y
-        self.frame = 0
-        self.face_dir = 1
+    # 공통 속성은 Entity, 여기에는 Panda 전용 속성만 선언
+    __slots__ = ('imageI', 'imageR', 'imageA', 'imageG')
+
+    IS_MONSTER = True  # 몬스터끼리는 서로 공격하지 않음
+
+    # 스프라이트 시트 (모든 인스턴스가 resource_manager 캐시의 같은 텍스처를 공유)
+    # TODO: 이미지 파일 경로를 실제 파일로 변경하세요
+    IMAGE_FILES = {
+        'imageI': 'resource/Panda_Idle.png',    # 대기 애니메이션
+        'imageR': 'resource/Panda_Run.png',     # 달리기 애니메이션
+        'imageA': 'resource/Panda_Attack.png',  # 공격 애니메이션
+        'imageG': 'resource/Panda_Guard.png',   # 방어 애니메이션
+    }
+
+    # 상태 객체 (상태 없는 싱글톤 - 모든 Panda가 공유)
+    IDLE = PandaIdle()
+    ATTACK = PandaAttack()
+    GUARD = PandaGuard()
+    RUN = PandaRun()
+
+    # 상태 전이 규칙 (타입당 하나, StateMachine이 한 번만 컴파일)
+    # 각 상태는 enter에서 시간 제한을 걸고, TIMEOUT이 오면 튜플 중 하나로 무작위 전환
+    RULES = {
+        IDLE: {timeout: (RUN, ATTACK, GUARD)},     # 1.5초 후 RUN, ATTACK, GUARD로 전환
+        ATTACK: {timeout: (IDLE, RUN, GUARD)},     # 1.5초 후 IDLE, RUN, GUARD로 전환
+        GUARD: {timeout: (IDLE, RUN, ATTACK)},     # 2초 후 IDLE, RUN, ATTACK으로 전환
+        RUN: {timeout: (IDLE, ATTACK, GUARD)}      # 5초 후 IDLE, ATTACK, GUARD로 전환
+    }
 
-        # 체력
-        self.hp = MAX_HP
-        self.max_hp = MAX_HP
+    def __init__(self, x=500, y=400):
+        # 위치/방향/체력
+        super().__init__(x, y, MAX_HP)
 
         # 공격력
         self.attack_power = 20  # Panda의 공격력 (가장 강함)
 
-        # 생존 상태
-        self.is_alive = True
-
-        # TODO: 이미지 파일 경로를 실제 파일로 변경하세요
-        self.imageI = load_image('resource/Panda_Idle.png')    # 대기 애니메이션
-        self.imageR = load_image('resource/Panda_Run.png')     # 달리기 애니메이션
-        self.imageA = load_image('resource/Panda_Attack.png')  # 공격 애니메이션
-        self.imageG = load_image('resource/Panda_Guard.png')   # 방어 애니메이션
-
-        # 상태 초기화
-        self.IDLE = PandaIdle(self)
-        self.ATTACK = PandaAttack(self)
-        self.GUARD = PandaGuard(self)
-        self.RUN = PandaRun(self)
-
-        # 상태 머신 초기화
-        self.state_machine = StateMachine(
-            self.IDLE,
-            {
-                self.IDLE: {},     # 자동으로 RUN, ATTACK, GUARD로 전환
-                self.ATTACK: {},   # 자동으로 IDLE, RUN, GUARD로 전환
-                self.GUARD: {},    # 자동으로 IDLE, RUN, ATTACK으로 전환
-                self.RUN: {}       # 자동으로 IDLE, ATTACK, GUARD로 전환
-            }
-        )
+        # 이미지 로드
+        self.load_images()  # IMAGE_FILES (캐시에서 공유)
+
+        # 상태 머신 초기화 (상태별 변수는 state_data에 저장)
+        self.state_data = PandaStateData()
+        self.state_machine = StateMachine(self.IDLE, self.RULES, owner=self)
+
+    def reset_state(self):
+        """풀에서 다시 꺼낼 때 생성 직후처럼 IDLE에서 시작"""
+        self.state_data.angle = 0
+        self.state_data.center_x = 0
+        self.state_data.center_y = 0
+        super().reset_state()
 
     def update(self, delta_time):
         self.state_machine.update(delta_time)
@@ -319,5 +268,7 @@ class Panda:
         if self.hp <= 0:
             print("Panda 사망!")
             self.is_alive = False
+            # 예약된 타이머가 제거된 몬스터를 깨우지 않도록 취소
+            self.state_machine.cancel_timer()
 
 #----------------------------------------------------------------
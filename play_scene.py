@@ -3,15 +3,22 @@
 """
 from pico2d import *
 import game_framework
-import inventory_scene
+import resource_manager
+import timer_wheel
+import spawner
+import ai_lod
+import flow_field
 from warior import Warrior
 from child import Child
-from camera import Camera
+from camera import Camera, CameraView
 from tile import TileMap
 from map_data import load_map
-from gnome import Gnome
-from paddlefish import Paddlefish
-from panda import Panda
+from tile import Tile
+from spatial_hash import SpatialHash
+
+# Scene 렌더링 속성
+opaque = True  # 화면 전체를 덮는 scene (아래 scene은 그리지 않음)
+cache_when_paused = True  # 인벤토리 등 오버레이가 열려 있는 동안 마지막 화면을 재생
 
 # Scene 변수
 world = []
@@ -19,12 +26,16 @@ warrior = None
 child = None
 camera = None
 tilemap = None
-gnome = None
-paddlefish = None
-panda = None
 cur_character = 'warrior'
 show_collision_box = False
 
+# 공격 판정용 공간 해시 (항목은 world 인덱스, 공격 중인 오브젝트가 있는 틱에만 get_bb로 다시 채움)
+combat_grid = SpatialHash()
+
+# 일괄 시뮬레이션 몬스터 무리 (monster_batch, NumPy 필요) - main.py --horde로 수 지정, 0이면 만들지 않음
+horde_size = 0
+horde = None
+
 def collide(a, b):
     """두 객체의 바운딩 박스가 충돌하는지 확인"""
     left_a, bottom_a, right_a, top_a = a.get_bb()
@@ -40,7 +51,7 @@ def collide(a, b):
 
 def enter():
     """Scene 진입 시 호출"""
-    global world, warrior, child, camera, tilemap, gnome, paddlefish, panda, cur_character, show_collision_box
+    global world, warrior, child, camera, tilemap, cur_character, show_collision_box, horde
 
     cur_character = 'warrior'
     show_collision_box = False
@@ -51,8 +62,12 @@ def enter():
     tilemap = TileMap(40, 40)
     tilemap.load_from_array(map_data)
     tilemap.debug_mode = False  # 기본 OFF (F3으로 토글)
+    flow_field.init(tilemap)  # 추적 몬스터가 공유하는 길찾기 필드 (충돌 타일 표시)
     print("타일맵 로딩 완료!")
 
+    # 타이머 휠 초기화 (엔티티 상태가 생성 시 타이머를 등록하므로 먼저 초기화, 한 틱 = 시뮬레이션 한 스텝)
+    timer_wheel.clear(game_framework.sim_dt)
+
     # 캐릭터 생성 (맵 중앙에 배치)
     spawn_x = 20 * 64  # 20번째 타일 (중앙)
     spawn_y = 20 * 64  # 20번째 타일
@@ -69,27 +84,50 @@ def enter():
     camera = Camera()
     camera.set_target(warrior)
 
-    # 몬스터 생성 (맵 곳곳에 배치)
-    gnome = Gnome(x=spawn_x + 300, y=spawn_y + 100)
-    gnome.set_target_character(warrior)
-
-    paddlefish = Paddlefish(x=spawn_x - 200, y=spawn_y - 150)
-    paddlefish.set_target_character(warrior)
-
-    panda = Panda(x=spawn_x + 150, y=spawn_y + 200)
-
     # 월드에 추가
     world = []
     world.append(child)
     world.append(warrior)
-    world.append(gnome)
-    world.append(paddlefish)
-    world.append(panda)
+
+    # 몬스터 풀 준비 및 웨이브 예약 (첫 웨이브는 바로 월드에 추가, spawner.WAVES)
+    # 풀의 몬스터는 생성 시 AI LOD 버킷을 배정받으므로 카운터를 먼저 초기화
+    ai_lod.clear()
+    spawner.init(world, warrior)
+
+    # 렌더 보간 기준 위치 초기화 (생성 후 위치를 옮겼으므로)
+    for obj in world:
+        obj.prev_x, obj.prev_y = obj.x, obj.y
+    camera.prev_x, camera.prev_y = camera.x, camera.y
+
+    # 일괄 시뮬레이션 몬스터 무리 (맵 전체에 무작위 배치)
+    horde = None
+    if horde_size > 0:
+        import monster_batch
+        if monster_batch.AVAILABLE:
+            bounds = (0, 0, tilemap.width * Tile.TILE_SIZE, tilemap.height * Tile.TILE_SIZE)
+            horde = monster_batch.MonsterBatch(horde_size, bounds, tilemap=tilemap)
+            print(f"일괄 시뮬레이션 몬스터 {horde_size}마리 생성")
+        else:
+            print("NumPy가 없어 일괄 시뮬레이션 몬스터를 만들지 않습니다.")
+
+    print(resource_manager.format_memory_usage())
 
 def exit():
     """Scene 종료 시 호출"""
-    global world, warrior, child, camera, tilemap, gnome, paddlefish, panda
-    # 리소스 해제는 pico2d가 자동으로 처리
+    global world, warrior, child, camera, tilemap, horde
+    # 엔티티 이미지 참조 반환 후 더 이상 쓰지 않는 텍스처 해제 (타일 이미지는 Tile 클래스가 계속 보유)
+    for obj in world:
+        obj.release_images()
+    world = []
+    spawner.clear()  # 남은 웨이브 취소, 풀에 대기 중인 몬스터 이미지 반환
+    flow_field.clear()
+    if horde:
+        horde.release_images()
+        horde = None
+    print(resource_manager.format_memory_usage())
+    purged, freed = resource_manager.purge_unused()
+    print(f"사용하지 않는 이미지 {purged}개 해제 ({freed / (1024 * 1024):.1f}MB)")
+    timer_wheel.clear()
 
 def pause():
     """Scene이 일시정지될 때 호출 (인벤토리 열릴 때)"""
@@ -115,27 +153,23 @@ def handle_events(event):
                 tilemap.toggle_debug_mode()
         elif event.key == SDLK_i:
             # I 키를 누르면 인벤토리 열기
-            game_framework.push_scene(inventory_scene)
+            game_framework.push_scene('inventory_scene')
         elif event.key == SDLK_f:
             # F 키로 캐릭터 전환
             if cur_character == 'warrior':
                 warrior.keys = {'left': False, 'right': False, 'up': False, 'down': False}
-                warrior.state_machine.cur_state = warrior.IDLE
-                warrior.IDLE.enter(('STOP', 0))
+                warrior.state_machine.set_state(warrior.IDLE, ('STOP', 0))
                 cur_character = 'child'
                 camera.set_target(child)
-                # 몬스터들의 추적 대상 변경
-                gnome.set_target_character(child)
-                paddlefish.set_target_character(child)
+                # 몬스터들의 추적 대상 변경 (이후 스폰될 몬스터 포함)
+                spawner.set_target(child)
             else:
                 child.keys = {'left': False, 'right': False, 'up': False, 'down': False}
-                child.state_machine.cur_state = child.IDLE
-                child.IDLE.enter(('STOP', 0))
+                child.state_machine.set_state(child.IDLE, ('STOP', 0))
                 cur_character = 'warrior'
                 camera.set_target(warrior)
-                # 몬스터들의 추적 대상 변경
-                gnome.set_target_character(warrior)
-                paddlefish.set_target_character(warrior)
+                # 몬스터들의 추적 대상 변경 (이후 스폰될 몬스터 포함)
+                spawner.set_target(warrior)
         else:
             # 현재 캐릭터에게 이벤트 전달
             if cur_character == 'warrior':
@@ -157,14 +191,16 @@ def screen_to_world(screen_x, screen_y):
     return world_x, world_y
 
 def check_attack_collisions():
-    """공격 충돌 체크 및 데미지 처리"""
+    """공격 충돌 체크 및 데미지 처리 (공격 박스와 겹치는 격자 칸의 오브젝트만 검사)"""
+    grid_ready = False
+
     # 모든 오브젝트의 공격 박스를 체크
-    for attacker in world:
+    for attacker_index, attacker in enumerate(world):
         attack_bb = attacker.get_attack_bb()
 
         # 공격 중이 아니면 hit_targets 초기화하고 스킵
         if not attack_bb:
-            if hasattr(attacker, 'hit_targets'):
+            if attacker.hit_targets:
                 attacker.hit_targets.clear()
             continue
 
@@ -176,25 +212,21 @@ def check_attack_collisions():
 
         print(f"[DEBUG] {attacker.__class__.__name__} 공격 중! 공격력: {attack_power}, 공격 박스: {attack_bb}")
 
-        # hit_targets 초기화 (처음 공격할 때)
-        if not hasattr(attacker, 'hit_targets'):
-            attacker.hit_targets = set()
-            print(f"[DEBUG] {attacker.__class__.__name__} hit_targets 초기화")
+        # 이번 틱에 처음 공격하는 오브젝트가 나오면 격자 채우기
+        if not grid_ready:
+            combat_grid.clear()
+            for index, obj in enumerate(world):
+                combat_grid.insert(index, obj.get_bb())
+            grid_ready = True
 
-        # 다른 오브젝트와의 충돌 체크
-        for target in world:
-            if attacker == target:
+        # 공격 박스와 같은 칸에 있는 오브젝트와의 충돌 체크 (월드 순서대로)
+        for target_index in sorted(combat_grid.query(attack_bb)):
+            if target_index == attacker_index:
                 continue  # 자기 자신은 제외
+            target = world[target_index]
 
             # 몬스터끼리는 공격하지 않음
-            attacker_class = attacker.__class__.__name__
-            target_class = target.__class__.__name__
-
-            # 몬스터 클래스 리스트
-            monster_classes = ['Gnome', 'Paddlefish', 'Panda']
-
-            # 공격자와 타겟이 모두 몬스터면 스킵
-            if attacker_class in monster_classes and target_class in monster_classes:
+            if attacker.IS_MONSTER and target.IS_MONSTER:
                 continue
 
             # 타겟의 히트박스와 공격 박스 충돌 체크
@@ -213,6 +245,7 @@ def check_attack_collisions():
                 print(f"[DEBUG]     타겟 박스: {target_bb}")
                 target.take_damage(attack_power, attacker.x)
                 attacker.hit_targets.add(target_id)
+                combat_grid.update(target_index, target.get_bb())  # 넉백으로 옮겨진 위치 반영
 
 def collide_bb(bb1, bb2):
     """두 바운딩 박스가 충돌하는지 확인"""
@@ -228,52 +261,62 @@ def collide_bb(bb1, bb2):
     return True
 
 def remove_dead_objects():
-    """체력이 0이 된 객체들을 제거"""
+    """체력이 0이 된 객체들을 제거 (몬스터는 스포너 풀로 반환해 다음 웨이브에서 재사용)"""
     global world
 
     # 사망한 객체들을 찾아서 제거
-    dead_objects = [obj for obj in world if hasattr(obj, 'is_alive') and not obj.is_alive]
+    dead_objects = [obj for obj in world if not obj.is_alive]
 
     for obj in dead_objects:
         world.remove(obj)
-        print(f"{obj.__class__.__name__}이(가) 월드에서 제거되었습니다.")
+        if spawner.recycle(obj):
+            print(f"{obj.__class__.__name__}이(가) 월드에서 제거되어 풀로 돌아갔습니다.")
+        else:
+            obj.release_images()
+            print(f"{obj.__class__.__name__}이(가) 월드에서 제거되었습니다.")
 
 def update(delta_time):
     """업데이트"""
     global camera, tilemap
 
+    # 마감된 상태 타이머/쿨다운 처리 (TIMEOUT 전이가 이번 스텝의 do보다 먼저 반영됨)
+    timer_wheel.advance(delta_time)
+
     # 타일맵 업데이트
     if tilemap:
         tilemap.update(delta_time)
 
+    # AI LOD 거리 기준점 (카메라 중심, 현재 캐릭터)
+    ai_lod.begin_step(camera, warrior if cur_character == 'warrior' else child)
+
     # 오브젝트 업데이트 (타일맵 충돌 포함)
+    moved_monsters = []
     for obj in world:
-        # 이동 전 위치 저장
-        old_x, old_y = obj.x, obj.y
+        # 이동 전 위치 저장 (렌더 보간 기준 위치로도 사용)
+        obj.prev_x, obj.prev_y = obj.x, obj.y
 
-        # 오브젝트 업데이트
-        obj.update(delta_time)
-
-        # 타일맵 충돌 체크 (바운딩 박스가 있는 객체만)
-        if tilemap and hasattr(obj, 'get_bb'):
-            bb = obj.get_bb()
-            if bb:
-                obj_width = bb[2] - bb[0]
-                obj_height = bb[3] - bb[1]
+        # 오브젝트 업데이트 (멀리 있는 몬스터는 몇 틱에 한 번 - 이번 틱을 건너뛰면 충돌 처리도 생략)
+        if not ai_lod.update(obj, delta_time):
+            continue
 
-                # 충돌 시 슬라이딩 처리
-                if tilemap.check_collision(obj.x, obj.y, obj_width, obj_height):
-                    can_move_x = not tilemap.check_collision(obj.x, old_y, obj_width, obj_height)
-                    can_move_y = not tilemap.check_collision(old_x, obj.y, obj_width, obj_height)
+        # 타일맵 충돌 체크 - 캐릭터는 바로 처리해 뒤에 갱신되는 몬스터가 보정된 위치를 추적하고,
+        # 몬스터는 update에서 다른 몬스터 위치를 읽지 않으므로 모아서 한 번에 처리 (바로 처리할 때와 같은 결과)
+        if tilemap:
+            if obj.IS_MONSTER:
+                moved_monsters.append(obj)
+            else:
+                resolve_tile_collisions((obj,))
 
-                    if not can_move_x:
-                        obj.x = old_x
-                    if not can_move_y:
-                        obj.y = old_y
+    if moved_monsters:
+        resolve_tile_collisions(moved_monsters)
 
     # 공격 충돌 체크
     check_attack_collisions()
 
+    # 일괄 시뮬레이션 몬스터 (현재 캐릭터 추적, 플레이어 공격 판정)
+    if horde:
+        update_horde(delta_time)
+
     # 사망한 객체 제거
     remove_dead_objects()
 
@@ -285,37 +328,106 @@ def update(delta_time):
 
     camera.update(delta_time)
 
-def draw():
-    """렌더링"""
+def resolve_tile_collisions(objects):
+    """
+    이번 스텝에 움직인 오브젝트의 타일맵 충돌을 일괄 검사하고 슬라이딩 처리 (monster_batch.resolve_tile_collisions와 같은 규칙)
+    - 새 위치에서 충돌하면 x만 움직인 위치와 y만 움직인 위치를 검사해 막힌 축만 이전 위치(prev_x, prev_y)로 되돌림
+    """
+    boxes = []
+    for obj in objects:
+        bb = obj.get_bb()
+        if bb:
+            boxes.append((obj, bb[2] - bb[0], bb[3] - bb[1]))
+    if not boxes:
+        return
+
+    hits = tilemap.check_collision_batch([obj.x for obj, _, _ in boxes], [obj.y for obj, _, _ in boxes],
+                                         [w for _, w, _ in boxes], [h for _, _, h in boxes])
+    blocked = [box for box, hit in zip(boxes, hits) if hit]
+    if not blocked:
+        return
+
+    # 앞 절반은 x만 움직인 위치, 뒤 절반은 y만 움직인 위치
+    widths = [w for _, w, _ in blocked]
+    heights = [h for _, _, h in blocked]
+    hits = tilemap.check_collision_batch([obj.x for obj, _, _ in blocked] + [obj.prev_x for obj, _, _ in blocked],
+                                         [obj.prev_y for obj, _, _ in blocked] + [obj.y for obj, _, _ in blocked],
+                                         widths + widths, heights + heights)
+    count = len(blocked)
+    for i, (obj, _, _) in enumerate(blocked):
+        if hits[i]:
+            obj.x = obj.prev_x
+        if hits[count + i]:
+            obj.y = obj.prev_y
+
+def update_horde(delta_time):
+    """일괄 시뮬레이션 몬스터 갱신 및 플레이어 공격 처리"""
+    target = warrior if cur_character == 'warrior' else child
+    horde.update(delta_time, target if target.is_alive else None)
+    horde.resolve_tile_collisions(tilemap)
+
+    for attacker in (warrior, child):
+        horde.apply_attack(attacker, attacker.get_attack_bb(), attacker.get_current_attack_power())
+
+    removed = horde.remove_dead()
+    if removed:
+        print(f"일괄 시뮬레이션 몬스터 {removed}마리 사망 (남은 수: {horde.count})")
+
+def lerp_position(obj, alpha):
+    """이전 스텝 위치와 현재 위치 사이를 alpha로 보간한 좌표 반환"""
+    return (obj.prev_x + (obj.x - obj.prev_x) * alpha,
+            obj.prev_y + (obj.y - obj.prev_y) * alpha)
+
+def draw(alpha=1.0):
+    """
+    렌더링
+
+    alpha: 고정 스텝 사이의 보간 계수 (game_framework.render_alpha)
+    시뮬레이션 좌표는 그대로 두고 그리기 전용 뷰(CameraView)를 보간 위치만큼 옮겨 그린다.
+    """
     clear_canvas()
 
+    # 카메라 보간
+    view = CameraView(camera)
+    view.x, view.y = lerp_position(camera, alpha)
+
     # 타일맵 그리기
     if tilemap:
-        tilemap.draw(camera)
+        tilemap.draw(view)
 
-    # 오브젝트 그리기
+    # 오브젝트 그리기 (오브젝트마다 보간 위치와 시뮬레이션 위치의 차이만큼 뷰를 옮김)
+    object_views = []
     for obj in world:
-        obj.draw(camera)
+        draw_x, draw_y = lerp_position(obj, alpha)
+        object_view = CameraView(view)
+        object_view.x += obj.x - draw_x
+        object_view.y += obj.y - draw_y
+        object_views.append(object_view)
+        obj.draw(object_view)
+
+    # 일괄 시뮬레이션 몬스터 그리기 (보간은 horde가 직접 처리)
+    if horde:
+        horde.draw(view, alpha)
 
     # 타일맵 디버그 (충돌박스) - F3으로 토글
     if tilemap and tilemap.debug_mode:
-        tilemap.draw_debug(camera)
+        tilemap.draw_debug(view)
 
-    # 충돌 박스 그리기 (디버그용 - 0키로 토글)
+    # 충돌 박스 그리기 (디버그용 - 0키로 토글, 오브젝트와 같은 보간 위치에 표시)
     if show_collision_box:
-        for obj in world:
+        for obj, object_view in zip(world, object_views):
             # 일반 충돌 박스 (빨간색)
             left, bottom, right, top = obj.get_bb()
-            screen_left, screen_bottom = camera.apply(left, bottom)
-            screen_right, screen_top = camera.apply(right, top)
+            screen_left, screen_bottom = object_view.apply(left, bottom)
+            screen_right, screen_top = object_view.apply(right, top)
             draw_rectangle(screen_left, screen_bottom, screen_right, screen_top)
 
             # 공격 충돌 박스 (2중 사각형)
             attack_bb = obj.get_attack_bb()
             if attack_bb:
                 left, bottom, right, top = attack_bb
-                screen_left, screen_bottom = camera.apply(left, bottom)
-                screen_right, screen_top = camera.apply(right, top)
+                screen_left, screen_bottom = object_view.apply(left, bottom)
+                screen_right, screen_top = object_view.apply(right, top)
                 # 공격 박스는 2중 사각형으로 표시
                 draw_rectangle(screen_left, screen_bottom, screen_right, screen_top)
                 draw_rectangle(screen_left+1, screen_bottom+1, screen_right-1, screen_top-1)
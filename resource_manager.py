@@ -0,0 +1,126 @@
+"""
+리소스 관리자 - 이미지 로딩 창구
+- 게임 오브젝트/타일/scene의 이미지 로딩은 모두 이 모듈의 load_image()를 거침
+- headless 모드에서는 텍스처를 만들지 않고 HeadlessImage를 반환 (창/렌더러 불필요)
+- 같은 경로의 이미지는 한 번만 디코딩하고 모든 사용처가 같은 텍스처를 공유 (image_cache)
+- load_image()마다 참조 수를 올리고 release_image()로 내림, 참조가 없는 이미지는 purge_unused()에서 해제
+- asset_preloader가 미리 만들어 둔 이미지는 참조 수 0으로 캐시에 들어가 있다가 load_image()에서 바로 반환
+"""
+import struct
+import pico2d
+
+# headless 모드 여부 (game_framework.run_headless에서 설정)
+headless = False
+
+#----------------------------------------------------------------
+class CachedImage:
+    """캐시 항목 - 이미지와 참조 수"""
+    __slots__ = ('image', 'ref_count')
+
+    def __init__(self, image):
+        self.image = image
+        self.ref_count = 0
+
+    def memory_size(self):
+        """텍스처 메모리 추정치 (RGBA 4바이트 x 픽셀 수)"""
+        return self.image.w * self.image.h * 4
+#----------------------------------------------------------------
+
+# 이미지 캐시 (경로 -> CachedImage)
+image_cache = {}
+
+#----------------------------------------------------------------
+class HeadlessImage:
+    """창 없이 실행할 때 쓰는 빈 이미지 - 크기 정보만 갖고 그리기 호출은 모두 무시"""
+
+    def __init__(self, path):
+        self.path = path
+        self.w, self.h = read_png_size(path)
+
+    def draw(self, x, y, w=None, h=None):
+        pass
+
+    def draw_to_origin(self, x, y, w=None, h=None):
+        pass
+
+    def rotate_draw(self, rad, x, y, w=None, h=None):
+        pass
+
+    def composite_draw(self, rad, flip, x, y, w=None, h=None):
+        pass
+
+    def clip_draw(self, left, bottom, width, height, x, y, w=None, h=None):
+        pass
+
+    def clip_composite_draw(self, left, bottom, width, height, rad, flip, x, y, w=None, h=None):
+        pass
+
+    def clip_draw_to_origin(self, left, bottom, width, height, x, y, w=None, h=None):
+        pass
+
+    def opacify(self, o):
+        pass
+#----------------------------------------------------------------
+
+def read_png_size(path):
+    """PNG 헤더(IHDR)에서 이미지 크기만 읽음 (디코딩 없음). 실패 시 (0, 0)"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(24)
+        if header[:8] != b'\x89PNG\r\n\x1a\n':
+            return 0, 0
+        return struct.unpack('>II', header[16:24])
+    except OSError:
+        return 0, 0
+
+def register_preloaded(path, image):
+    """미리 로드한 이미지 등록 - 이후 load_image(path)는 디스크를 읽지 않고 이 이미지를 반환"""
+    if path not in image_cache:
+        image_cache[path] = CachedImage(image)
+
+def is_preloaded(path):
+    return path in image_cache
+
+def load_image(path):
+    """
+    이미지 로드 - 캐시에 있으면 공유 이미지를 반환하고 참조 수 증가
+    (headless 모드면 HeadlessImage 생성)
+    사용이 끝나면 release_image(path) 호출
+    """
+    entry = image_cache.get(path)
+    if entry is None:
+        image = HeadlessImage(path) if headless else pico2d.load_image(path)
+        entry = image_cache[path] = CachedImage(image)
+    entry.ref_count += 1
+    return entry.image
+
+def release_image(path):
+    """load_image로 얻은 이미지의 참조 반환 (텍스처는 purge_unused에서 해제)"""
+    entry = image_cache.get(path)
+    if entry is not None and entry.ref_count > 0:
+        entry.ref_count -= 1
+
+def purge_unused():
+    """참조 수가 0인 이미지를 캐시에서 제거 (텍스처 해제) - (제거한 수, 해제한 바이트) 반환"""
+    unused = [path for path, entry in image_cache.items() if entry.ref_count == 0]
+    freed = 0
+    for path in unused:
+        freed += image_cache.pop(path).memory_size()
+    return len(unused), freed
+
+def drop_headless_images():
+    """HeadlessImage 항목을 참조 수와 관계없이 캐시에서 제거 (headless 실행 종료 시) - 제거한 수 반환"""
+    stale = [path for path, entry in image_cache.items() if isinstance(entry.image, HeadlessImage)]
+    for path in stale:
+        del image_cache[path]
+    return len(stale)
+
+def memory_usage():
+    """(캐시 이미지 수, 사용 중인 이미지 수, 텍스처 메모리 추정 바이트) 반환"""
+    in_use = sum(1 for entry in image_cache.values() if entry.ref_count > 0)
+    total = sum(entry.memory_size() for entry in image_cache.values())
+    return len(image_cache), in_use, total
+
+def format_memory_usage():
+    count, in_use, total = memory_usage()
+    return f'이미지 캐시: {count}개 (사용 중 {in_use}개), 텍스처 약 {total / (1024 * 1024):.1f}MB'
@@ -0,0 +1,74 @@
+"""
+공간 해시 격자 - 바운딩 박스가 걸치는 칸에 항목을 등록하고, 박스와 겹치는 칸의 항목만 후보로 돌려줌
+- 칸 크기는 엔티티 크기(약 70px)보다 조금 크게 -> 한 엔티티는 보통 1~4칸에 등록
+- 항목마다 등록된 칸 범위를 기억해 위치가 바뀌면 그 항목만 다시 등록 (update)
+- play_scene.check_attack_collisions에서 틱마다 월드 엔티티의 get_bb로 다시 채우고 공격 박스로 질의
+"""
+
+CELL_SIZE = 128  # 칸 한 변 (픽셀)
+
+#----------------------------------------------------------------
+class SpatialHash:
+    """균일 격자 공간 해시 (항목은 해시 가능한 값 - 예: 월드 리스트의 인덱스)"""
+    __slots__ = ('cell_size', 'cells', 'ranges')
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}   # (칸 x, 칸 y) -> [항목, ...]
+        self.ranges = {}  # 항목 -> 등록된 칸 범위 (left, bottom, right, top)
+
+    def clear(self):
+        self.cells.clear()
+        self.ranges.clear()
+
+    def cell_range(self, bb):
+        """바운딩 박스가 걸치는 칸 범위 (양 끝 포함)"""
+        left, bottom, right, top = bb
+        size = self.cell_size
+        return int(left // size), int(bottom // size), int(right // size), int(top // size)
+
+    def insert(self, item, bb):
+        """bb가 걸치는 모든 칸에 항목 등록"""
+        cell_range = self.cell_range(bb)
+        self.ranges[item] = cell_range
+        cells = self.cells
+        left, bottom, right, top = cell_range
+        for cy in range(bottom, top + 1):
+            for cx in range(left, right + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = [item]
+                else:
+                    cell.append(item)
+
+    def remove(self, item):
+        """항목을 등록된 칸에서 제거"""
+        left, bottom, right, top = self.ranges.pop(item)
+        cells = self.cells
+        for cy in range(bottom, top + 1):
+            for cx in range(left, right + 1):
+                cell = cells[(cx, cy)]
+                cell.remove(item)
+                if not cell:
+                    del cells[(cx, cy)]
+
+    def update(self, item, bb):
+        """항목의 바운딩 박스가 바뀌었을 때 다시 등록 (걸치는 칸이 같으면 그대로)"""
+        if self.ranges.get(item) == self.cell_range(bb):
+            return
+        if item in self.ranges:
+            self.remove(item)
+        self.insert(item, bb)
+
+    def query(self, bb):
+        """bb와 겹치는 칸에 등록된 항목 집합 (후보 - 실제 겹침은 호출한 쪽에서 검사)"""
+        found = set()
+        cells = self.cells
+        left, bottom, right, top = self.cell_range(bb)
+        for cy in range(bottom, top + 1):
+            for cx in range(left, right + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+#----------------------------------------------------------------
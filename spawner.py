@@ -0,0 +1,144 @@
+"""
+몬스터 스포너 - 타입별 오브젝트 풀과 데이터로 정의한 웨이브 일정
+- 몬스터는 scene 진입 시 타입별로 미리 만들어 두고(POOL_SIZES), 웨이브가 오면 풀에서 꺼내 respawn
+  (싸우는 도중에 생성자, 상태 데이터 생성, 이미지 로드 비용이 들지 않음)
+- 사망한 몬스터는 월드에서 빠지면 풀로 돌아가고 다음 웨이브에서 재사용
+- 풀이 비어 있으면 새로 생성하고, 그 몬스터도 이후에는 풀에서 재사용
+- 웨이브 시작 시각은 timer_wheel에 예약 (scene 진입 시 timer_wheel.clear 뒤에 init 호출)
+"""
+import random
+import timer_wheel
+import ai_lod
+from gnome import Gnome
+from paddlefish import Paddlefish
+from panda import Panda
+
+# 스폰 가능한 몬스터 타입 (웨이브 데이터에서 쓰는 이름 -> 클래스)
+MONSTER_TYPES = {
+    'Gnome': Gnome,
+    'Paddlefish': Paddlefish,
+    'Panda': Panda,
+}
+
+# scene 진입 시 미리 만들어 둘 타입별 몬스터 수 (동시에 살아 있는 최대 수 기준)
+POOL_SIZES = {
+    'Gnome': 6,
+    'Paddlefish': 4,
+    'Panda': 2,
+}
+
+# 웨이브 일정 (시작 시각 순서)
+# time: scene 진입 후 시각 (초)
+# spawns: (몬스터 타입, 마릿수, 생성 영역 (left, bottom, right, top) 월드 좌표)
+#         영역의 크기가 0이면 그 위치에 고정 생성
+WAVES = [
+    # 첫 웨이브: 캐릭터 시작 위치(맵 중앙 1280, 1280) 주변 고정 위치
+    {'time': 0.0, 'spawns': [
+        ('Gnome', 1, (1580, 1380, 1580, 1380)),
+        ('Paddlefish', 1, (1080, 1130, 1080, 1130)),
+        ('Panda', 1, (1430, 1480, 1430, 1480)),
+    ]},
+    # 두 번째 웨이브: 맵 오른쪽 위 구역
+    {'time': 30.0, 'spawns': [
+        ('Gnome', 2, (1600, 1600, 2200, 2200)),
+        ('Paddlefish', 1, (1600, 1600, 2200, 2200)),
+    ]},
+    # 세 번째 웨이브: 맵 왼쪽 아래 구역과 오른쪽 아래 구역
+    {'time': 60.0, 'spawns': [
+        ('Gnome', 3, (300, 300, 1000, 1000)),
+        ('Paddlefish', 2, (1600, 300, 2200, 1000)),
+        ('Panda', 1, (1000, 300, 1600, 800)),
+    ]},
+]
+
+world = None    # 스폰된 몬스터를 추가할 월드 리스트 (play_scene.world)
+target = None   # 스폰된 몬스터가 추적할 캐릭터
+pools = {}      # 타입 이름 -> 대기 중인 몬스터 리스트
+timers = []     # 예약된 웨이브 타이머 (clear에서 취소)
+
+def init(world_list, target_character):
+    """타입별 풀을 미리 채우고 웨이브 일정 예약 (시각 0인 웨이브는 바로 스폰)"""
+    global world, target, pools, timers
+    world = world_list
+    target = target_character
+    pools = {name: [] for name in MONSTER_TYPES}
+    timers = []
+
+    for name, size in POOL_SIZES.items():
+        for _ in range(size):
+            pools[name].append(create(name))
+
+    for wave in WAVES:
+        if wave['time'] <= 0:
+            spawn_wave(wave)
+        else:
+            timers.append(timer_wheel.schedule(wave['time'], spawn_wave, wave))
+
+def clear():
+    """남은 웨이브 취소 및 풀에서 대기 중인 몬스터의 이미지 참조 반환 (월드에 있는 몬스터는 play_scene이 반환)"""
+    global world, target, pools, timers
+    for timer in timers:
+        timer_wheel.cancel(timer)
+    for pool in pools.values():
+        for monster in pool:
+            monster.release_images()
+    world = None
+    target = None
+    pools = {}
+    timers = []
+
+def create(name):
+    """풀에 넣을 몬스터 생성 (생성자가 예약한 상태 타이머는 스폰될 때까지 취소, AI LOD 버킷 배정)"""
+    monster = MONSTER_TYPES[name]()
+    monster.state_machine.cancel_timer()
+    ai_lod.assign(monster)
+    return monster
+
+def random_in(low, high):
+    """구간 안의 무작위 값 (고정 위치는 난수를 쓰지 않음)"""
+    if low == high:
+        return low
+    return random.uniform(low, high)
+
+def spawn(name, x, y):
+    """풀에서 몬스터를 꺼내 (x, y)에 되살리고 월드에 추가"""
+    pool = pools[name]
+    if pool:
+        monster = pool.pop()
+    else:
+        print(f"[스포너] {name} 풀이 비어 새로 생성합니다.")
+        monster = create(name)
+
+    monster.respawn(x, y)
+    monster.set_target_character(target)
+    world.append(monster)
+    return monster
+
+def spawn_wave(wave):
+    """웨이브 하나의 몬스터를 생성 영역 안에 스폰"""
+    count = 0
+    for name, number, (left, bottom, right, top) in wave['spawns']:
+        for _ in range(number):
+            spawn(name, random_in(left, right), random_in(bottom, top))
+            count += 1
+    print(f"[스포너] {wave['time']:.0f}초 웨이브: 몬스터 {count}마리 스폰")
+
+def recycle(obj):
+    """
+    월드에서 제거된 오브젝트가 스포너의 몬스터면 풀로 반환
+
+    Returns:
+        bool: 풀로 반환했으면 True (아니면 호출한 쪽에서 이미지 반환)
+    """
+    pool = pools.get(type(obj).__name__)
+    if pool is None:
+        return False
+    pool.append(obj)
+    return True
+
+def set_target(character):
+    """월드에 있는 몬스터와 이후 스폰될 몬스터의 추적 대상 변경"""
+    global target
+    target = character
+    for obj in world:
+        obj.set_target_character(character)  # 추적하지 않는 엔티티(캐릭터, Panda)는 Entity의 기본 구현으로 무시
@@ -1,25 +1,134 @@
-from event_to_string import event_to_string
+import random
+import transition_trace
+import timer_wheel
+
+# 상태 시간 제한이 끝났을 때 전달되는 이벤트 (event_check.timeout으로 검사)
+TIMEOUT_EVENT = ('TIMEOUT', 0)
+#----------------------------------------------------------------
+def event_signature(state_event):
+    """상태 이벤트의 디스패치 키 (이벤트 종류, SDL 타입, 키)"""
+    kind = state_event[0]
+    if kind == 'INPUT':
+        event = state_event[1]
+        return (kind, event.type, event.key)
+    return (kind, None, None)
+
+def compile_rules(rules):
+    """
+    규칙 테이블을 디스패치 맵으로 컴파일
+    {상태: {signature: [(guard 또는 None, 다음 상태), ...]}}
+
+    같은 signature의 규칙은 원래 순서를 유지한다 (예: a_down_combo가 a_down보다 먼저).
+    signature가 없는 조건이 하나라도 있는 상태는 컴파일하지 않고 선형 검사로 처리한다.
+    """
+    dispatch = {}
+    for state, transitions in rules.items():
+        table = {}
+        for check_event, next_state in transitions.items():
+            key = getattr(check_event, 'signature', None)
+            if key is None:
+                table = None
+                break
+            table.setdefault(key, []).append((getattr(check_event, 'guard', None), next_state))
+        if table is not None:
+            dispatch[state] = table
+    return dispatch
+
+# 컴파일된 규칙 테이블 캐시 - id(rules) -> (rules, dispatch)
+# 규칙 테이블은 엔티티 타입(클래스)마다 하나이므로 타입당 한 번만 컴파일된다.
+compiled_rules = {}
+
+def get_dispatch(rules):
+    """규칙 테이블의 디스패치 맵 반환 (처음 한 번만 컴파일)"""
+    entry = compiled_rules.get(id(rules))
+    if entry is None or entry[0] is not rules:
+        entry = (rules, compile_rules(rules))
+        compiled_rules[id(rules)] = entry
+    return entry[1]
 #----------------------------------------------------------------
 class StateMachine:
-    def __init__(self, start_state, rules):
+    """
+    상태 머신 - 상태 객체는 엔티티 타입마다 공유되는 싱글톤이고,
+    상태 메소드는 enter(owner, e) / exit(owner, e) / do(owner, dt) / draw(owner, camera)로
+    주인 엔티티를 인자로 받는다.
+
+    상태는 start_timer(delay)로 시간 제한을 걸 수 있다. 시간이 되면 timer_wheel이
+    TIMEOUT_EVENT를 규칙 테이블로 전달하고, 상태가 바뀌면 남은 타이머는 취소된다.
+    규칙의 다음 상태가 튜플이면 그중 하나를 무작위로 고른다.
+    """
+    __slots__ = ('owner', 'start_state', 'cur_state', 'next_state', 'rules', 'dispatch', 'timer')
+
+    def __init__(self, start_state, rules, owner=None):
+        self.owner = owner  # 상태 메소드에 전달되고 전이 추적에 표시되는 엔티티
+        self.start_state = start_state  # 시작 상태 (restart로 되돌아감)
         self.cur_state = start_state
-        self.cur_state.enter(('START',0))
+        self.next_state = None
+        self.timer = None
         self.rules = rules
+        self.dispatch = get_dispatch(rules)
+        if owner is not None:
+            # 시작 상태의 enter에서 owner.state_machine.start_timer를 쓸 수 있도록 먼저 연결
+            owner.state_machine = self
+        self.cur_state.enter(owner, ('START',0))
 
     def update(self, delta_time):
-        self.cur_state.do(delta_time)
+        self.cur_state.do(self.owner, delta_time)
 
     def draw(self, camera=None):
-        self.cur_state.draw(camera)
+        self.cur_state.draw(self.owner, camera)
 
     def handle_state_event(self, state_event):
-        for check_event in self.rules[self.cur_state].keys():
-            if check_event(state_event):
-                self.next_state = self.rules[self.cur_state][check_event]
-                self.cur_state.exit(state_event)
-                self.next_state.enter(state_event)
-                print(f'{self.cur_state.__class__.__name__} == {event_to_string(state_event)} ==> {self.next_state.__class__.__name__}')
-                self.cur_state = self.next_state
-                return
-        print(f'처리되지 않은 이벤트 {event_to_string(state_event)}가 발생.')
+        table = self.dispatch.get(self.cur_state)
+        if table is not None:
+            # 컴파일된 상태: 딕셔너리 한 번 조회 + guard만 검사
+            for guard, next_state in table.get(event_signature(state_event), ()):
+                if guard is None or guard(self.owner, state_event):
+                    self.transition(next_state, state_event)
+                    return
+        else:
+            # signature 없는 조건이 있는 상태: 규칙을 순서대로 검사
+            for check_event, next_state in self.rules[self.cur_state].items():
+                guard = getattr(check_event, 'guard', None)
+                if check_event(state_event) and (guard is None or guard(self.owner, state_event)):
+                    self.transition(next_state, state_event)
+                    return
+        if transition_trace.enabled:
+            transition_trace.record(self.owner, self.cur_state, None, state_event)
+
+    def start_timer(self, delay):
+        """현재 상태의 시간 제한 설정 - delay초 뒤 TIMEOUT_EVENT 전달 (기존 타이머는 취소)"""
+        timer_wheel.cancel(self.timer)
+        self.timer = timer_wheel.schedule(delay, self.on_timeout)
+
+    def cancel_timer(self):
+        timer_wheel.cancel(self.timer)
+        self.timer = None
+
+    def on_timeout(self):
+        self.timer = None
+        self.handle_state_event(TIMEOUT_EVENT)
+
+    def transition(self, next_state, state_event):
+        """규칙에 의한 전이 (exit -> enter)"""
+        if type(next_state) is tuple:
+            next_state = random.choice(next_state)
+        self.next_state = next_state
+        self.cur_state.exit(self.owner, state_event)
+        self.cancel_timer()
+        if transition_trace.enabled:
+            transition_trace.record(self.owner, self.cur_state, next_state, state_event)
+        self.cur_state = next_state
+        next_state.enter(self.owner, state_event)
+
+    def set_state(self, next_state, state_event):
+        """상태가 직접 요청하는 전이 (기존 동작대로 exit 없이 enter만 호출)"""
+        if transition_trace.enabled:
+            transition_trace.record(self.owner, self.cur_state, next_state, state_event)
+        self.cancel_timer()
+        self.cur_state = next_state
+        next_state.enter(self.owner, state_event)
+
+    def restart(self, state_event):
+        """시작 상태로 되돌림 (풀에서 재사용하는 엔티티의 respawn)"""
+        self.set_state(self.start_state, state_event)
 #----------------------------------------------------------------
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+hpa_star 검증 - 무작위 맵에서 평면 탐색 결과와 비교 (python -m pytest tests)
+- find_path의 도달 여부가 맵 전체 너비 우선 탐색과 같은지
+- 경유 타일을 local_path로 펼친 경로가 이동 규칙(flow_field와 같음)을 지키는지
+- set_tile로 타일을 바꾼 뒤의 부분 재계산과 캐시 무효화, 같은 클러스터에서 시작하는 질의의 캐시 경로
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flow_field import NEIGHBORS
+from hpa_star import HierarchicalPathfinder
+
+#----------------------------------------------------------------
+class CheckTile:
+    """검증용 타일 (충돌 여부만)"""
+    __slots__ = ('blocked',)
+
+    def __init__(self, blocked):
+        self.blocked = blocked
+
+    def is_collidable(self):
+        return self.blocked
+
+class CheckGrid:
+    """검증용 타일맵 (TileMap과 같은 width/height/get_tile/set_tile/tile_listeners, 이미지 없음)"""
+
+    def __init__(self, width, height, rng, density):
+        self.width, self.height = width, height
+        self.tiles = [[CheckTile(rng.random() < density) for _ in range(width)] for _ in range(height)]
+        self.tile_listeners = []
+
+    def get_tile(self, grid_x, grid_y):
+        return self.tiles[grid_y][grid_x]
+
+    def set_tile(self, grid_x, grid_y, blocked):
+        self.tiles[grid_y][grid_x] = CheckTile(blocked)
+        for listener in self.tile_listeners:
+            listener(grid_x, grid_y)
+#----------------------------------------------------------------
+
+def can_step(grid, x, y, nx, ny):
+    """한 칸 이동이 이동 규칙에 맞는지 (flow_field와 같은 규칙)"""
+    dx, dy = nx - x, ny - y
+    if max(abs(dx), abs(dy)) != 1 or not (0 <= nx < grid.width and 0 <= ny < grid.height):
+        return False
+    if grid.get_tile(nx, ny).is_collidable():
+        return False
+    return not (dx and dy and (grid.get_tile(nx, y).is_collidable() or grid.get_tile(x, ny).is_collidable()))
+
+def flat_reachable(grid, start, goal):
+    """맵 전체 너비 우선 탐색으로 도달 여부"""
+    if grid.get_tile(*start).is_collidable() or grid.get_tile(*goal).is_collidable():
+        return False
+    seen = {start}
+    stack = [start]
+    while stack:
+        x, y = stack.pop()
+        if (x, y) == goal:
+            return True
+        for dx, dy, _ in NEIGHBORS:
+            nx, ny = x + dx, y + dy
+            if (nx, ny) not in seen and can_step(grid, x, y, nx, ny):
+                seen.add((nx, ny))
+                stack.append((nx, ny))
+    return False
+
+def check_query(finder, grid, start, goal):
+    """find_path 결과를 평면 탐색과 비교하고 펼친 경로의 이동을 검사 (경로를 찾았으면 True)"""
+    path = finder.find_path(start, goal)
+    expected = flat_reachable(grid, start, goal)
+    assert (path is not None) == expected, f"도달 여부 불일치: {start} -> {goal} (평면 탐색: {expected})"
+    if path is None:
+        return False
+    assert path[0] == start and path[-1] == goal, f"경로 양 끝 불일치: {start} -> {goal}"
+    for a, b in zip(path, path[1:]):
+        steps = finder.local_path(a, b)
+        assert steps, f"경유 타일 사이 세부 경로 없음: {a} -> {b}"
+        for (x, y), (nx, ny) in zip(steps, steps[1:]):
+            assert can_step(grid, x, y, nx, ny), f"잘못된 이동: {(x, y)} -> {(nx, ny)}"
+    return True
+
+def test_start_on_entrance():
+    """시작 타일이 출입구일 때도 경계 건너편/같은 클러스터 출입구로 이어짐"""
+    for seed in range(10):
+        grid = CheckGrid(64, 64, random.Random(seed), 0.3)
+        finder = HierarchicalPathfinder(grid, cluster_size=8)
+        check_query(finder, grid, (47, 8), (39, 25))
+
+def test_random_maps_with_tile_changes():
+    """무작위 맵 질의 묶음 사이마다 타일을 바꿔 가며 평면 탐색과 비교 (같은 클러스터의 다른 시작 타일로 캐시 경로도 검사)"""
+    rng = random.Random(0)
+    size, cluster_size = 64, 8
+    found = hits = 0
+    for _ in range(4):
+        grid = CheckGrid(size, size, rng, 0.3)
+        finder = HierarchicalPathfinder(grid, cluster_size=cluster_size)
+        for _ in range(4):
+            for _ in range(60):
+                start = (rng.randrange(size), rng.randrange(size))
+                goal = (rng.randrange(size), rng.randrange(size))
+                found += check_query(finder, grid, start, goal)
+                left = start[0] - start[0] % cluster_size
+                bottom = start[1] - start[1] % cluster_size
+                nearby = (min(size - 1, left + rng.randrange(cluster_size)),
+                          min(size - 1, bottom + rng.randrange(cluster_size)))
+                found += check_query(finder, grid, nearby, goal)
+            for _ in range(30):
+                x, y = rng.randrange(size), rng.randrange(size)
+                grid.set_tile(x, y, not grid.get_tile(x, y).is_collidable())
+        hits += finder.cache_hits
+        finder.close()
+    assert found > 0 and hits > 0
@@ -3,8 +3,25 @@
 - 18종류의 타일 타입 지원
 - 각 타일은 개별 PNG 이미지 사용
 - 2차원 배열 기반 맵 구성
+- 타일의 절대 좌표 충돌박스는 타일을 놓을 때 한 번 계산해 칸별로 저장 (충돌 검사에서 새로 만들지 않음)
+- 여러 오브젝트의 충돌 검사는 check_collision_batch로 한 번에 (NumPy 필요, 없으면 오브젝트별 check_collision)
+  충돌박스를 MASK_CELL 픽셀 칸의 불리언 마스크로 칠하고 누적합 테이블(summed-area table)에서 박스마다 네 값만 읽음
+  박스가 BATCH_MIN_COUNT개 미만이면 오브젝트별 check_collision으로 처리 - 일반 play_scene은 캐릭터를 한 명씩,
+  몬스터를 한 틱에 많아야 십여 마리씩 검사하므로 대부분 이 경로이고, NumPy 경로는 주로 --horde 무리에서 쓰임
 """
 from pico2d import *
+from resource_manager import load_image, release_image
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 충돌 마스크 칸 크기 (픽셀) - 모든 COLLISION_BOXES 경계(0, 20, 32, 44, 64)가 4의 배수라 마스크가 충돌박스와 정확히 같음
+MASK_CELL = 4
+
+# 이보다 적은 박스는 오브젝트별 check_collision이 더 빠름 (70px 박스 기준 약 12개에서 역전)
+BATCH_MIN_COUNT = 12
 
 class TileType:
     """타일 타입 정의"""
@@ -168,6 +185,17 @@ class Tile:
                 return None
         return None
 
+    @classmethod
+    def unload_all_tiles(cls):
+        """타일 이미지 참조를 모두 반환 (다음 사용 시 다시 로드)"""
+        for tile_type, images in cls.tile_images.items():
+            if images is None:
+                continue
+            image_path = cls.TILE_IMAGE_FILES[tile_type]
+            for path in image_path if isinstance(image_path, list) else (image_path,):
+                release_image(path)
+        cls.tile_images.clear()
+
     def __init__(self, tile_type, grid_x, grid_y):
         """
         타일 생성
@@ -291,15 +319,29 @@ class TileMap:
         # 타일 배열 초기화 (2차원 배열)
         self.tiles = [[None for _ in range(width)] for _ in range(height)]
 
+        # 칸별 절대 좌표 충돌박스 (칸 번호 y * width + x -> ((left, bottom, right, top), ...), 충돌 없으면 빈 튜플)
+        self.collision_boxes = [()] * (width * height)
+
+        # 충돌 마스크 누적합 테이블 (check_collision_batch에서 필요할 때 생성, 타일이 바뀌면 다시 생성)
+        self.solid_table = None
+
         # 디버그 모드
         self.debug_mode = False
 
+        # 타일 변경 알림 - set_tile 후 listener(grid_x, grid_y) 호출 (길찾기 데이터 무효화 등)
+        self.tile_listeners = []
+
         print(f"타일맵 생성: {width}x{height} 타일")
 
     def set_tile(self, grid_x, grid_y, tile_type):
-        """특정 위치에 타일 설정"""
+        """특정 위치에 타일 설정 (등록된 tile_listeners에 알림)"""
         if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
-            self.tiles[grid_y][grid_x] = Tile(tile_type, grid_x, grid_y)
+            tile = Tile(tile_type, grid_x, grid_y)
+            self.tiles[grid_y][grid_x] = tile
+            self.collision_boxes[grid_y * self.width + grid_x] = tuple(tile.get_bb())
+            self.solid_table = None
+            for listener in self.tile_listeners:
+                listener(grid_x, grid_y)
 
     def get_tile(self, grid_x, grid_y):
         """특정 위치의 타일 반환"""
@@ -320,6 +362,8 @@ class TileMap:
         self.height = height
         self.width = width
         self.tiles = [[None for _ in range(width)] for _ in range(height)]
+        self.collision_boxes = [()] * (width * height)  # set_tile에서 타일별로 채움
+        self.solid_table = None
 
         # 배열을 아래에서 위로 순회 (y=0이 아래)
         for y in range(height):
@@ -347,27 +391,79 @@ class TileMap:
         bottom = y - height / 2
         top = y + height / 2
 
-        # 타일 그리드 좌표로 변환
-        tile_left = int(left / Tile.TILE_SIZE)
-        tile_right = int(right / Tile.TILE_SIZE)
-        tile_bottom = int(bottom / Tile.TILE_SIZE)
-        tile_top = int(top / Tile.TILE_SIZE)
+        # 타일 그리드 좌표로 변환 (맵 밖 칸은 충돌 없음)
+        tile_left = max(0, int(left / Tile.TILE_SIZE))
+        tile_right = min(self.width - 1, int(right / Tile.TILE_SIZE))
+        tile_bottom = max(0, int(bottom / Tile.TILE_SIZE))
+        tile_top = min(self.height - 1, int(top / Tile.TILE_SIZE))
 
-        # 범위 내 타일 검사
+        # 범위 내 칸의 미리 계산된 충돌박스 검사
+        boxes = self.collision_boxes
         for ty in range(tile_bottom, tile_top + 1):
+            row = ty * self.width
             for tx in range(tile_left, tile_right + 1):
-                tile = self.get_tile(tx, ty)
-                if tile and tile.is_collidable():
-                    # 타일의 모든 충돌박스 가져오기
-                    bbs = tile.get_bb()
-                    for bb in bbs:
-                        tl, tb, tr, tt = bb
-                        # AABB 충돌 검사
-                        if left < tr and right > tl and bottom < tt and top > tb:
-                            return True
+                for tl, tb, tr, tt in boxes[row + tx]:
+                    # AABB 충돌 검사
+                    if left < tr and right > tl and bottom < tt and top > tb:
+                        return True
 
         return False
 
+    def build_solid_table(self):
+        """
+        충돌 마스크의 누적합 테이블 생성
+        mask[row, col]: MASK_CELL 칸 (col, row)가 충돌박스 안이면 True
+        table[row, col]: mask[:row, :col]의 충돌 칸 수 (0행/0열은 0)
+        """
+        rows = self.height * Tile.TILE_SIZE // MASK_CELL
+        cols = self.width * Tile.TILE_SIZE // MASK_CELL
+        mask = np.zeros((rows, cols), dtype=bool)
+        for boxes in self.collision_boxes:
+            for left, bottom, right, top in boxes:
+                mask[bottom // MASK_CELL:top // MASK_CELL, left // MASK_CELL:right // MASK_CELL] = True
+
+        table = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+        np.cumsum(mask, axis=0, out=table[1:, 1:])
+        np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+        self.solid_table = table
+        return table
+
+    def check_collision_batch(self, xs, ys, widths, heights):
+        """
+        여러 박스의 충돌 검사를 한 번에 (각 인자는 같은 길이의 시퀀스, 박스 i는 check_collision(xs[i], ys[i], widths[i], heights[i])와 같은 결과)
+        크기가 0인 박스는 내부가 없으므로 항상 충돌 없음
+
+        Returns:
+            박스별 충돌 여부 (NumPy로 검사하면 bool 배열, 박스가 적거나 NumPy가 없으면 bool 리스트)
+        """
+        if np is None or len(xs) < BATCH_MIN_COUNT:
+            return [self.check_collision(x, y, w, h) for x, y, w, h in zip(xs, ys, widths, heights)]
+
+        table = self.solid_table
+        if table is None:
+            table = self.build_solid_table()
+        rows, cols = table.shape[0] - 1, table.shape[1] - 1
+        stride = cols + 1
+        flat = table.ravel()
+
+        # 마스크 칸 단위 중심/반크기 (MASK_CELL이 2의 거듭제곱이라 나눗셈과 같은 값)
+        center_x = np.asarray(xs, dtype=np.float64) * (1 / MASK_CELL)
+        center_y = np.asarray(ys, dtype=np.float64) * (1 / MASK_CELL)
+        half_width = np.asarray(widths, dtype=np.float64) * (0.5 / MASK_CELL)
+        half_height = np.asarray(heights, dtype=np.float64) * (0.5 / MASK_CELL)
+
+        # 박스와 내부가 겹치는 마스크 칸 범위 [col0, col1) x [row0, row1) (맵 밖 칸은 충돌 없음, 행은 flat 오프셋으로)
+        col0 = np.floor(center_x - half_width).clip(0, cols).astype(np.intp)
+        col1 = np.ceil(center_x + half_width).clip(0, cols).astype(np.intp)
+        row0 = np.floor(center_y - half_height).clip(0, rows).astype(np.intp) * stride
+        row1 = np.ceil(center_y + half_height).clip(0, rows).astype(np.intp) * stride
+        np.maximum(col1, col0, out=col1)
+        np.maximum(row1, row0, out=row1)
+
+        # 범위 안의 충돌 칸 수 (누적합 테이블의 네 모서리)
+        solid = flat[row1 + col1] - flat[row0 + col1] - flat[row1 + col0] + flat[row0 + col0]
+        return solid > 0
+
     def get_colliding_tiles(self, x, y, width, height):
         """
         특정 영역과 충돌하는 모든 타일 반환
@@ -387,25 +483,22 @@ class TileMap:
         bottom = y - height / 2
         top = y + height / 2
 
-        # 타일 그리드 좌표로 변환
-        tile_left = int(left / Tile.TILE_SIZE)
-        tile_right = int(right / Tile.TILE_SIZE)
-        tile_bottom = int(bottom / Tile.TILE_SIZE)
-        tile_top = int(top / Tile.TILE_SIZE)
+        # 타일 그리드 좌표로 변환 (맵 밖 칸은 충돌 없음)
+        tile_left = max(0, int(left / Tile.TILE_SIZE))
+        tile_right = min(self.width - 1, int(right / Tile.TILE_SIZE))
+        tile_bottom = max(0, int(bottom / Tile.TILE_SIZE))
+        tile_top = min(self.height - 1, int(top / Tile.TILE_SIZE))
 
-        # 범위 내 타일 검사
+        # 범위 내 칸의 미리 계산된 충돌박스 검사
+        boxes = self.collision_boxes
         for ty in range(tile_bottom, tile_top + 1):
+            row = ty * self.width
             for tx in range(tile_left, tile_right + 1):
-                tile = self.get_tile(tx, ty)
-                if tile and tile.is_collidable():
-                    # 타일의 모든 충돌박스 가져오기
-                    bbs = tile.get_bb()
-                    for bb in bbs:
-                        tl, tb, tr, tt = bb
-                        # AABB 충돌 검사
-                        if left < tr and right > tl and bottom < tt and top > tb:
-                            colliding.append(tile)
-                            break  # 같은 타일 중복 추가 방지
+                for tl, tb, tr, tt in boxes[row + tx]:
+                    # AABB 충돌 검사
+                    if left < tr and right > tl and bottom < tt and top > tb:
+                        colliding.append(self.tiles[ty][tx])
+                        break  # 같은 타일 중복 추가 방지
 
         return colliding
 
@@ -0,0 +1,120 @@
+"""
+타이머 휠 - 상태 시간 제한/쿨다운을 한 곳에서 처리하는 계층형 타이머 휠
+- 상태가 매 틱 자기 타이머를 세는 대신 마감 시각을 등록하면, 마감 틱에만 콜백이 호출됨
+- 타이머를 기다리는 엔티티는 틱마다 비용이 들지 않음
+- 0단계: 256칸 x 1틱, 1단계: 64칸 x 256틱, 2단계: 64칸 x 16384틱, 3단계: 64칸 x 1048576틱
+  (상위 단계 칸은 시간이 되면 아래 단계로 옮겨짐)
+- 취소는 플래그만 세우고 칸에서 꺼낼 때 버림 (O(1))
+"""
+import math
+
+# 단계별 칸 수 (비트 수)
+LEVEL_BITS = (8, 6, 6, 6)
+
+#----------------------------------------------------------------
+class Timer:
+    """등록된 타이머 (schedule의 반환값, cancel에 전달)"""
+    __slots__ = ('deadline', 'callback', 'args', 'cancelled')
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline    # 마감 틱
+        self.callback = callback
+        self.args = args
+        self.cancelled = False      # 취소되었거나 이미 실행됨
+#----------------------------------------------------------------
+
+resolution = 1.0 / 120   # 한 틱의 시간 (초)
+now = 0                  # 현재 틱
+elapsed = 0.0            # advance로 전달된 누적 시간 (초)
+levels = [[[] for _ in range(1 << bits)] for bits in LEVEL_BITS]
+overflow = []            # 휠 전체 범위를 넘는 타이머 (최상위 단계가 한 바퀴 돌 때 다시 배치)
+
+def clear(tick_duration=None):
+    """모든 타이머 제거 및 시간 초기화 (scene 진입/종료 시 호출)"""
+    global resolution, now, elapsed, levels, overflow
+    if tick_duration:
+        resolution = tick_duration
+    now = 0
+    elapsed = 0.0
+    levels = [[[] for _ in range(1 << bits)] for bits in LEVEL_BITS]
+    overflow = []
+
+def _insert(timer):
+    """마감까지 남은 틱 수에 맞는 단계의 칸에 타이머 배치"""
+    delta = timer.deadline - now
+    shift = 0
+    for level, bits in enumerate(LEVEL_BITS):
+        if delta < (1 << (shift + bits)):
+            levels[level][(timer.deadline >> shift) & ((1 << bits) - 1)].append(timer)
+            return
+        shift += bits
+    overflow.append(timer)
+
+def schedule(delay, callback, *args):
+    """
+    delay초 뒤에 callback(*args) 호출 예약
+
+    Returns:
+        Timer: cancel()에 전달할 핸들
+    """
+    ticks = max(1, math.ceil(delay / resolution - 1e-6))
+    timer = Timer(now + ticks, callback, args)
+    _insert(timer)
+    return timer
+
+def cancel(timer):
+    """예약 취소 (None이나 이미 실행된 타이머도 허용)"""
+    if timer is not None:
+        timer.cancelled = True
+
+def remaining(timer):
+    """타이머 마감까지 남은 시간 (초), 취소/실행된 타이머는 0"""
+    if timer is None or timer.cancelled:
+        return 0.0
+    return (timer.deadline - now) * resolution
+
+def _cascade():
+    """상위 단계 칸이 현재 시각 구간에 들어오면 아래 단계로 다시 배치"""
+    global overflow
+    shift = 0
+    for level in range(1, len(LEVEL_BITS)):
+        shift += LEVEL_BITS[level - 1]
+        if now & ((1 << shift) - 1):
+            return
+        slot = (now >> shift) & ((1 << LEVEL_BITS[level]) - 1)
+        bucket = levels[level][slot]
+        if bucket:
+            levels[level][slot] = []
+            for timer in bucket:
+                if not timer.cancelled:
+                    _insert(timer)
+
+    # 최상위 단계까지 한 바퀴 돌았으면 범위 밖 타이머 다시 배치
+    pending, overflow = overflow, []
+    for timer in pending:
+        if not timer.cancelled:
+            _insert(timer)
+
+def step():
+    """한 틱 전진하고 마감된 타이머 실행"""
+    global now
+    now += 1
+    _cascade()
+
+    slot = now & ((1 << LEVEL_BITS[0]) - 1)
+    bucket = levels[0][slot]
+    if not bucket:
+        return
+    levels[0][slot] = []
+    for timer in bucket:
+        if not timer.cancelled:
+            timer.cancelled = True
+            timer.callback(*timer.args)
+
+def advance(delta_time):
+    """delta_time초만큼 시간을 진행 (틱 단위로 나눠 step 호출)"""
+    global elapsed
+    elapsed += delta_time
+    target = int(elapsed / resolution + 1e-6)
+    while now < target:
+        step()
@@ -2,24 +2,45 @@
 타이틀 Scene - 게임 시작 화면
 """
 from pico2d import *
+from resource_manager import load_image, release_image
+from asset_preloader import AssetPreloader, play_scene_assets
 import game_framework
-import play_scene
+
+# Scene 렌더링 속성
+opaque = True  # 화면 전체를 덮는 scene (아래 scene은 그리지 않음)
+
+# 로딩 진행 막대 설정
+PRELOAD_BUDGET = 0.004   # 프레임당 텍스처 생성에 쓸 최대 시간 (초) - draw에서 프레임마다 한 번 사용
+PROGRESS_BAR_HEIGHT = 6
 
 # Scene 변수
 image = None
+preloader = None
 
 def enter():
     """Scene 진입 시 호출"""
-    global image
+    global image, preloader
     # TODO: 타이틀 배경 이미지 로드
     image = load_image('resource/title.png')
-    pass
+
+    # 타이틀 화면이 떠 있는 동안 play_scene 이미지를 미리 로드
+    preloader = AssetPreloader(play_scene_assets())
+    preloader.start()
 
 def exit():
     """Scene 종료 시 호출"""
-    global image
-    # 리소스 해제는 pico2d가 자동으로 처리
-    pass
+    global image, preloader
+    # 로딩이 덜 끝났으면 play_scene으로 갈 때는 남은 이미지를 마저 처리 (play_scene에서 다시 읽지 않도록),
+    # 게임을 끝낼 때는 기다리지 않고 중단
+    if preloader:
+        if game_framework.running:
+            preloader.finish()
+        else:
+            preloader.cancel()
+        preloader = None
+    # 타이틀 이미지 참조 반환 (텍스처는 resource_manager.purge_unused에서 해제)
+    release_image('resource/title.png')
+    image = None
 
 def pause():
     """Scene이 일시정지될 때 호출"""
@@ -36,13 +57,13 @@ def handle_events(event):
             game_framework.quit()
         elif event.key == SDLK_SPACE or event.key == SDLK_RETURN:
             # Space 또는 Enter 키를 누르면 게임 시작
-            game_framework.change_scene(play_scene)
+            game_framework.change_scene('play_scene')
 
 def update(delta_time):
     """업데이트"""
     pass
 
-def draw():
+def draw(alpha=1.0):
     """렌더링"""
     # 타이틀 배경 이미지를 창 크기에 맞게 그리기
     if image:
@@ -52,3 +73,11 @@ def draw():
 
         # 이미지를 캔버스 크기에 맞게 늘려서 그리기
         image.draw(canvas_width // 2, canvas_height // 2, canvas_width, canvas_height)
+
+    # 프리로드 진행 막대 (화면 하단)
+    # update는 시뮬레이션 스텝마다(120Hz, 따라잡기 프레임에는 여러 번) 불리므로 예산은 프레임당 한 번인 draw에서 사용
+    # (headless 실행은 draw를 건너뛰지만 exit에서 남은 이미지를 마저 처리)
+    if preloader and not preloader.is_done():
+        preloader.pump(PRELOAD_BUDGET)
+        width = get_canvas_width()
+        draw_rectangle(0, 0, width * preloader.progress(), PROGRESS_BAR_HEIGHT, 255, 255, 255, 255, True)
@@ -0,0 +1,84 @@
+"""
+상태 전이 추적 - print 대신 링 버퍼에 전이 기록
+- (틱, 엔티티, 이전 상태, 다음 상태, 이벤트)를 미리 할당된 링 버퍼에 저장
+- 문자열 변환은 dump() 할 때만 수행
+- 꺼져 있으면(enabled = False) StateMachine은 플래그 하나만 확인하고 넘어감
+"""
+from array import array
+import game_framework
+from event_to_string import event_to_string
+
+enabled = False
+capacity = 0
+index = 0        # 다음에 기록할 위치
+count = 0        # 기록된 전이 수 (최대 capacity)
+
+# 링 버퍼 (열 단위로 미리 할당)
+ticks = array('q')
+entities = []
+from_states = []
+to_states = []
+events = []
+
+def enable(size=4096):
+    """추적 시작 - 버퍼를 size 크기로 미리 할당"""
+    global enabled, capacity, ticks, entities, from_states, to_states, events
+    capacity = size
+    ticks = array('q', [0]) * size
+    entities = [None] * size
+    from_states = [None] * size
+    to_states = [None] * size
+    events = [None] * size
+    clear()
+    enabled = True
+
+def disable():
+    global enabled
+    enabled = False
+
+def clear():
+    global index, count
+    index = 0
+    count = 0
+
+def record(entity, from_state, to_state, state_event):
+    """
+    전이 기록 (to_state가 None이면 처리되지 않은 이벤트)
+    호출하는 쪽에서 enabled를 먼저 확인한다.
+    """
+    global index, count
+    i = index
+    ticks[i] = game_framework.sim_tick
+    entities[i] = entity
+    from_states[i] = from_state
+    to_states[i] = to_state
+    events[i] = state_event
+    index = (i + 1) % capacity
+    if count < capacity:
+        count += 1
+
+def _name(obj):
+    return 'None' if obj is None else obj.__class__.__name__
+
+def entries():
+    """기록을 오래된 것부터 (틱, 엔티티, 이전 상태, 다음 상태, 이벤트)로 반환"""
+    start = index - count
+    for k in range(count):
+        i = (start + k) % capacity
+        yield ticks[i], entities[i], from_states[i], to_states[i], events[i]
+
+def format_entry(tick, entity, from_state, to_state, state_event):
+    entity_name = f'{_name(entity)}#{id(entity) & 0xffff:04x}' if entity is not None else '-'
+    if to_state is None:
+        return f'{tick:>8} {entity_name:<16} {_name(from_state)} 처리되지 않은 이벤트 {event_to_string(state_event)}'
+    return f'{tick:>8} {entity_name:<16} {_name(from_state)} == {event_to_string(state_event)} ==> {_name(to_state)}'
+
+def dump(path=None):
+    """기록을 문자열로 변환해 파일로 저장 (path가 없으면 콘솔 출력)"""
+    lines = [format_entry(*entry) for entry in entries()]
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        print(f'상태 전이 기록 저장: {path} ({len(lines)}개)')
+    else:
+        print('\n'.join(lines))
@@ -1,6 +1,10 @@
 from pico2d import *
 from event_check import *
 from state_machine import StateMachine
+from entity import Entity
+from animation import AnimationClip, ONCE
+import event_pump
+import timer_wheel
 
 #----------------------------------------------------------------
 # 전역 설정 - 여기서 일괄 수정
@@ -24,320 +28,279 @@ MOVE_SPEED = 300  # 픽셀/초
 # 체력
 MAX_HP = 200
 
+# ATTACK1이 끝난 뒤 콤보(ATTACK2)를 입력할 수 있는 시간 (초)
+COMBO_WINDOW = 0.5
+
 # 공격력
 ATTACK1_POWER = 30  # 기본 공격
 ATTACK2_POWER = 50  # 콤보 공격
 #----------------------------------------------------------------
 
+# 애니메이션 클립 (시트별로 한 번 만들어 모든 Warrior가 공유)
+# 공격은 한 번 재생 후 멈추고, 'hit' 구간 동안 공격 판정 (콤보는 더 길게)
+IDLE_CLIP = AnimationClip(8, 8, PIXEL_WIDTH, PIXEL_HEIGHT)
+RUN_CLIP = AnimationClip(6, 10, PIXEL_WIDTH, PIXEL_HEIGHT)
+ATTACK1_CLIP = AnimationClip(4, 12, PIXEL_WIDTH, PIXEL_HEIGHT, ONCE, events={'hit': (1, 2)})
+ATTACK2_CLIP = AnimationClip(4, 12, PIXEL_WIDTH, PIXEL_HEIGHT, ONCE, events={'hit': (1, 3)})
+
 class WIdle:
-    def __init__(self, warrior):
-        self.warrior = warrior
-        self.animation_speed = 8  # 초당 프레임 수
+    def __init__(self):
+        self.clip = IDLE_CLIP
 
-    def enter(self, e):
-        self.warrior.frame = 0
-        self.warrior.dirx = 0
-        self.warrior.diry = 0
+    def enter(self, warrior, e):
+        warrior.frame = 0
+        warrior.dirx = 0
+        warrior.diry = 0
 
-    def exit(self, e):
+    def exit(self, warrior, e):
         pass
 
-    def do(self, delta_time):
-        import time
-        self.warrior.frame = (self.warrior.frame + self.animation_speed * delta_time) % 8
-
-        if self.warrior.attack1_end_time:
-            elapsed = time.time() - self.warrior.attack1_end_time
-            if elapsed > 0.5:
-                self.warrior.can_combo = False
-                self.warrior.attack1_end_time = None
-                print("콤보 타임 종료")
-
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.warrior.x, self.warrior.y)
-        else:
-            screen_x, screen_y = self.warrior.x, self.warrior.y
+    def do(self, warrior, delta_time):
+        warrior.frame = self.clip.advance(warrior.frame, delta_time)
 
-        if self.warrior.face_dir == 1:
-            self.warrior.imageI.clip_draw(int(self.warrior.frame) * 192,0,192,192,screen_x,screen_y)
-        else:
-            self.warrior.imageI.clip_composite_draw(int(self.warrior.frame) * 192,0,192,192,0,'h',screen_x,screen_y,192,192)
+    def draw(self, warrior, camera=None):
+        self.clip.draw(warrior.imageI, warrior, camera)
 #----------------------------------------------------------------
 class WRun:
-    def __init__(self, warrior):
-        self.warrior = warrior
-        self.animation_speed = 10  # 초당 프레임 수
+    def __init__(self):
+        self.clip = RUN_CLIP
         self.move_speed = MOVE_SPEED  # 전역 설정에서 가져옴
 
-    def enter(self, e):
+    def enter(self, warrior, e):
         # 공격에서 넘어올 때 이동 속도 초기화
-        self.warrior.dirx = 0
-        self.warrior.diry = 0
+        warrior.dirx = 0
+        warrior.diry = 0
 
         if left_down(e):
-            self.warrior.keys['left'] = True
+            warrior.keys['left'] = True
         elif left_up(e):
-            self.warrior.keys['left'] = False
+            warrior.keys['left'] = False
         elif right_down(e):
-            self.warrior.keys['right'] = True
+            warrior.keys['right'] = True
         elif right_up(e):
-            self.warrior.keys['right'] = False
+            warrior.keys['right'] = False
         elif up_down(e):
-            self.warrior.keys['up'] = True
+            warrior.keys['up'] = True
         elif up_up(e):
-            self.warrior.keys['up'] = False
+            warrior.keys['up'] = False
         elif down_down(e):
-            self.warrior.keys['down'] = True
+            warrior.keys['down'] = True
         elif down_up(e):
-            self.warrior.keys['down'] = False
+            warrior.keys['down'] = False
 
-    def exit(self, e):
+    def exit(self, warrior, e):
         pass
 
-    def do(self, delta_time):
-        import time
-        self.warrior.frame = (self.warrior.frame + self.animation_speed * delta_time) % 6
-
-        if self.warrior.attack1_end_time:
-            elapsed = time.time() - self.warrior.attack1_end_time
-            if elapsed > 0.5:
-                self.warrior.can_combo = False
-                self.warrior.attack1_end_time = None
-                print("콤보 타임 종료")
-
-        self.warrior.dirx = 0
-        self.warrior.diry = 0
-
-        if self.warrior.keys['right']:
-            self.warrior.dirx += 1
-        if self.warrior.keys['left']:
-            self.warrior.dirx -= 1
-        if self.warrior.keys['up']:
-            self.warrior.diry += 1
-        if self.warrior.keys['down']:
-            self.warrior.diry -= 1
-
-        if self.warrior.dirx > 0:
-            self.warrior.face_dir = 1
-        elif self.warrior.dirx < 0:
-            self.warrior.face_dir = -1
-
-        self.warrior.x += self.warrior.dirx * self.move_speed * delta_time
-        self.warrior.y += self.warrior.diry * self.move_speed * delta_time
-
-        if not any(self.warrior.keys.values()):
-            self.warrior.state_machine.cur_state = self.warrior.IDLE
-            self.warrior.IDLE.enter(('STOP', 0))
+    def do(self, warrior, delta_time):
+        warrior.frame = self.clip.advance(warrior.frame, delta_time)
 
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.warrior.x, self.warrior.y)
-        else:
-            screen_x, screen_y = self.warrior.x, self.warrior.y
+        warrior.dirx = 0
+        warrior.diry = 0
 
-        if self.warrior.face_dir == 1:
-            self.warrior.imageR.clip_draw(int(self.warrior.frame) * 192,0,192,192,screen_x,screen_y)
-        else:
-            self.warrior.imageR.clip_composite_draw(int(self.warrior.frame) * 192,0,192,192,0,'h',screen_x,screen_y,192,192)
+        if warrior.keys['right']:
+            warrior.dirx += 1
+        if warrior.keys['left']:
+            warrior.dirx -= 1
+        if warrior.keys['up']:
+            warrior.diry += 1
+        if warrior.keys['down']:
+            warrior.diry -= 1
+
+        if warrior.dirx > 0:
+            warrior.face_dir = 1
+        elif warrior.dirx < 0:
+            warrior.face_dir = -1
+
+        warrior.x += warrior.dirx * self.move_speed * delta_time
+        warrior.y += warrior.diry * self.move_speed * delta_time
+
+        if not any(warrior.keys.values()):
+            warrior.state_machine.set_state(warrior.IDLE, ('STOP', 0))
+
+    def draw(self, warrior, camera=None):
+        self.clip.draw(warrior.imageR, warrior, camera)
 
 #----------------------------------------------------------------
 class WAttack1:
-    def __init__(self, warrior):
-        self.warrior = warrior
-        self.animation_speed = 12  # 초당 프레임 수
-        self.attack_active_frames = [1, 2]  # 공격 판정이 활성화되는 프레임
-
-    def enter(self, e):
-        self.warrior.frame = 0
-        self.warrior.attack1_end_time = None
-        self.warrior.can_combo = False
-        self.animation_finished = False
-        self.warrior.attack1_active = False  # 공격 판정 활성화 플래그
+    def __init__(self):
+        self.clip = ATTACK1_CLIP  # 'hit' 구간에서 공격 판정
+
+    def enter(self, warrior, e):
+        warrior.frame = 0
+        warrior.cancel_combo_window()
+        warrior.state_data.animation_finished = False
+        warrior.attack1_active = False  # 공격 판정 활성화 플래그
         # 공격 시작 시 이동 속도 초기화
-        self.warrior.dirx = 0
-        self.warrior.diry = 0
+        warrior.dirx = 0
+        warrior.diry = 0
         print(f"[DEBUG] Warrior ATTACK1 시작")
 
-    def exit(self, e):
+    def exit(self, warrior, e):
         pass
 
-    def do(self, delta_time):
-        import time
-
-        # 이전 프레임의 정수 값 저장
-        prev_frame_int = int(self.warrior.frame)
-
-        # 프레임 업데이트
-        self.warrior.frame = (self.warrior.frame + self.animation_speed * delta_time) % 4
-
-        # 현재 프레임의 정수 값
-        curr_frame_int = int(self.warrior.frame)
+    def do(self, warrior, delta_time):
+        # 프레임 업데이트 (ONCE 클립 - 마지막 프레임에서 멈춤)
+        warrior.frame = self.clip.advance(warrior.frame, delta_time)
 
         # 공격 판정 프레임 체크
-        if curr_frame_int in self.attack_active_frames:
-            if not self.warrior.attack1_active:
-                self.warrior.attack1_active = True
-                print(f"[DEBUG] Warrior ATTACK1 판정 활성화! (프레임: {curr_frame_int})")
+        if self.clip.in_event('hit', warrior.frame):
+            if not warrior.attack1_active:
+                warrior.attack1_active = True
+                print(f"[DEBUG] Warrior ATTACK1 판정 활성화! (프레임: {int(warrior.frame)})")
         else:
-            self.warrior.attack1_active = False
-
-        # 프레임이 한 바퀴 돌았는지 확인 (3 -> 0으로 wrap around)
-        # 또는 정확히 0이 되었을 때
-        if not self.animation_finished and (prev_frame_int > curr_frame_int or (prev_frame_int == 3 and curr_frame_int == 0)):
-            self.animation_finished = True
-            self.warrior.attack1_end_time = time.time()
-            self.warrior.can_combo = True
-            self.warrior.attack1_active = False
+            warrior.attack1_active = False
+
+        # 애니메이션을 끝까지 재생했는지 확인
+        if not warrior.state_data.animation_finished and self.clip.is_finished(warrior.frame):
+            warrior.state_data.animation_finished = True
+            warrior.start_combo_window()
+            warrior.attack1_active = False
             print(f"[DEBUG] Warrior ATTACK1 완료, 콤보 윈도우 시작")
 
             # 공격 종료 시 이동 속도 초기화
-            self.warrior.dirx = 0
-            self.warrior.diry = 0
-
-            # 키 눌림 상태 확인 (SDL 이벤트로 확인)
-            from sdl2 import SDL_GetKeyboardState, SDL_SCANCODE_LEFT, SDL_SCANCODE_RIGHT, SDL_SCANCODE_UP, SDL_SCANCODE_DOWN
-            key_state = SDL_GetKeyboardState(None)
-            self.warrior.keys['left'] = bool(key_state[SDL_SCANCODE_LEFT])
-            self.warrior.keys['right'] = bool(key_state[SDL_SCANCODE_RIGHT])
-            self.warrior.keys['up'] = bool(key_state[SDL_SCANCODE_UP])
-            self.warrior.keys['down'] = bool(key_state[SDL_SCANCODE_DOWN])
-
-            if not any(self.warrior.keys.values()):
-                self.warrior.state_machine.cur_state = self.warrior.IDLE
-                self.warrior.IDLE.enter(('STOP', 0))
-            else:
-                self.warrior.state_machine.cur_state = self.warrior.RUN
-                self.warrior.RUN.enter(('STOP', 0))
+            warrior.dirx = 0
+            warrior.diry = 0
 
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.warrior.x, self.warrior.y)
-        else:
-            screen_x, screen_y = self.warrior.x, self.warrior.y
+            # 키 눌림 상태 확인 (이벤트 펌프 기준 - 입력 재생 시에도 동일한 결과)
+            warrior.keys['left'] = event_pump.is_key_held(SDLK_LEFT)
+            warrior.keys['right'] = event_pump.is_key_held(SDLK_RIGHT)
+            warrior.keys['up'] = event_pump.is_key_held(SDLK_UP)
+            warrior.keys['down'] = event_pump.is_key_held(SDLK_DOWN)
 
-        if self.warrior.face_dir == 1:
-            self.warrior.imageA1.clip_draw(int(self.warrior.frame) * 192,0,192,192,screen_x,screen_y)
-        else:
-            self.warrior.imageA1.clip_composite_draw(int(self.warrior.frame) * 192,0,192,192,0,'h',screen_x,screen_y,192,192)
+            if not any(warrior.keys.values()):
+                warrior.state_machine.set_state(warrior.IDLE, ('STOP', 0))
+            else:
+                warrior.state_machine.set_state(warrior.RUN, ('STOP', 0))
+
+    def draw(self, warrior, camera=None):
+        self.clip.draw(warrior.imageA1, warrior, camera)
 #----------------------------------------------------------------
 class WAttack2:
-    def __init__(self, warrior):
-        self.warrior = warrior
-        self.animation_speed = 12  # 초당 프레임 수
-        self.attack_active_frames = [1, 2, 3]  # 공격 판정이 활성화되는 프레임 (콤보는 더 길게)
+    def __init__(self):
+        self.clip = ATTACK2_CLIP  # 'hit' 구간에서 공격 판정
 
-    def enter(self, e):
+    def enter(self, warrior, e):
         print("[DEBUG] Warrior ATTACK2 시작! (콤보 공격)")
-        self.warrior.frame = 0
-        self.warrior.can_combo = False
-        self.warrior.attack1_end_time = None
-        self.animation_finished = False
-        self.warrior.attack2_active = False  # 공격 판정 활성화 플래그
+        warrior.frame = 0
+        warrior.cancel_combo_window()
+        warrior.state_data.animation_finished = False
+        warrior.attack2_active = False  # 공격 판정 활성화 플래그
         # 콤보 연결 시에도 이동 속도 초기화
-        self.warrior.dirx = 0
-        self.warrior.diry = 0
+        warrior.dirx = 0
+        warrior.diry = 0
 
-    def exit(self, e):
+    def exit(self, warrior, e):
         pass
 
-    def do(self, delta_time):
-        # 이전 프레임의 정수 값 저장
-        prev_frame_int = int(self.warrior.frame)
-
-        # 프레임 업데이트
-        self.warrior.frame = (self.warrior.frame + self.animation_speed * delta_time) % 4
-
-        # 현재 프레임의 정수 값
-        curr_frame_int = int(self.warrior.frame)
+    def do(self, warrior, delta_time):
+        # 프레임 업데이트 (ONCE 클립 - 마지막 프레임에서 멈춤)
+        warrior.frame = self.clip.advance(warrior.frame, delta_time)
 
         # 공격 판정 프레임 체크
-        if curr_frame_int in self.attack_active_frames:
-            if not self.warrior.attack2_active:
-                self.warrior.attack2_active = True
-                print(f"[DEBUG] Warrior ATTACK2 판정 활성화! (프레임: {curr_frame_int})")
+        if self.clip.in_event('hit', warrior.frame):
+            if not warrior.attack2_active:
+                warrior.attack2_active = True
+                print(f"[DEBUG] Warrior ATTACK2 판정 활성화! (프레임: {int(warrior.frame)})")
         else:
-            self.warrior.attack2_active = False
+            warrior.attack2_active = False
 
-        # 프레임이 한 바퀴 돌았는지 확인 (3 -> 0으로 wrap around)
-        if not self.animation_finished and (prev_frame_int > curr_frame_int or (prev_frame_int == 3 and curr_frame_int == 0)):
-            self.animation_finished = True
-            self.warrior.attack2_active = False
+        # 애니메이션을 끝까지 재생했는지 확인
+        if not warrior.state_data.animation_finished and self.clip.is_finished(warrior.frame):
+            warrior.state_data.animation_finished = True
+            warrior.attack2_active = False
             print(f"[DEBUG] Warrior ATTACK2 완료")
 
             # 공격 종료 시 이동 속도 초기화
-            self.warrior.dirx = 0
-            self.warrior.diry = 0
-
-            # 키 눌림 상태 확인 (SDL 이벤트로 확인)
-            from sdl2 import SDL_GetKeyboardState, SDL_SCANCODE_LEFT, SDL_SCANCODE_RIGHT, SDL_SCANCODE_UP, SDL_SCANCODE_DOWN
-            key_state = SDL_GetKeyboardState(None)
-            self.warrior.keys['left'] = bool(key_state[SDL_SCANCODE_LEFT])
-            self.warrior.keys['right'] = bool(key_state[SDL_SCANCODE_RIGHT])
-            self.warrior.keys['up'] = bool(key_state[SDL_SCANCODE_UP])
-            self.warrior.keys['down'] = bool(key_state[SDL_SCANCODE_DOWN])
-
-            if not any(self.warrior.keys.values()):
-                self.warrior.state_machine.cur_state = self.warrior.IDLE
-                self.warrior.IDLE.enter(('STOP', 0))
+            warrior.dirx = 0
+            warrior.diry = 0
+
+            # 키 눌림 상태 확인 (이벤트 펌프 기준 - 입력 재생 시에도 동일한 결과)
+            warrior.keys['left'] = event_pump.is_key_held(SDLK_LEFT)
+            warrior.keys['right'] = event_pump.is_key_held(SDLK_RIGHT)
+            warrior.keys['up'] = event_pump.is_key_held(SDLK_UP)
+            warrior.keys['down'] = event_pump.is_key_held(SDLK_DOWN)
+
+            if not any(warrior.keys.values()):
+                warrior.state_machine.set_state(warrior.IDLE, ('STOP', 0))
             else:
-                self.warrior.state_machine.cur_state = self.warrior.RUN
-                self.warrior.RUN.enter(('STOP', 0))
+                warrior.state_machine.set_state(warrior.RUN, ('STOP', 0))
 
-    def draw(self, camera=None):
-        if camera:
-            screen_x, screen_y = camera.apply(self.warrior.x, self.warrior.y)
-        else:
-            screen_x, screen_y = self.warrior.x, self.warrior.y
+    def draw(self, warrior, camera=None):
+        self.clip.draw(warrior.imageA2, warrior, camera)
 
-        if self.warrior.face_dir == 1:
-            self.warrior.imageA2.clip_draw(int(self.warrior.frame) * 192,0,192,192,screen_x,screen_y)
-        else:
-            self.warrior.imageA2.clip_composite_draw(int(self.warrior.frame) * 192,0,192,192,0,'h',screen_x,screen_y,192,192)
+#----------------------------------------------------------------
+class WarriorStateData:
+    """Warrior 인스턴스별 상태 변수 (상태 객체는 공유하므로 값은 여기에 저장)"""
+    __slots__ = ('animation_finished',)
+
+    def __init__(self):
+        self.animation_finished = False
 
 #----------------------------------------------------------------
-class Warrior:
+class Warrior(Entity):
+    # 공통 속성은 Entity, 여기에는 Warrior 전용 속성만 선언
+    __slots__ = ('keys', 'combo_timer', 'can_combo', 'attack2_power', 'attack1_active', 'attack2_active',
+                 'imageI', 'imageR', 'imageA1', 'imageA2')
+
+    # 스프라이트 시트 (모든 인스턴스가 resource_manager 캐시의 같은 텍스처를 공유)
+    IMAGE_FILES = {
+        'imageI': 'resource/Warrior_Idle.png',
+        'imageR': 'resource/Warrior_Run.png',
+        'imageA1': 'resource/Warrior_Attack1.png',
+        'imageA2': 'resource/Warrior_Attack2.png',
+    }
+
+    # 상태 객체 (상태 없는 싱글톤 - 모든 Warrior가 공유)
+    IDLE = WIdle()
+    RUN = WRun()
+    ATTACK1 = WAttack1()
+    ATTACK2 = WAttack2()
+
+    # 상태 전이 규칙 (타입당 하나, StateMachine이 한 번만 컴파일)
+    # a_down_combo는 상태 머신 주인(Warrior)의 can_combo를 guard로 검사
+    RULES = {
+        IDLE:{right_down:RUN, left_down:RUN, up_down:RUN, down_down:RUN,
+              a_down_combo:ATTACK2, a_down:ATTACK1},
+        RUN:{right_up:RUN, left_up:RUN, right_down:RUN, left_down:RUN,
+             up_up:RUN, down_up:RUN, up_down:RUN, down_down:RUN,
+             a_down_combo:ATTACK2, a_down:ATTACK1},
+        ATTACK1:{a_down_combo:ATTACK2},
+        ATTACK2:{}
+    }
+
     def __init__(self):
-        self.x, self.y = 300,300
-        self.frame = 0
-        self.dirx = 0
-        self.diry = 0
-        self.face_dir = -1
+        # 위치/방향/체력 (전역 설정에서 가져옴)
+        super().__init__(300, 300, MAX_HP, face_dir=-1)
         self.keys = {'left': False, 'right': False, 'up': False, 'down': False}
-        self.attack1_end_time = None
+        self.combo_timer = None  # 콤보 입력 시간 종료 타이머 (timer_wheel)
         self.can_combo = False
 
-        # 체력 (전역 설정에서 가져옴)
-        self.hp = MAX_HP
-        self.max_hp = MAX_HP
-
         # 공격력 (전역 설정에서 가져옴)
         self.attack_power = ATTACK1_POWER  # 기본 공격력
         self.attack2_power = ATTACK2_POWER  # 콤보 공격력 (더 강함)
+        self.attack1_active = False  # 공격 판정 활성화 플래그 (ATTACK1/ATTACK2 상태가 설정)
+        self.attack2_active = False
 
-        # 생존 상태
-        self.is_alive = True
-
-        self.imageI = load_image('resource/Warrior_Idle.png')
-        self.imageR = load_image('resource/Warrior_Run.png')
-        self.imageA1 = load_image('resource/Warrior_Attack1.png')
-        self.imageA2 = load_image('resource/Warrior_Attack2.png')
-
-        self.IDLE = WIdle(self)
-        self.RUN = WRun(self)
-        self.ATTACK1 = WAttack1(self)
-        self.ATTACK2 = WAttack2(self)
-        self.state_machine = StateMachine(
-            self.IDLE,
-            {
-                self.IDLE:{right_down:self.RUN, left_down:self.RUN, up_down:self.RUN, down_down:self.RUN,
-                          a_down_combo(self):self.ATTACK2, a_down:self.ATTACK1},
-                self.RUN:{right_up:self.RUN, left_up:self.RUN, right_down:self.RUN, left_down:self.RUN,
-                          up_up:self.RUN, down_up:self.RUN, up_down:self.RUN, down_down:self.RUN,
-                          a_down_combo(self):self.ATTACK2, a_down:self.ATTACK1},
-                self.ATTACK1:{a_down_combo(self):self.ATTACK2},
-                self.ATTACK2:{}
-            })
+        self.load_images()  # IMAGE_FILES (캐시에서 공유)
+
+        self.state_data = WarriorStateData()
+        self.state_machine = StateMachine(self.IDLE, self.RULES, owner=self)
+
+    def start_combo_window(self):
+        """ATTACK1 완료 - COMBO_WINDOW초 동안 콤보 입력 허용"""
+        self.can_combo = True
+        timer_wheel.cancel(self.combo_timer)
+        self.combo_timer = timer_wheel.schedule(COMBO_WINDOW, self.end_combo_window)
+
+    def cancel_combo_window(self):
+        self.can_combo = False
+        timer_wheel.cancel(self.combo_timer)
+        self.combo_timer = None
+
+    def end_combo_window(self):
+        self.can_combo = False
+        self.combo_timer = None
+        print("콤보 타임 종료")
 
     def update(self, delta_time):
         self.state_machine.update(delta_time)
@@ -360,11 +323,11 @@ class Warrior:
         """공격 충돌 박스 반환 (공격 판정 프레임일 때만)"""
         # ATTACK1 상태이고 판정이 활성화된 경우
         if self.state_machine.cur_state == self.ATTACK1:
-            if not hasattr(self, 'attack1_active') or not self.attack1_active:
+            if not self.attack1_active:
                 return None
         # ATTACK2 상태이고 판정이 활성화된 경우
         elif self.state_machine.cur_state == self.ATTACK2:
-            if not hasattr(self, 'attack2_active') or not self.attack2_active:
+            if not self.attack2_active:
                 return None
         # 공격 상태가 아니면 None 반환
         else: